@@ -133,8 +133,8 @@ See this repository for a collection of
 
 """
 
-from pydna._pretty import PrettyTable
-from Bio.Restriction import FormattedSeq
+import importlib
+import importlib.util
 import os
 
 __author__ = "Björn Johansson"
@@ -189,6 +189,8 @@ def get_env():
 
     Pydna related variables have names that starts with `pydna_`
     """
+    from pydna._pretty import PrettyTable
+
     _table = PrettyTable(["Variable", "Value"])
     # _table.set_style(_prettytable.DEFAULT)
     _table.align["Variable"] = "l"  # Left align
@@ -216,6 +218,7 @@ def logo():
 
 
 ## Override Bio.Restriction.FormattedSeq._table
+## The table is set by pydna.types, the first pydna module that imports Bio.Restriction.
 
 
 def _make_FormattedSeq_table() -> bytes:
@@ -227,4 +230,19 @@ def _make_FormattedSeq_table() -> bytes:
     return bytes(table)
 
 
-FormattedSeq._table = _make_FormattedSeq_table()
+def __getattr__(name):
+    """Import submodules on first attribute access (PEP 562).
+
+    >>> import pydna
+    >>> pydna.readers.__name__
+    'pydna.readers'
+    """
+    if not name.startswith("__") and importlib.util.find_spec(f"{__name__}.{name}"):
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    import pkgutil
+
+    return sorted(set(globals()) | {m.name for m in pkgutil.iter_modules(__path__)})
@@ -22,6 +22,20 @@ Dseqrecord(-3)
 >>>
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydna.amplify import Anneal, pcr
+    from pydna.assembly import Assembly
+    from pydna.genbank import genbank, Genbank
+    from pydna.dseqrecord import Dseqrecord
+    from pydna.dseq import Dseq
+    from pydna.readers import read, read_primer
+    from pydna.parsers import parse, parse_primers
+    from pydna.design import primer_design, assembly_fragments
+    from pydna.utils import eq
+    from pydna.genbankfixer import gbtext_clean
 
 __all__ = [
     "Anneal",
@@ -42,18 +56,33 @@ __all__ = [
 ]
 
 
-from pydna.amplify import Anneal
-from pydna.amplify import pcr
-from pydna.assembly import Assembly
-from pydna.genbank import genbank
-from pydna.genbank import Genbank
-from pydna.dseqrecord import Dseqrecord
-from pydna.dseq import Dseq
-from pydna.readers import read
-from pydna.readers import read_primer
-from pydna.parsers import parse
-from pydna.parsers import parse_primers
-from pydna.design import primer_design
-from pydna.design import assembly_fragments
-from pydna.utils import eq
-from pydna.genbankfixer import gbtext_clean
+# Names in __all__ and the modules they are imported from on first access (PEP 562).
+_modules = {
+    "Anneal": "pydna.amplify",
+    "pcr": "pydna.amplify",
+    "Assembly": "pydna.assembly",
+    "genbank": "pydna.genbank",
+    "Genbank": "pydna.genbank",
+    "Dseqrecord": "pydna.dseqrecord",
+    "Dseq": "pydna.dseq",
+    "read": "pydna.readers",
+    "read_primer": "pydna.readers",
+    "parse": "pydna.parsers",
+    "parse_primers": "pydna.parsers",
+    "primer_design": "pydna.design",
+    "assembly_fragments": "pydna.design",
+    "eq": "pydna.utils",
+    "gbtext_clean": "pydna.genbankfixer",
+}
+
+
+def __getattr__(name):
+    if name in _modules:
+        value = getattr(importlib.import_module(_modules[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
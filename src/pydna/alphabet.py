@@ -62,9 +62,12 @@ GATC UO RYMKSWHBVDN PEXIQFZJ$% 0123456789 !#{}&*()<>@:?[]=_; •
 import re
 from dataclasses import dataclass
 
+import numpy as np
+
 __all__ = [
     # Core alphabet dictionaries
     "basepair_dict",
+    "basepair_table",
     "annealing_dict",
     "annealing_dict_w_holes",
     "complement_dict_for_dscode",
@@ -88,6 +91,7 @@ __all__ = [
     # Public helper functions
     "get_parts",
     "dsbreaks",
+    "dscode_from_strands",
     "representation_tuple",
     "anneal_strands",
 ]
@@ -465,6 +469,17 @@ for (x, y), symbol in basepair_dict.items():
 # Add mixed case entries to the dict
 basepair_dict.update(mixed_case_dict)
 
+# ============================================================================
+# basepair_table is the basepair_dict as a 2-D lookup table, indexed by the
+# byte values of the watson and crick symbols. The value is the byte value
+# of the dscode symbol, or 0 if the symbols do not form a base pair.
+# ============================================================================
+
+basepair_table = np.zeros((256, 256), dtype=np.uint8)
+
+for (x, y), symbol in basepair_dict.items():
+    basepair_table[ord(x), ord(y)] = ord(symbol)
+
 mixed_case_dict = {}
 
 # This loop adds upper and lower case symbols
@@ -578,16 +593,22 @@ class DseqParts:
         return tuple(self)[index]
 
 
+_ss_watson_run = re.compile(f"[{re.escape(ss_letters_watson)}]*")
+_ss_crick_run = re.compile(f"[{re.escape(ss_letters_crick)}]*")
+_ss_letters = ss_letters_watson + ss_letters_crick
+_ds_letters_set = frozenset(ds_letters)
+
+
 def get_parts(datastring: str) -> DseqParts:
     """
     Returns a DseqParts instance containing the parts of a dsDNA sequence.
 
     The datastring argument should contain a string with dscode symbols.
 
-    A regular expression is used to capture the single stranded regions at
-    the ends as well as the ds region in the middle, if any.
+    The single stranded regions at the ends are captured as well as the ds
+    region in the middle, if any.
 
-    The figure below numbers the regex capture groups and what they capture
+    The figure below numbers the groups and what they capture
     as well as the DseqParts instance field name for each group.
 
     ::
@@ -665,22 +686,32 @@ def get_parts(datastring: str) -> DseqParts:
 
     """
 
-    m = re.match(
-        f"([{ss_letters_watson}]*)"  # capture group 0 ssDNA in watson strand
-        f"([{ss_letters_crick}]*)"  # "             1 ssDNA in crick strand
-        f"(?=[{ds_letters}])"  # positive lookahead for dsDNA, no capture
-        "(.*)"  # capture group 2 everything in the middle
-        f"(?<=[{ds_letters}])"  # positive look behind for dsDNA, no capture
-        f"([{ss_letters_watson}]*)"  # capture group 3 ssDNA in watson strand
-        f"([{ss_letters_crick}]*)|"  # "             4 ssDNA in crick strand
-        f"([{ss_letters_watson}]+)|"  # "             5 if data contains only upper strand
-        f"([{ss_letters_crick}]+)",  # "             6 if data contains only lower strand
-        datastring,
-    )
-
-    result = m.groups() if m else (None, None, None, None, None, None, None)
-
-    result = ["" if e is None else e for e in result]
+    # Only the single stranded runs at the ends are scanned, the middle part
+    # is everything between the first and the last dsDNA symbol.
+    left5_end = _ss_watson_run.match(datastring).end()
+    left3_end = _ss_crick_run.match(datastring, left5_end).end()
+
+    result = [""] * 7
+
+    if left3_end < len(datastring) and datastring[left3_end] in _ds_letters_set:
+        result[0] = datastring[:left5_end]
+        result[1] = datastring[left5_end:left3_end]
+        # Position after the last dsDNA symbol, the ss symbols are skipped in C
+        # and any other symbols one by one.
+        middle_end = len(datastring.rstrip(_ss_letters))
+        while datastring[middle_end - 1] not in _ds_letters_set:
+            middle_end = len(datastring[: middle_end - 1].rstrip(_ss_letters))
+        result[2] = datastring[left3_end:middle_end]
+        right3_end = _ss_watson_run.match(datastring, middle_end).end()
+        right5_end = _ss_crick_run.match(datastring, right3_end).end()
+        result[3] = datastring[middle_end:right3_end]
+        result[4] = datastring[right3_end:right5_end]
+    elif left5_end:
+        # only an upper strand
+        result[5] = datastring[:left5_end]
+    elif left3_end:
+        # only a lower strand
+        result[6] = datastring[:left3_end]
 
     return DseqParts(
         sticky_left5=result[0],
@@ -693,6 +724,60 @@ def get_parts(datastring: str) -> DseqParts:
     )
 
 
+def dscode_from_strands(sense: str, antisense: str) -> str:
+    """
+    dscode for two aligned strands of equal length.
+
+    The sense strand is read 5'-3' and the antisense strand 3'-5', so that
+    the symbols at the same position form a base pair. Empty positions are
+    given as spaces. All positions are converted at once using basepair_table.
+
+    >>> from pydna.alphabet import dscode_from_strands
+    >>> dscode_from_strands("GATC  ", "  AGTA")
+    'PETCFZ'
+    >>> dscode_from_strands("GATC", "CTCG")
+    Traceback (most recent call last):
+    ...
+    ValueError: Base mismatch in representation: ('T', 'C') at position 2
+
+    Parameters
+    ----------
+    sense : str
+        Watson strand, 5'-3'.
+    antisense : str
+        Crick strand, 3'-5'.
+
+    Returns
+    -------
+    str
+        A string in dscode format.
+
+    Raises
+    ------
+    ValueError
+        If the strands have different length or if some symbols
+        do not form a base pair.
+    """
+    if len(sense) != len(antisense):
+        raise ValueError("Strands must have the same length.")
+
+    # Characters that are not ASCII become "?", which never forms a base pair.
+    watson = np.frombuffer(sense.encode("ascii", errors="replace"), dtype=np.uint8)
+    crick = np.frombuffer(antisense.encode("ascii", errors="replace"), dtype=np.uint8)
+    data = basepair_table[watson, crick]
+
+    mismatches = np.flatnonzero(data == 0)
+    if len(mismatches):
+        msg = ", ".join(
+            f"{(sense[i], antisense[i])} at position {i}" for i in mismatches[:10]
+        )
+        if len(mismatches) > 10:
+            msg += f" and {len(mismatches) - 10} more"
+        raise ValueError(f"Base mismatch in representation: {msg}")
+
+    return data.tobytes().decode("ascii")
+
+
 def dsbreaks(datastring: str) -> list[str]:
     """
     Find double strand breaks in DNA in dscode format.
@@ -726,9 +811,16 @@ def dsbreaks(datastring: str) -> list[str]:
     cl = re.escape(three_prime_ss_letters)
 
     breaks = []
+    adjacent = f"[{wl}][{cl}]|[{cl}][{wl}]"  # adjacent single strand chars.
+
+    # Searching without the context first is much faster for long sequences,
+    # that usually have no breaks.
+    if not re.search(adjacent, datastring):
+        return breaks
+
     regex = (
         "(.{0,3})"  # return context if present.
-        f"([{wl}][{cl}]|[{cl}][{wl}])"  # find adjacent single strand chars.
+        f"({adjacent})"
         "(.{0,3})"  # return context if present.
     )
     for mobj in re.finditer(regex, datastring):
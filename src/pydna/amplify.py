@@ -25,8 +25,8 @@ from Bio.SeqFeature import SimpleLocation
 from Bio.SeqFeature import CompoundLocation
 from pydna.seq import Seq
 import re
-import copy
 import operator
+from collections import defaultdict
 from pydna.alphabet import iupac_compl_regex
 from pydna.utils import anneal_from_left
 
@@ -102,6 +102,87 @@ def _annealing_positions(primer, template, limit):
     return results
 
 
+_anchor_complement = str.maketrans("ACGTU", "TGCAA")
+
+
+def _annealing_positions_multi(primers, template, limit):
+    """Same as :func:`_annealing_positions` for many primers at once.
+
+    The 3' anchors of all primers are searched for in a single pass over the
+    template using an Aho-Corasick automaton (requires pyahocorasick). Primers
+    containing ambiguous nucleotides are searched for one by one using
+    :func:`_annealing_positions`.
+
+    Parameters
+    ----------
+    primers : list of strings
+        The primer sequences 5'-3'
+
+    template : string
+        The template sequence 5'-3'
+
+    limit : int
+        footprint needs to be at least of length limit.
+
+    Returns
+    -------
+    describe : list of lists of tuples (int, int)
+        The result of :func:`_annealing_positions` for each primer.
+
+    Examples
+    --------
+    >>> from pydna.amplify import _annealing_positions_multi
+    >>> _annealing_positions_multi(["tacactcac", "gtgagtg", "cacnnnac"], "gtgagtgtacac", 5)
+    [[(0, 9)], [], [(0, 5)]]
+    """
+    import ahocorasick
+
+    results = [[] for _ in primers]
+    if limit < 1:
+        return [_annealing_positions(primer, template, limit) for primer in primers]
+
+    # The anchor is the part of the template that is complementary to the
+    # limit bases in the 3' end of the primer (see _annealing_positions).
+    anchors = defaultdict(list)
+    for i, primer in enumerate(primers):
+        if len(primer) < limit:
+            continue
+        head = primer[::-1][:limit].upper()
+        if set(head) <= set("ACGTU"):
+            anchors[head.translate(_anchor_complement)].append(i)
+        else:
+            results[i] = _annealing_positions(primer, template, limit)
+
+    if not anchors:
+        return results
+
+    automaton = ahocorasick.Automaton()
+    for anchor, indices in anchors.items():
+        automaton.add_word(anchor, tuple(indices))
+    automaton.make_automaton()
+
+    template = template.upper()
+    starts = defaultdict(list)
+    # U in the template only anneals to A, like T
+    for end_index, indices in automaton.iter(template.replace("U", "T")):
+        for i in indices:
+            starts[i].append(end_index - limit + 1)
+
+    for i, primer_starts in starts.items():
+        primer = primers[i]
+        tail = primer[::-1][limit:].upper()
+        # Like re.finditer in _annealing_positions, matches (anchor + region
+        # under the tail) do not overlap
+        last_end = 0
+        for start in primer_starts:
+            if start < last_end:
+                continue
+            last_end = min(start + len(primer), len(template))
+            under_tail = template[start + limit : last_end]
+            results[i].append((start, limit + anneal_from_left(tail, under_tail[::-1])))
+    return results
+
+
 # class _Memoize(type):
 #     @_memorize("pydna.amplify.Anneal")
 #     def __call__(cls, *args, **kwargs):
@@ -124,7 +205,7 @@ class Anneal(object):  # ), metaclass=_Memoize):
     limit : int, optional
         The limit of PCR primer annealing, default is 13 bp."""
 
-    def __init__(self, primers, template, limit=13, **kwargs):
+    def __init__(self, primers, template, limit=13, multi_pattern=False, **kwargs):
         r"""The Anneal class has to be initiated with at least an iterable of
         primers and a template.
 
@@ -141,6 +222,12 @@ class Anneal(object):  # ), metaclass=_Memoize):
         limit : int, optional
             limit length of the annealing part of the primers.
 
+        multi_pattern : bool, optional
+            Search for all primers at once, in a single pass over each strand
+            of the template. This is faster for large numbers of primers, and
+            requires the pyahocorasick package (pydna[primer_screen]).
+            The result is the same.
+
         Attributes
         ----------
         products: list
@@ -201,7 +288,7 @@ class Anneal(object):  # ), metaclass=_Memoize):
 
         """
         self.primers = primers
-        self.template = copy.deepcopy(template)
+        self.template = template.detach()
 
         self.limit = limit
         self.kwargs = kwargs
@@ -221,7 +308,20 @@ class Anneal(object):  # ), metaclass=_Memoize):
             tw = self.template.seq.watson
             tc = self.template.seq.crick
 
-        for p in self.primers:
+        primers = list(self.primers)
+        primer_seqs = [str(p.seq) for p in primers]
+        if multi_pattern:
+            fwd_positions = _annealing_positions_multi(primer_seqs, tc, self.limit)
+            rev_positions = _annealing_positions_multi(primer_seqs, tw, self.limit)
+        else:
+            fwd_positions = (
+                _annealing_positions(s, tc, self.limit) for s in primer_seqs
+            )
+            rev_positions = (
+                _annealing_positions(s, tw, self.limit) for s in primer_seqs
+            )
+
+        for p, fwd, rev in zip(primers, fwd_positions, rev_positions):
             self.forward_primers.extend(
                 (
                     Primer(
@@ -230,7 +330,7 @@ class Anneal(object):  # ), metaclass=_Memoize):
                         position=tcl - pos - min(self.template.seq.ovhg, 0),
                         footprint=fp,
                     )
-                    for pos, fp in _annealing_positions(str(p.seq), tc, self.limit)
+                    for pos, fp in fwd
                     if pos < tcl
                 )
             )
@@ -242,7 +342,7 @@ class Anneal(object):  # ), metaclass=_Memoize):
                         position=pos + max(0, self.template.seq.ovhg),
                         footprint=fp,
                     )
-                    for pos, fp in _annealing_positions(str(p.seq), tw, self.limit)
+                    for pos, fp in rev
                     if pos < twl
                 )
             )
@@ -46,6 +46,7 @@ from Bio.SeqFeature import ExactPosition
 from Bio.SeqFeature import SimpleLocation
 from Bio.SeqFeature import CompoundLocation
 from pydna.utils import rc
+from pydna.utils import copy_feature
 
 from pydna._pretty import pretty_str as ps
 from pydna.contig import Contig
@@ -54,7 +55,6 @@ from pydna.common_sub_strings import common_sub_strings, Match
 from pydna.dseqrecord import Dseqrecord
 import networkx as nx
 
-from copy import deepcopy
 from typing import Callable, Dict, List, NamedTuple, TypedDict
 import itertools
 
@@ -376,7 +376,7 @@ class Assembly(object):
                 edgefeatures = []
                 offset = 0
                 for u, v, e in edges:
-                    feats = deepcopy(e["features"])
+                    feats = [copy_feature(f) for f in e["features"]]
                     for f in feats:
                         f.location += offset - e["piece"].start
                     edgefeatures.extend(feats)
@@ -446,7 +446,7 @@ class Assembly(object):
                 offset = 0
 
                 for u, v, e in edges:
-                    feats = deepcopy(e["features"])
+                    feats = [copy_feature(f) for f in e["features"]]
                     for feat in feats:
                         feat.location += offset
                     edgefeatures.extend(feats)
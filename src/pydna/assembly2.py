@@ -13,8 +13,11 @@ import itertools
 from Bio.SeqFeature import SimpleLocation, Location
 
 from Bio.Restriction.Restriction import RestrictionBatch
-import regex
-import copy
+import contextlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from operator import itemgetter
 
 from pydna.utils import (
     shift_location,
@@ -30,6 +33,8 @@ from pydna.utils import (
 )
 from pydna._pretty import pretty_str as ps
 from pydna.common_sub_strings import common_sub_strings as common_sub_strings_str
+from pydna.common_sub_strings import all_pairs_common_sub_strings
+from pydna.kmer_index import hamming_search
 from pydna.dseqrecord import Dseqrecord
 from pydna.dseq import Dseq
 from pydna.primer import Primer
@@ -48,7 +53,7 @@ from pydna.cre_lox import cre_loxP_overlap
 from pydna.alphabet import anneal_strands
 from pydna.recombinase import Recombinase, RecombinaseCollection
 
-from typing import TYPE_CHECKING, Callable, Literal
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Literal
 from pydna.opencloning_models import (
     AssemblySource,
     RestrictionAndLigationSource,
@@ -65,13 +70,121 @@ from pydna.opencloning_models import (
     SourceInput,
     CRISPRSource,
 )
-from pydna.crispr import cas9
+from pydna.crispr import PamIndex, cas9
 import warnings
 
 if TYPE_CHECKING:  # pragma: no cover
     from Bio.Restriction import AbstractCut
 
 
+class FragmentCache:
+    """
+    Values derived from an assembly fragment that are needed many times when building the
+    assembly graph and assembling the products. Each value is computed the first time it is
+    accessed.
+
+    The cache assumes that the fragment is not modified while it is in use. Use
+    :func:`fragment_cache` to get the cache of a fragment, and :func:`fragment_cache_scope`
+    to share caches between the functions of this module.
+
+    >>> from pydna.dseqrecord import Dseqrecord
+    >>> from pydna.assembly2 import FragmentCache
+    >>> cache = FragmentCache(Dseqrecord("acgU", circular=True))
+    >>> cache.uppercase
+    'ACGU'
+    >>> cache.doubled_uppercase_dna
+    'ACGTACGT'
+    >>> cache.reverse_complement.seq
+    Dseq(o4)
+    Acgt
+    Ugca
+    """
+
+    def __init__(self, fragment: Dseqrecord | Primer):
+        self.fragment = fragment
+        # To detect if the sequence was replaced, see fragment_cache
+        self.seq = fragment.seq
+        # TemplateIndex of the sequence if it has one, see Dseq.build_index
+        self.template_index = getattr(self.seq, "template_index", None)
+        # KmerIndex of doubled_uppercase_dna for each k, see pydna.kmer_index.hamming_search.
+        # They are shared with the TemplateIndex, so that they are kept with the sequence.
+        if self.template_index is not None:
+            self.kmer_indices = self.template_index.kmer_indices
+        else:
+            self.kmer_indices = dict()
+
+    @property
+    def circular(self) -> bool:
+        return isinstance(self.fragment, Dseqrecord) and self.fragment.circular
+
+    @functools.cached_property
+    def reverse_complement(self) -> Dseqrecord | Primer:
+        """Reverse complement of the fragment (features included)."""
+        return self.fragment.reverse_complement()
+
+    @functools.cached_property
+    def uppercase(self) -> str:
+        """Sequence as an uppercase string."""
+        return str(self.seq).upper()
+
+    @functools.cached_property
+    def uppercase_dna(self) -> str:
+        """Uppercase string where U is replaced by T (for primers with U's, e.g. for USER cloning)."""
+        return self.uppercase.replace("U", "T")
+
+    @functools.cached_property
+    def doubled_uppercase(self) -> str:
+        """Same as uppercase, but circular sequences are repeated twice."""
+        return self.uppercase * 2 if self.circular else self.uppercase
+
+    @functools.cached_property
+    def doubled_uppercase_dna(self) -> str:
+        """Same as uppercase_dna, but circular sequences are repeated twice."""
+        if self.template_index is not None:
+            return self.template_index.text
+        return self.uppercase_dna * 2 if self.circular else self.uppercase_dna
+
+
+# Caches shared by the functions of this module, see fragment_cache_scope
+_fragment_caches: ContextVar[dict[int, FragmentCache] | None] = ContextVar(
+    "_fragment_caches", default=None
+)
+
+
+def fragment_cache(seqr: Dseqrecord | Primer) -> FragmentCache:
+    """Return the FragmentCache of ``seqr`` in the current fragment_cache_scope, or a new one
+    if there is none (the new one is not stored)."""
+    cache = (_fragment_caches.get() or dict()).get(id(seqr))
+    if cache is None or cache.fragment is not seqr or cache.seq is not seqr.seq:
+        return FragmentCache(seqr)
+    return cache
+
+
+@contextlib.contextmanager
+def fragment_cache_scope(caches: Iterable[FragmentCache]):
+    """Context manager in which :func:`fragment_cache` returns the given caches for their fragments,
+    so that reverse complements and sequence strings are only computed once. Caches of outer scopes
+    remain available.
+
+    >>> from pydna.dseqrecord import Dseqrecord
+    >>> from pydna.assembly2 import FragmentCache, fragment_cache, fragment_cache_scope
+    >>> seqr = Dseqrecord("acgt")
+    >>> cache = FragmentCache(seqr)
+    >>> with fragment_cache_scope([cache]):
+    ...     fragment_cache(seqr) is cache
+    True
+    >>> fragment_cache(seqr) is cache
+    False
+    """
+    active = dict(_fragment_caches.get() or dict())
+    active.update((id(c.fragment), c) for c in caches)
+    token = _fragment_caches.set(active)
+    try:
+        yield
+    finally:
+        _fragment_caches.reset(token)
+
+
 def gather_overlapping_locations(
     locs: list[Location], fragment_length: int
 ) -> list[tuple[Location, ...]]:
@@ -299,20 +412,43 @@ def restriction_ligation_overlap(
     return matches
 
 
+def _named_partial(name: str, func: Callable, *args, **kwargs) -> Callable:
+    """
+    ``functools.partial`` with a ``__name__`` (used in ``Assembly.__repr__``). Unlike a closure,
+    it can be pickled if ``func`` and the arguments can, so it can be sent to worker processes
+    (see the ``workers`` argument of ``Assembly``).
+    """
+    out = functools.partial(func, *args, **kwargs)
+    out.__name__ = name
+    return out
+
+
+def _ignore_limit(
+    algorithm: Callable, seqx: Dseqrecord, seqy: Dseqrecord, _limit, **kwargs
+) -> list[SequenceOverlap]:
+    """Call an algorithm that does not take the limit argument with extra keyword arguments."""
+    return algorithm(seqx, seqy, **kwargs)
+
+
+def _combined_algorithms(
+    algorithms: tuple[AssemblyAlgorithmType, ...],
+    seqx: Dseqrecord,
+    seqy: Dseqrecord,
+    limit,
+) -> list[SequenceOverlap]:
+    matches = list()
+    for algorithm in algorithms:
+        matches += algorithm(seqx, seqy, limit)
+    return matches
+
+
 def combine_algorithms(*algorithms: AssemblyAlgorithmType) -> AssemblyAlgorithmType:
     """
     Combine assembly algorithms, if any of them returns a match, the match is returned.
 
     This can be used for example in a ligation where you want to allow both sticky and blunt end ligation.
     """
-
-    def combined(seqx, seqy, limit):
-        matches = list()
-        for algorithm in algorithms:
-            matches += algorithm(seqx, seqy, limit)
-        return matches
-
-    return combined
+    return _named_partial("combined", _combined_algorithms, algorithms)
 
 
 def blunt_overlap(
@@ -366,14 +502,22 @@ def common_sub_strings(
     >>> common_sub_strings(x, y, limit=5)
     [(1, 2, 6), (1, 3, 5), (2, 2, 5)]
     """
-    query_seqx = str(seqx.seq).upper()
-    query_seqy = str(seqy.seq).upper()
-    if seqx.circular:
-        query_seqx = query_seqx * 2
-    if seqy.circular:
-        query_seqy = query_seqy * 2
-    results = common_sub_strings_str(query_seqx, query_seqy, limit)
+    results = common_sub_strings_str(
+        _common_sub_strings_query(seqx), _common_sub_strings_query(seqy), limit
+    )
+    return _format_common_sub_strings(seqx, seqy, results)
+
+
+def _common_sub_strings_query(seqr: Dseqrecord) -> str:
+    """String searched by common_sub_strings, circular sequences are repeated twice."""
+    return fragment_cache(seqr).doubled_uppercase
 
+
+def _format_common_sub_strings(
+    seqx: Dseqrecord, seqy: Dseqrecord, results: list[SequenceOverlap]
+) -> list[SequenceOverlap]:
+    """Turn the matches between the strings returned by _common_sub_strings_query into
+    matches between seqx and seqy, handling matches that span the origin."""
     if not seqx.circular and not seqy.circular:
         return results
 
@@ -417,6 +561,70 @@ def common_sub_strings(
     return [r for r in results if r not in shifted_matches]
 
 
+class IndexedCommonSubStrings:
+    """
+    Drop-in replacement for the ``common_sub_strings`` assembly algorithm that indexes
+    all the sequences of an assembly at once.
+
+    ``common_sub_strings`` builds a suffix array for every pair of sequences it is
+    called with, so that in an ``Assembly`` of n fragments each fragment is indexed
+    2(n-1) times. When an instance of this class is passed as the ``algorithm`` of an
+    ``Assembly``, a single generalized suffix array is built for all fragments and their
+    reverse complements (see ``all_pairs_common_sub_strings``), and the pairwise calls
+    are answered from it. The results are the same as those of ``common_sub_strings``.
+
+    Calls for sequences that have not been indexed, or with a different limit, fall
+    back to ``common_sub_strings``.
+
+    >>> from pydna.dseqrecord import Dseqrecord
+    >>> from pydna.assembly2 import Assembly, IndexedCommonSubStrings
+    >>> x = Dseqrecord("TAAAAAAT")
+    >>> y = Dseqrecord("CCaAaAaACC")
+    >>> algorithm = IndexedCommonSubStrings()
+    >>> algorithm.index_sequences([x, y], limit=5)
+    >>> algorithm(x, y, limit=5)
+    [(1, 2, 6), (1, 3, 5), (2, 2, 5)]
+    >>> asm = Assembly([x, y], limit=5, algorithm=IndexedCommonSubStrings())
+    """
+
+    def __init__(self):
+        # Used in Assembly.__repr__
+        self.__name__ = type(self).__name__
+        self.limit = None
+        self._ids: dict[str, list[int]] = dict()
+        self._matches: dict[tuple[int, int], list[SequenceOverlap]] = dict()
+
+    def index_sequences(self, seqs: list[Dseqrecord], limit: int = 25) -> None:
+        """Index ``seqs`` replacing any previous index. Called by ``Assembly.__init__``
+        with the sequences of all the nodes of the graph."""
+        queries = [_common_sub_strings_query(s) for s in seqs]
+        self._ids = dict()
+        for i, query in enumerate(queries):
+            self._ids.setdefault(query, list()).append(i)
+        self._matches = all_pairs_common_sub_strings(queries, limit)
+        self.limit = limit
+
+    def __call__(
+        self, seqx: Dseqrecord, seqy: Dseqrecord, limit=25
+    ) -> list[SequenceOverlap]:
+        query_seqx = _common_sub_strings_query(seqx)
+        query_seqy = _common_sub_strings_query(seqy)
+        ids_x = self._ids.get(query_seqx, [])
+        ids_y = [i for i in self._ids.get(query_seqy, []) if i not in ids_x[:1]]
+        if limit != self.limit or not ids_x or not ids_y:
+            return common_sub_strings(seqx, seqy, limit)
+
+        i, j = ids_x[0], ids_y[0]
+        if i < j:
+            results = list(self._matches.get((i, j), []))
+        else:
+            results = [(x, y, length) for y, x, length in self._matches.get((j, i), [])]
+            # Same sorting as common_sub_strings_str
+            results.sort()
+            results.sort(key=itemgetter(2), reverse=True)
+        return _format_common_sub_strings(seqx, seqy, results)
+
+
 def _get_trim_end_info(
     end_info: tuple[str, str], trim_ends: str, is_five_prime: bool
 ) -> int | None:
@@ -631,8 +839,8 @@ def zip_match_leftwards(
 
     """
 
-    query_x = seqrecord2_uppercase_DNA_string(seqx)
-    query_y = seqrecord2_uppercase_DNA_string(seqy)
+    query_x = fragment_cache(seqx).doubled_uppercase_dna
+    query_y = fragment_cache(seqy).doubled_uppercase_dna
 
     # In circular sequences, the match may go beyond the left-most edge of the sequence if it spans
     # the origin:
@@ -670,8 +878,8 @@ def zip_match_rightwards(
 ) -> SequenceOverlap:
     """Same as zip_match_leftwards, but towards the right."""
 
-    query_x = seqrecord2_uppercase_DNA_string(seqx)
-    query_y = seqrecord2_uppercase_DNA_string(seqy)
+    query_x = fragment_cache(seqx).doubled_uppercase_dna
+    query_y = fragment_cache(seqy).doubled_uppercase_dna
 
     start_on_x, start_on_y, _ = match
     count = 0
@@ -687,10 +895,7 @@ def seqrecord2_uppercase_DNA_string(seqr: SeqRecord) -> str:
     Transform a Dseqrecord to a sequence string where U is replaced by T, everything is upper case and
     circular sequences are repeated twice. This is used for PCR, to support primers with U's (e.g. for USER cloning).
     """
-    out = str(seqr.seq).upper().replace("U", "T")
-    if isinstance(seqr, Dseqrecord) and seqr.circular:
-        return out * 2
-    return out
+    return fragment_cache(seqr).doubled_uppercase_dna
 
 
 def primer_template_overlap(
@@ -753,28 +958,20 @@ def primer_template_overlap(
     if len(primer) < limit:
         return []
 
-    subject = seqrecord2_uppercase_DNA_string(template)
-    query = (
-        seqrecord2_uppercase_DNA_string(primer[:limit])
-        if reverse_primer
-        else seqrecord2_uppercase_DNA_string(primer[-limit:])
-    )
+    template_cache = fragment_cache(template)
+    subject = template_cache.doubled_uppercase_dna
+    primer_string = fragment_cache(primer).uppercase_dna
+    query = primer_string[:limit] if reverse_primer else primer_string[-limit:]
 
-    re_matches = list(
-        regex.finditer(
-            "(" + query + "){s<=" + str(mismatches) + "}", subject, overlapped=True
-        )
-    )
-    re_matches += list(
-        regex.finditer(
-            "(?r)(" + query + "){s<=" + str(mismatches) + "}", subject, overlapped=True
-        )
+    # Positions where the query matches with at most `mismatches` substitutions
+    match_starts = hamming_search(
+        query, subject, mismatches, template_cache.kmer_indices
     )
 
     out = set()
-    for re_match in re_matches:
+    for start in match_starts:
 
-        start, end = re_match.span()
+        end = start + limit
 
         # For circular sequences the same match is returned twice unless it falls
         # on the origin, we eliminate duplicates here
@@ -873,8 +1070,16 @@ def assembly_has_mismatches(
 ) -> bool:
     """Check if an assembly has mismatches. This should never happen and if so it returns an error."""
     for u, v, loc_u, loc_v in assembly:
-        seq_u = fragments[u - 1] if u > 0 else fragments[-u - 1].reverse_complement()
-        seq_v = fragments[v - 1] if v > 0 else fragments[-v - 1].reverse_complement()
+        seq_u = (
+            fragments[u - 1]
+            if u > 0
+            else fragment_cache(fragments[-u - 1]).reverse_complement
+        )
+        seq_v = (
+            fragments[v - 1]
+            if v > 0
+            else fragment_cache(fragments[-v - 1]).reverse_complement
+        )
         # TODO: Check issue where extraction failed, and whether it would give problems here
         if (
             str(loc_u.extract(seq_u).seq).upper()
@@ -921,11 +1126,14 @@ def assemble(
         assembly, is_circular
     )
 
+    # Reverse complements are computed only once per fragment
+    caches = [fragment_cache(f) for f in fragments]
+
     # Sanity check
     for asm_edge in assembly:
         u, v, loc_u, loc_v = asm_edge
-        f_u = fragments[u - 1] if u > 0 else fragments[-u - 1].reverse_complement()
-        f_v = fragments[v - 1] if v > 0 else fragments[-v - 1].reverse_complement()
+        f_u = fragments[u - 1] if u > 0 else caches[-u - 1].reverse_complement
+        f_v = fragments[v - 1] if v > 0 else caches[-v - 1].reverse_complement
         seq_u = str(loc_u.extract(f_u).seq)
         seq_v = str(loc_v.extract(f_v).seq.reverse_complement())
         # Test if seq_u and seq_v anneal
@@ -933,12 +1141,18 @@ def assemble(
             raise ValueError("Mismatch in assembly")
 
     # We transform into Dseqrecords (for primers)
-    dseqr_fragments = [
-        f if isinstance(f, Dseqrecord) else Dseqrecord(f) for f in fragments
+    dseqr_caches = [
+        (
+            c
+            if isinstance(c.fragment, Dseqrecord)
+            else FragmentCache(Dseqrecord(c.fragment))
+        )
+        for c in caches
     ]
-    subfragments = get_assembly_subfragments(
-        dseqr_fragments, subfragment_representation
-    )
+    with fragment_cache_scope(dseqr_caches):
+        subfragments = get_assembly_subfragments(
+            [c.fragment for c in dseqr_caches], subfragment_representation
+        )
 
     # Length of the overlaps between consecutive assembly fragments
     fragment_overlaps = [len(e[-1]) for e in assembly]
@@ -973,7 +1187,7 @@ def annotate_primer_binding_sites(
     fwd, _, rvs = fragments
     start_rvs = len(input_dseqr) - len(rvs)
 
-    output_dseqr = copy.deepcopy(input_dseqr)
+    output_dseqr = input_dseqr.detach()
     output_dseqr.add_feature(
         x=0,
         y=len(fwd),
@@ -1084,7 +1298,7 @@ def get_assembly_subfragments(
         seq = (
             fragments[node - 1]
             if node > 0
-            else fragments[-node - 1].reverse_complement()
+            else fragment_cache(fragments[-node - 1]).reverse_complement
         )
         subfragments.append(extract_subfragment(seq, start_location, end_location))
     return subfragments
@@ -1165,6 +1379,61 @@ def circular_permutation_min_abs(lst: list) -> list:
     return lst[min_abs_index:] + lst[:min_abs_index]
 
 
+def _fragment_paths(G: nx.DiGraph, length: int) -> Iterator[list[int]]:
+    """Node paths from "begin" to "end" through length fragments, in the order of nx.all_simple_paths, leaving
+    out the paths that contain a fragment twice (e.g. [1, 2, -1]) as soon as the fragment is repeated.
+    """
+    path = ["begin"]
+    used = set()
+    stack = [iter(G["begin"])]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            node = path.pop()
+            if node != "begin":
+                used.discard(abs(node))
+        elif child == "end":
+            if len(path) == length + 1:
+                yield path[1:]
+        elif len(path) <= length and abs(child) not in used:
+            path.append(child)
+            used.add(abs(child))
+            stack.append(iter(G[child]))
+
+
+def _first_paths(paths: Iterable[list[int]], max_paths: int) -> Iterator[list[int]]:
+    """Yield the first max_paths node paths, with a warning if there are more (see iter_linear_assemblies)."""
+    paths = iter(paths)
+    yield from itertools.islice(paths, max_paths)
+    if next(paths, None) is not None:
+        warnings.warn(
+            f"Only the first {max_paths} node paths were used, increase max_paths to get more assemblies",
+            category=UserWarning,
+            stacklevel=2,
+        )
+
+
+# Set in each worker process by _init_overlap_worker, see Assembly._add_edges_from_pairs
+_overlap_worker_state: dict = dict()
+
+
+def _init_overlap_worker(
+    seqs: dict[int, Dseqrecord], algorithm: AssemblyAlgorithmType, limit
+) -> None:
+    """Initializer of the worker processes, so that the sequences are sent only once per worker."""
+    _overlap_worker_state.update(seqs=seqs, algorithm=algorithm, limit=limit)
+    _fragment_caches.set({id(s): FragmentCache(s) for s in seqs.values()})
+
+
+def _overlap_worker_task(pair: tuple[int, int]) -> list[SequenceOverlap]:
+    u, v = pair
+    seqs = _overlap_worker_state["seqs"]
+    return _overlap_worker_state["algorithm"](
+        seqs[u], seqs[v], _overlap_worker_state["limit"]
+    )
+
+
 class Assembly:
     """Assembly of a list of DNA fragments into linear or circular constructs.
     Accepts a list of Dseqrecords (source fragments) to
@@ -1220,12 +1489,17 @@ class Assembly:
     algorithm : function, optional
         The algorithm used to determine the shared sequences. It's a function that takes two Dseqrecord objects as inputs,
         and will get passed the third argument (limit), that may or may not be used. It must return a list of overlaps
-        (see common_sub_strings for an example).
+        (see common_sub_strings for an example). If the algorithm has an ``index_sequences`` method, it is called with
+        the sequences of all nodes and the limit before the pairwise comparisons (see IndexedCommonSubStrings).
     use_fragment_order : bool, optional
         It's set to True by default to reproduce legacy pydna behaviour: only assemblies that start with the first fragment and end with the last are considered.
         You should set it to False.
     use_all_fragments : bool, optional
         Constrain the assembly to use all fragments.
+    workers : int, optional
+        If larger than 1, the ``algorithm`` is run for the different pairs of fragments in a pool of
+        this many processes. Edges are added in the same order as when running serially, so the
+        resulting graph is identical. The ``algorithm`` and the fragments must be picklable.
 
 
     Examples
@@ -1261,6 +1535,9 @@ class Assembly:
 
     """
 
+    # Caches of the fragments and of the sequences of the nodes, see _fragment_cache_scope
+    _node_caches: list[FragmentCache] | None = None
+
     def __init__(
         self,
         frags: list[Dseqrecord],
@@ -1268,28 +1545,37 @@ class Assembly:
         algorithm: AssemblyAlgorithmType = common_sub_strings,
         use_fragment_order: bool = True,
         use_all_fragments: bool = False,
+        workers: int | None = None,
     ):
 
         # TODO: allow for the same fragment to be included more than once?
         self.G = nx.MultiDiGraph()
+        self.fragment_caches = [FragmentCache(f) for f in frags]
         # Add positive and negative nodes for forward and reverse fragments
         self.G.add_nodes_from((i + 1, {"seq": f}) for (i, f) in enumerate(frags))
         self.G.add_nodes_from(
-            (-(i + 1), {"seq": f.reverse_complement()}) for (i, f) in enumerate(frags)
+            (-(i + 1), {"seq": c.reverse_complement})
+            for (i, c) in enumerate(self.fragment_caches)
         )
 
+        # Algorithms that can index all sequences at once (e.g. IndexedCommonSubStrings)
+        if hasattr(algorithm, "index_sequences"):
+            with self._fragment_cache_scope():
+                algorithm.index_sequences(
+                    [self.G.nodes[n]["seq"] for n in self.G.nodes], limit
+                )
+
         # Iterate over all possible combinations of fragments
         fragment_pairs = itertools.combinations(
             filter(lambda x: x > 0, self.G.nodes), 2
         )
-        for i, j in fragment_pairs:
-            # All the relative orientations of the fragments in the pair
-            for u, v in itertools.product([i, -i], [j, -j]):
-                u_seq = self.G.nodes[u]["seq"]
-                v_seq = self.G.nodes[v]["seq"]
-                matches = algorithm(u_seq, v_seq, limit)
-                for match in matches:
-                    self.add_edges_from_match(match, u, v, u_seq, v_seq)
+        # All the relative orientations of the fragments in the pair
+        pairs = [
+            (u, v)
+            for i, j in fragment_pairs
+            for u, v in itertools.product([i, -i], [j, -j])
+        ]
+        self._add_edges_from_pairs(pairs, algorithm, limit, workers)
 
         self.fragments = frags
         self.limit = limit
@@ -1392,6 +1678,57 @@ class Assembly:
 
         return True
 
+    def _add_edges_from_pairs(
+        self,
+        pairs: list[tuple[int, int]],
+        algorithm: AssemblyAlgorithmType,
+        limit,
+        workers: int | None = None,
+    ):
+        """Run ``algorithm`` on the sequences of each (u, v) pair of nodes and add the edges from
+        the matches (see add_edges_from_match). If ``workers`` is larger than 1, the pairs are
+        distributed over a pool of processes, and the results are collected in the order of ``pairs``.
+        """
+        seqs = {node: self.G.nodes[node]["seq"] for node in self.G.nodes}
+        if workers is None or workers < 2 or len(pairs) < 2:
+            with self._fragment_cache_scope():
+                all_matches = [algorithm(seqs[u], seqs[v], limit) for u, v in pairs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_overlap_worker,
+                initargs=(seqs, algorithm, limit),
+            ) as executor:
+                all_matches = list(
+                    executor.map(
+                        _overlap_worker_task,
+                        pairs,
+                        chunksize=max(1, len(pairs) // (4 * workers)),
+                    )
+                )
+
+        for (u, v), matches in zip(pairs, all_matches):
+            for match in matches:
+                self.add_edges_from_match(match, u, v, seqs[u], seqs[v])
+
+    def _fragment_cache_scope(self):
+        """fragment_cache_scope with the caches of the fragments and of the sequences of the nodes."""
+        if self._node_caches is None:
+            caches = {id(c.fragment): c for c in self.fragment_caches}
+            for n in self.G.nodes:
+                seq = self.G.nodes[n]["seq"]
+                if id(seq) not in caches:
+                    caches[id(seq)] = FragmentCache(seq)
+            self._node_caches = list(caches.values())
+        return fragment_cache_scope(self._node_caches)
+
+    def _assemble(
+        self, assembly: EdgeRepresentationAssembly, is_insertion: bool = False
+    ) -> Dseqrecord:
+        """Same as assemble, reusing the reverse complements of the fragments."""
+        with fragment_cache_scope(self.fragment_caches):
+            return assemble(self.fragments, assembly, is_insertion=is_insertion)
+
     def add_edges_from_match(
         self,
         match: SequenceOverlap,
@@ -1447,14 +1784,8 @@ class Assembly:
         locu, locv = self.G.get_edge_data(u, v, key)["locations"]
         return u, v, locu, locv
 
-    def get_linear_assemblies(
-        self, only_adjacent_edges: bool = False, max_assemblies: int = 50
-    ) -> list[EdgeRepresentationAssembly]:
-        """Get linear assemblies, applying the constrains described in __init__, ensuring that paths represent
-        real assemblies (see assembly_is_valid). Subassemblies are removed (see remove_subassemblies).
-        """
-
-        # Copy the graph since we will add the begin and end mock nodes
+    def _graph_with_begin_end(self) -> nx.MultiDiGraph:
+        """Copy of the graph with the mock nodes ``begin`` and ``end``, used to find linear paths."""
         G = nx.MultiDiGraph(self.G)
         G.add_nodes_from(["begin", "end"])
 
@@ -1468,27 +1799,115 @@ class Assembly:
             for node in filter(lambda x: type(x) is int, G.nodes):
                 G.add_edge("begin", node)
                 G.add_edge(node, "end")
+        return G
+
+    def _sort_node_paths(
+        self,
+        paths: list[list[int]],
+        order: Literal["longest", "fewest_edges"] | None,
+    ) -> list[list[int]]:
+        """Sort node paths (or cycles) for the iter_*_assemblies methods. The sort is stable."""
+        if order is None:
+            return paths
+        if order == "longest":
+            return sorted(
+                paths,
+                key=lambda p: sum(len(self.fragments[abs(n) - 1]) for n in p),
+                reverse=True,
+            )
+        if order == "fewest_edges":
+            return sorted(paths, key=len)
+        raise ValueError(
+            f"order must be None, 'longest' or 'fewest_edges', not {order}"
+        )
+
+    def get_linear_assemblies(
+        self, only_adjacent_edges: bool = False, max_assemblies: int = 50
+    ) -> list[EdgeRepresentationAssembly]:
+        """Get linear assemblies, applying the constrains described in __init__, ensuring that paths represent
+        real assemblies (see assembly_is_valid). Subassemblies are removed (see remove_subassemblies).
 
-        unique_linear_paths = self.get_unique_linear_paths(G)
+        Raises a ValueError if there are more than ``max_assemblies`` possible assemblies before validation,
+        see iter_linear_assemblies to go through them lazily instead.
+        """
+
+        unique_linear_paths = self.get_unique_linear_paths(self._graph_with_begin_end())
         possible_assemblies = self.get_possible_assembly_number(unique_linear_paths)
         if possible_assemblies > max_assemblies:
             raise ValueError(
                 f"Too many assemblies ({possible_assemblies} pre-validation) to assemble"
             )
 
-        assemblies = sum(
-            map(lambda x: self.node_path2assembly_list(x, False), unique_linear_paths),
-            [],
+        return list(
+            self._iter_linear_assemblies_from_paths(
+                sorted(unique_linear_paths, key=len, reverse=True), only_adjacent_edges
+            )
         )
 
-        out = [
-            a
-            for a in assemblies
-            if self.assembly_is_valid(self.fragments, a, False, self.use_all_fragments)
-        ]
-        if only_adjacent_edges:
-            out = [a for a in out if self.assembly_uses_only_adjacent_edges(a, False)]
-        return remove_subassemblies(out)
+    def iter_linear_assemblies(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        """Generator version of get_linear_assemblies. Assemblies are built and validated one at a time,
+        so there is no ``max_assemblies`` limit, and you can stop after the first hits.
+
+        By default, the node paths through the graph are found as they are needed, and processed in the same
+        order as in get_linear_assemblies (most fragments first). At most ``max_paths`` node paths are used,
+        with a warning if there are more. ``order`` can be:
+
+        - ``"longest"``: paths whose fragments add up to more base pairs first. The first ``max_paths`` node
+          paths are found in advance to sort them.
+
+        Subassemblies can only be removed if they come after the assembly that contains them, so the
+        ``"fewest_edges"`` order of iter_circular_assemblies is not available here.
+        """
+        if order not in (None, "longest"):
+            raise ValueError(f"order must be None or 'longest', not {order}")
+        node_paths = _first_paths(self._iter_unique_linear_paths(), max_paths)
+        if order is not None:
+            node_paths = self._sort_node_paths(list(node_paths), order)
+        return self._iter_linear_assemblies_from_paths(node_paths, only_adjacent_edges)
+
+    def _iter_unique_linear_paths(self) -> Iterator[list[int]]:
+        """Generator version of get_unique_linear_paths, without a limit. The paths with the most fragments
+        come first, as in ``sorted(self.get_unique_linear_paths(...), key=len, reverse=True)``.
+        """
+        G = nx.DiGraph(self._graph_with_begin_end())
+        n = len(self.fragments)
+        seen = set()
+        # One search for each number of fragments
+        for length in [n] if self.use_all_fragments else range(n, 0, -1):
+            for path in _fragment_paths(G, length):
+                # Reverse complement duplicates, see get_unique_linear_paths
+                if tuple(-node for node in path[::-1]) in seen:
+                    continue
+                seen.add(tuple(path))
+                yield path
+
+    def _iter_linear_assemblies_from_paths(
+        self,
+        node_paths: Iterable[list[int]],
+        only_adjacent_edges: bool,
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        """Yield the valid assemblies from node paths. Subassemblies are removed as in remove_subassemblies,
+        which requires that node paths containing others come first."""
+        yielded = list()
+        for path in node_paths:
+            for a in self.iter_node_path_assemblies(path, False):
+                if not self.assembly_is_valid(
+                    self.fragments, a, False, self.use_all_fragments
+                ):
+                    continue
+                if only_adjacent_edges and not self.assembly_uses_only_adjacent_edges(
+                    a, False
+                ):
+                    continue
+                if any(is_sublist(a, y) for y in yielded):
+                    continue
+                yielded.append(a)
+                yield a
 
     def node_path2assembly_list(
         self, cycle: list[int], circular: bool
@@ -1499,16 +1918,20 @@ class Assembly:
         There may be multiple assemblies for a given node path, if there are several edges connecting two nodes,
         for example two overlaps between 1 and 2, and single overlap between 2 and 3 should return 3 assemblies.
         """
+        return list(self.iter_node_path_assemblies(cycle, circular))
+
+    def iter_node_path_assemblies(
+        self, cycle: list[int], circular: bool
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        """Generator version of node_path2assembly_list."""
         combine = list()
         pairing = (
             zip(cycle, cycle[1:] + cycle[:1]) if circular else zip(cycle, cycle[1:])
         )
         for u, v in pairing:
             combine.append([(u, v, key) for key in self.G[u][v]])
-        return [
-            tuple(map(self.format_assembly_edge, x))
-            for x in itertools.product(*combine)
-        ]
+        for x in itertools.product(*combine):
+            yield tuple(map(self.format_assembly_edge, x))
 
     def get_unique_linear_paths(
         self, G_with_begin_end: nx.MultiDiGraph, max_paths=10000
@@ -1581,38 +2004,94 @@ class Assembly:
                 f"Too many assemblies ({possible_assembly_number} pre-validation) to assemble"
             )
 
-    def get_circular_assemblies(
-        self, only_adjacent_edges: bool = False, max_assemblies: int = 50
-    ) -> list[EdgeRepresentationAssembly]:
-        """Get circular assemblies, applying the constrains described in __init__, ensuring that paths represent
-        real assemblies (see assembly_is_valid)."""
+    def _sorted_cycles(self, max_paths: int = 10000) -> list[list[int]]:
+        """Cycles of the graph that can represent circular assemblies (see get_circular_assemblies)."""
         # The constrain of circular sequence is that the first node is the fragment with the smallest index in its initial orientation,
         # this is ensured by the circular_permutation_min_abs function + the filter below
         sorted_cycles = map(
             circular_permutation_min_abs,
             limit_iterator(
                 nx.cycles.simple_cycles(self.G, length_bound=len(self.fragments)),
-                10000,
+                max_paths,
             ),
         )
         sorted_cycles = filter(lambda x: x[0] > 0, sorted_cycles)
         # cycles.simple_cycles returns lists [1,2,3] not assemblies, see self.cycle2circular_assemblies
 
-        sorted_cycles = self._filter_cycles(sorted_cycles)
-        self._validate_max_assemblies(sorted_cycles, max_assemblies)
+        return self._filter_cycles(sorted_cycles)
 
-        assemblies = sum(
-            map(lambda x: self.node_path2assembly_list(x, True), sorted_cycles), []
+    def get_circular_assemblies(
+        self, only_adjacent_edges: bool = False, max_assemblies: int = 50
+    ) -> list[EdgeRepresentationAssembly]:
+        """Get circular assemblies, applying the constrains described in __init__, ensuring that paths represent
+        real assemblies (see assembly_is_valid).
+
+        Raises a ValueError if there are more than ``max_assemblies`` possible assemblies before validation,
+        see iter_circular_assemblies to go through them lazily instead.
+        """
+        sorted_cycles = self._sorted_cycles()
+        self._validate_max_assemblies(sorted_cycles, max_assemblies)
+        return list(
+            self._iter_circular_assemblies_from_cycles(
+                sorted_cycles, only_adjacent_edges
+            )
         )
 
-        out = [
-            a
-            for a in assemblies
-            if self.assembly_is_valid(self.fragments, a, True, self.use_all_fragments)
-        ]
-        if only_adjacent_edges:
-            out = [a for a in out if self.assembly_uses_only_adjacent_edges(a, True)]
-        return out
+    def iter_circular_assemblies(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest", "fewest_edges"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        """Generator version of get_circular_assemblies. Assemblies are built and validated one at a time,
+        so there is no ``max_assemblies`` limit, and you can stop after the first hits.
+
+        By default, the cycles in the graph are found as they are needed, and processed in the same order as
+        in get_circular_assemblies. At most ``max_paths`` cycles are used, with a warning if there are more.
+        ``order`` can be:
+
+        - ``"longest"``: cycles whose fragments add up to more base pairs first.
+        - ``"fewest_edges"``: cycles with fewer fragments first.
+
+        With an ``order``, the first ``max_paths`` cycles are found in advance to sort them.
+        """
+        if order not in (None, "longest", "fewest_edges"):
+            raise ValueError(
+                f"order must be None, 'longest' or 'fewest_edges', not {order}"
+            )
+        cycles = _first_paths(self._iter_sorted_cycles(), max_paths)
+        if order is not None:
+            cycles = self._sort_node_paths(list(cycles), order)
+        return self._iter_circular_assemblies_from_cycles(cycles, only_adjacent_edges)
+
+    def _iter_sorted_cycles(self) -> Iterator[list[int]]:
+        """Generator version of _sorted_cycles, without a limit."""
+        for cycle in nx.cycles.simple_cycles(self.G, length_bound=len(self.fragments)):
+            cycle = circular_permutation_min_abs(cycle)
+            if cycle[0] < 0:
+                continue
+            if self.use_all_fragments and len(cycle) != len(self.fragments):
+                continue
+            if len(cycle) == len(set(map(abs, cycle))):
+                yield cycle
+
+    def _iter_circular_assemblies_from_cycles(
+        self,
+        cycles: Iterable[list[int]],
+        only_adjacent_edges: bool,
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        """Yield the valid assemblies from cycles."""
+        for cycle in cycles:
+            for a in self.iter_node_path_assemblies(cycle, True):
+                if not self.assembly_is_valid(
+                    self.fragments, a, True, self.use_all_fragments
+                ):
+                    continue
+                if only_adjacent_edges and not self.assembly_uses_only_adjacent_edges(
+                    a, True
+                ):
+                    continue
+                yield a
 
     def format_insertion_assembly(
         self, assembly: EdgeRepresentationAssembly
@@ -1822,19 +2301,39 @@ class Assembly:
     ) -> list[Dseqrecord]:
         """Assemble linear constructs, from assemblies returned by self.get_linear_assemblies."""
         assemblies = self.get_linear_assemblies(only_adjacent_edges, max_assemblies)
-        return [assemble(self.fragments, a) for a in assemblies]
+        return [self._assemble(a) for a in assemblies]
 
     def assemble_circular(
         self, only_adjacent_edges: bool = False, max_assemblies: int = 50
     ) -> list[Dseqrecord]:
         """Assemble circular constructs, from assemblies returned by self.get_circular_assemblies."""
         assemblies = self.get_circular_assemblies(only_adjacent_edges, max_assemblies)
-        return [assemble(self.fragments, a) for a in assemblies]
+        return [self._assemble(a) for a in assemblies]
+
+    def iter_assemble_linear(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[Dseqrecord]:
+        """Generator version of assemble_linear, see iter_linear_assemblies."""
+        for a in self.iter_linear_assemblies(only_adjacent_edges, order, max_paths):
+            yield self._assemble(a)
+
+    def iter_assemble_circular(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest", "fewest_edges"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[Dseqrecord]:
+        """Generator version of assemble_circular, see iter_circular_assemblies."""
+        for a in self.iter_circular_assemblies(only_adjacent_edges, order, max_paths):
+            yield self._assemble(a)
 
     def assemble_insertion(self, only_adjacent_edges: bool = False) -> list[Dseqrecord]:
         """Assemble insertion constructs, from assemblies returned by self.get_insertion_assemblies."""
         assemblies = self.get_insertion_assemblies(only_adjacent_edges)
-        return [assemble(self.fragments, a, is_insertion=True) for a in assemblies]
+        return [self._assemble(a, is_insertion=True) for a in assemblies]
 
     def get_locations_on_fragments(self) -> dict[int, dict[str, list[Location]]]:
         """Get a dictionary where the keys are the nodes in the graph, and the values are dictionaries with keys
@@ -1946,9 +2445,16 @@ class PCRAssembly(Assembly):
     An assembly that represents a PCR, where ``fragments`` is a list of primer, template, primer (in that order).
     It always uses the ``primer_template_overlap`` algorithm and accepts the ``mismatches`` argument to indicate
     the number of mismatches allowed in the overlap. Only supports substitution mismatches, not indels.
+    See ``Assembly`` for the ``workers`` argument.
     """
 
-    def __init__(self, frags: list[Dseqrecord | Primer], limit=25, mismatches=0):
+    def __init__(
+        self,
+        frags: list[Dseqrecord | Primer],
+        limit=25,
+        mismatches=0,
+        workers: int | None = None,
+    ):
 
         value_error = ValueError(
             "PCRAssembly assembly must be initialised with a list/tuple of primer, template, primer"
@@ -1967,10 +2473,12 @@ class PCRAssembly(Assembly):
 
         # TODO: allow for the same fragment to be included more than once?
         self.G = nx.MultiDiGraph()
+        self.fragment_caches = [FragmentCache(f) for f in frags]
         # Add positive and negative nodes for forward and reverse fragments
         self.G.add_nodes_from((i + 1, {"seq": f}) for (i, f) in enumerate(frags))
         self.G.add_nodes_from(
-            (-(i + 1), {"seq": f.reverse_complement()}) for (i, f) in enumerate(frags)
+            (-(i + 1), {"seq": c.reverse_complement})
+            for (i, c) in enumerate(self.fragment_caches)
         )
 
         pairs = list()
@@ -1982,12 +2490,12 @@ class PCRAssembly(Assembly):
             pairs += list(itertools.product([p1, p2], [t, -t]))
             pairs += list(itertools.product([t, -t], [-p1, -p2]))
 
-        for u, v in pairs:
-            u_seq = self.G.nodes[u]["seq"]
-            v_seq = self.G.nodes[v]["seq"]
-            matches = primer_template_overlap(u_seq, v_seq, limit, mismatches)
-            for match in matches:
-                self.add_edges_from_match(match, u, v, u_seq, v_seq)
+        self._add_edges_from_pairs(
+            pairs,
+            functools.partial(primer_template_overlap, mismatches=mismatches),
+            limit,
+            workers,
+        )
 
         # These two are constrained
         self.use_fragment_order = False
@@ -2009,11 +2517,29 @@ class PCRAssembly(Assembly):
 
         return super().get_linear_assemblies(max_assemblies=max_assemblies)
 
+    def iter_linear_assemblies(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        if only_adjacent_edges:
+            raise NotImplementedError(
+                "only_adjacent_edges not implemented for PCR assemblies"
+            )
+
+        return super().iter_linear_assemblies(order=order, max_paths=max_paths)
+
     def get_circular_assemblies(self, only_adjacent_edges: bool = False):
         raise NotImplementedError(
             "get_circular_assemblies not implemented for PCR assemblies"
         )
 
+    def iter_circular_assemblies(self, only_adjacent_edges: bool = False, **kwargs):
+        raise NotImplementedError(
+            "iter_circular_assemblies not implemented for PCR assemblies"
+        )
+
     def get_insertion_assemblies(self, only_adjacent_edges: bool = False):
         raise NotImplementedError(
             "get_insertion_assemblies not implemented for PCR assemblies"
@@ -2028,10 +2554,26 @@ class PCRAssembly(Assembly):
         """
         results = super().assemble_linear(only_adjacent_edges, max_assemblies)
         for result in results:
-            rp = self.fragments[2]
-            result.seq = result.seq[: -len(rp)] + Dseq(str(rp.seq.reverse_complement()))
+            self._fix_reverse_primer(result)
         return results
 
+    def iter_assemble_linear(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[Dseqrecord]:
+        """Generator version of assemble_linear."""
+        for result in super().iter_assemble_linear(
+            only_adjacent_edges, order, max_paths
+        ):
+            self._fix_reverse_primer(result)
+            yield result
+
+    def _fix_reverse_primer(self, result: Dseqrecord) -> None:
+        rp = self.fragments[2]
+        result.seq = result.seq[: -len(rp)] + Dseq(str(rp.seq.reverse_complement()))
+
 
 class SingleFragmentAssembly(Assembly):
     """
@@ -2047,8 +2589,9 @@ class SingleFragmentAssembly(Assembly):
         # TODO: allow for the same fragment to be included more than once?
         self.G = nx.MultiDiGraph()
         frag = frags[0]
+        self.fragment_caches = [FragmentCache(frag)]
         # Add positive and negative nodes for forward and reverse fragments
-        frag_rc = frag.reverse_complement()
+        frag_rc = self.fragment_caches[0].reverse_complement
         self.G.add_node(1, seq=frag)
         self.G.add_node(-1, seq=frag_rc)
 
@@ -2090,6 +2633,18 @@ class SingleFragmentAssembly(Assembly):
             if self.assembly_is_valid(self.fragments, a, True, self.use_all_fragments)
         ]
 
+    def iter_circular_assemblies(
+        self,
+        only_adjacent_edges: bool = False,
+        order: Literal["longest", "fewest_edges"] | None = None,
+        max_paths: int = 10000,
+    ) -> Iterator[EdgeRepresentationAssembly]:
+        # We don't want the same location twice
+        return filter(
+            lambda x: x[0][2] != x[0][3],
+            super().iter_circular_assemblies(only_adjacent_edges, order, max_paths),
+        )
+
     def _splicing_assembly_filter(self, x):
         # We don't want the same location twice
         if x[0][2] == x[0][3]:
@@ -2126,6 +2681,9 @@ class SingleFragmentAssembly(Assembly):
     def get_linear_assemblies(self):
         raise NotImplementedError("Linear assembly does not make sense")
 
+    def iter_linear_assemblies(self, *args, **kwargs):
+        raise NotImplementedError("Linear assembly does not make sense")
+
     def _inversion_assembly_filter(self, x: EdgeRepresentationAssembly) -> bool:
         # We don't want the same location twice
         left, right = x
@@ -2187,9 +2745,7 @@ class SingleFragmentAssembly(Assembly):
     def assemble_inversion(self, max_assemblies: int = 50) -> list[Dseqrecord]:
         assemblies = self.get_inversion_assemblies(max_assemblies)
         is_insertion = not self.fragments[0].circular
-        return [
-            assemble(self.fragments, a, is_insertion=is_insertion) for a in assemblies
-        ]
+        return [self._assemble(a, is_insertion=is_insertion) for a in assemblies]
 
 
 def common_function_assembly_products(
@@ -2199,6 +2755,7 @@ def common_function_assembly_products(
     circular_only: bool,
     filter_results_function: Callable | None = None,
     only_adjacent_edges: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Common function to avoid code duplication. Could be simplified further
     once SingleFragmentAssembly and Assembly are merged.
@@ -2217,6 +2774,8 @@ def common_function_assembly_products(
         Function that filters the results
     only_adjacent_edges : bool
         If True, only return assemblies that use only adjacent edges
+    workers : int or None
+        Number of processes used to find overlaps between fragments (see Assembly)
 
     Returns
     -------
@@ -2227,7 +2786,12 @@ def common_function_assembly_products(
         asm = SingleFragmentAssembly(frags, limit, algorithm)
     else:
         asm = Assembly(
-            frags, limit, algorithm, use_fragment_order=False, use_all_fragments=True
+            frags,
+            limit,
+            algorithm,
+            use_fragment_order=False,
+            use_all_fragments=True,
+            workers=workers,
         )
     output_assemblies = asm.get_circular_assemblies(only_adjacent_edges)
     if not circular_only and len(frags) > 1:
@@ -2263,7 +2827,10 @@ def _recast_sources(
 
 
 def gibson_assembly(
-    frags: list[Dseqrecord], limit: int = 25, circular_only: bool = False
+    frags: list[Dseqrecord],
+    limit: int = 25,
+    circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for Gibson assembly.
 
@@ -2275,6 +2842,9 @@ def gibson_assembly(
         Minimum overlap length required, by default 25
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2283,13 +2853,16 @@ def gibson_assembly(
     """
 
     products = common_function_assembly_products(
-        frags, limit, gibson_overlap, circular_only
+        frags, limit, gibson_overlap, circular_only, workers=workers
     )
     return _recast_sources(products, GibsonAssemblySource)
 
 
 def in_fusion_assembly(
-    frags: list[Dseqrecord], limit: int = 25, circular_only: bool = False
+    frags: list[Dseqrecord],
+    limit: int = 25,
+    circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for in-fusion assembly. This is the same as Gibson
     assembly, but with a different name.
@@ -2302,6 +2875,9 @@ def in_fusion_assembly(
         Minimum overlap length required, by default 25
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2310,13 +2886,16 @@ def in_fusion_assembly(
     """
 
     products = common_function_assembly_products(
-        frags, limit, in_fusion_overlap, circular_only
+        frags, limit, in_fusion_overlap, circular_only, workers=workers
     )
     return _recast_sources(products, InFusionSource)
 
 
 def fusion_pcr_assembly(
-    frags: list[Dseqrecord], limit: int = 25, circular_only: bool = False
+    frags: list[Dseqrecord],
+    limit: int = 25,
+    circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for fusion PCR assembly. This is the same as Gibson
     assembly, but with a different name.
@@ -2329,6 +2908,9 @@ def fusion_pcr_assembly(
         Minimum overlap length required, by default 25
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2336,13 +2918,16 @@ def fusion_pcr_assembly(
         List of assembled DNA molecules
     """
     products = common_function_assembly_products(
-        frags, limit, pcr_fusion_overlap, circular_only
+        frags, limit, pcr_fusion_overlap, circular_only, workers=workers
     )
     return _recast_sources(products, OverlapExtensionPCRLigationSource)
 
 
 def in_vivo_assembly(
-    frags: list[Dseqrecord], limit: int = 25, circular_only: bool = False
+    frags: list[Dseqrecord],
+    limit: int = 25,
+    circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for in vivo assembly (IVA), which relies on homologous recombination between the fragments.
 
@@ -2354,6 +2939,9 @@ def in_vivo_assembly(
         Minimum overlap length required, by default 25
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2361,7 +2949,7 @@ def in_vivo_assembly(
         List of assembled DNA molecules
     """
     products = common_function_assembly_products(
-        frags, limit, common_sub_strings, circular_only
+        frags, limit, common_sub_strings, circular_only, workers=workers
     )
     return _recast_sources(products, InVivoAssemblySource)
 
@@ -2409,6 +2997,7 @@ def restriction_ligation_assembly(
     enzymes: list["AbstractCut"],
     allow_blunt: bool = True,
     circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for restriction ligation assembly:
 
@@ -2426,6 +3015,9 @@ def restriction_ligation_assembly(
         If True, allow blunt end ligations, by default True
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2471,12 +3063,22 @@ def restriction_ligation_assembly(
     TTAAGtttC
     """
 
-    def algorithm_fn(x, y, _l):
-        # By default, we allow blunt ends
-        return restriction_ligation_overlap(x, y, enzymes, False, allow_blunt)
+    algorithm_fn = _named_partial(
+        "restriction_ligation_overlap",
+        _ignore_limit,
+        restriction_ligation_overlap,
+        enzymes=enzymes,
+        partial=False,
+        allow_blunt=allow_blunt,
+    )
 
     products = common_function_assembly_products(
-        frags, None, algorithm_fn, circular_only, only_adjacent_edges=True
+        frags,
+        None,
+        algorithm_fn,
+        circular_only,
+        only_adjacent_edges=True,
+        workers=workers,
     )
 
     out = _recast_sources(
@@ -2510,6 +3112,7 @@ def golden_gate_assembly(
     enzymes: list["AbstractCut"],
     allow_blunt: bool = True,
     circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for Golden Gate assembly. This is the same as
     restriction ligation assembly, but with a different name. Check the documentation
@@ -2525,6 +3128,9 @@ def golden_gate_assembly(
         If True, allow blunt end ligations, by default True
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2535,7 +3141,9 @@ def golden_gate_assembly(
     --------
     See the example for ``restriction_ligation_assembly``.
     """
-    return restriction_ligation_assembly(frags, enzymes, allow_blunt, circular_only)
+    return restriction_ligation_assembly(
+        frags, enzymes, allow_blunt, circular_only, workers
+    )
 
 
 def ligation_assembly(
@@ -2543,6 +3151,7 @@ def ligation_assembly(
     allow_blunt: bool = False,
     allow_partial_overlap: bool = False,
     circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for ligation assembly, as inputs pass the fragments (digested if needed) that
     will be ligated.
@@ -2559,6 +3168,9 @@ def ligation_assembly(
         If True, allow partial overlaps between sticky ends, by default False
     circular_only : bool, optional
         If True, only return circular assemblies, by default False
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2590,8 +3202,12 @@ def ligation_assembly(
     TTAAGggggggCTTAAGtggaC
     """
 
-    def sticky_end_algorithm(x, y, _l):
-        return sticky_end_sub_strings(x, y, allow_partial_overlap)
+    sticky_end_algorithm = _named_partial(
+        "sticky_end_sub_strings",
+        _ignore_limit,
+        sticky_end_sub_strings,
+        limit=allow_partial_overlap,
+    )
 
     if allow_blunt:
         algorithm_fn = combine_algorithms(sticky_end_algorithm, blunt_overlap)
@@ -2599,7 +3215,7 @@ def ligation_assembly(
         algorithm_fn = sticky_end_algorithm
 
     products = common_function_assembly_products(
-        frags, None, algorithm_fn, circular_only
+        frags, None, algorithm_fn, circular_only, workers=workers
     )
     return _recast_sources(products, LigationSource)
 
@@ -2622,6 +3238,7 @@ def gateway_assembly(
     greedy: bool = False,
     circular_only: bool = False,
     multi_site_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for Gateway assembly / Gateway cloning.
 
@@ -2640,6 +3257,9 @@ def gateway_assembly(
         contain multiple att sites (typically 2), a product could be generated where only one
         site recombines. That's typically not what you want, so you can set this to True to
         only return products where both att sites recombined.
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2698,13 +3318,23 @@ def gateway_assembly(
             f"Invalid reaction type: {reaction_type}, can only be BP or LR"
         )
 
-    def algorithm_fn(x, y, _l):
-        return gateway_overlap(x, y, reaction_type, greedy)
+    algorithm_fn = _named_partial(
+        "gateway_overlap",
+        _ignore_limit,
+        gateway_overlap,
+        reaction=reaction_type,
+        greedy=greedy,
+    )
 
     filter_results_function = None if not multi_site_only else assembly_is_multi_site
 
     products = common_function_assembly_products(
-        frags, None, algorithm_fn, circular_only, filter_results_function
+        frags,
+        None,
+        algorithm_fn,
+        circular_only,
+        filter_results_function,
+        workers=workers,
     )
     products = _recast_sources(
         products,
@@ -2730,7 +3360,10 @@ def gateway_assembly(
 
 
 def common_function_integration_products(
-    frags: list[Dseqrecord], limit: int | None, algorithm: Callable
+    frags: list[Dseqrecord],
+    limit: int | None,
+    algorithm: Callable,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Common function to avoid code duplication for integration products.
 
@@ -2742,6 +3375,8 @@ def common_function_integration_products(
         Minimum overlap length required, or None if not applicable
     algorithm : Callable
         Function that determines valid overlaps between fragments
+    workers : int or None
+        Number of processes used to find overlaps between fragments (see Assembly)
 
     Returns
     -------
@@ -2752,7 +3387,12 @@ def common_function_integration_products(
         asm = SingleFragmentAssembly(frags, limit, algorithm)
     else:
         asm = Assembly(
-            frags, limit, algorithm, use_fragment_order=False, use_all_fragments=True
+            frags,
+            limit,
+            algorithm,
+            use_fragment_order=False,
+            use_all_fragments=True,
+            workers=workers,
         )
 
     if frags[0].circular:
@@ -2823,6 +3463,7 @@ def homologous_recombination_integration(
     genome: Dseqrecord,
     inserts: list[Dseqrecord],
     limit: int = 40,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products resulting from the integration of an insert (or inserts joined
     through in vivo recombination) into the genome through homologous recombination.
@@ -2835,6 +3476,9 @@ def homologous_recombination_integration(
         DNA fragment(s) to insert
     limit : int, optional
         Minimum homology length required, by default 40
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2868,7 +3512,7 @@ def homologous_recombination_integration(
     fragments = common_handle_insertion_fragments(genome, inserts)
 
     products = common_function_integration_products(
-        fragments, limit, common_sub_strings
+        fragments, limit, common_sub_strings, workers
     )
     return _recast_sources(products, HomologousRecombinationSource)
 
@@ -2925,7 +3569,7 @@ def homologous_recombination_excision(
 
 
 def cre_lox_integration(
-    genome: Dseqrecord, inserts: list[Dseqrecord]
+    genome: Dseqrecord, inserts: list[Dseqrecord], workers: int | None = None
 ) -> list[Dseqrecord]:
     """Returns the products resulting from the integration of an insert (or inserts joined
     through cre-lox recombination among them) into the genome through cre-lox integration.
@@ -2938,6 +3582,9 @@ def cre_lox_integration(
         Target genome sequence
     inserts : list[Dseqrecord] or Dseqrecord
         DNA fragment(s) to insert
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -2980,7 +3627,9 @@ def cre_lox_integration(
 
     """
     fragments = common_handle_insertion_fragments(genome, inserts)
-    products = common_function_integration_products(fragments, None, cre_loxP_overlap)
+    products = common_function_integration_products(
+        fragments, None, cre_loxP_overlap, workers
+    )
     return _recast_sources(products, CreLoxRecombinationSource)
 
 
@@ -3089,6 +3738,7 @@ def recombinase_integration(
     genome: Dseqrecord,
     inserts: list[Dseqrecord],
     recombinase: Recombinase | RecombinaseCollection,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products resulting from recombinase-mediated integration.
 
@@ -3100,6 +3750,9 @@ def recombinase_integration(
         DNA fragment(s) to insert.
     recombinase : Recombinase | RecombinaseCollection
         Recombinase object.
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -3122,7 +3775,7 @@ def recombinase_integration(
     """
     fragments = common_handle_insertion_fragments(genome, inserts)
     products = common_function_integration_products(
-        fragments, None, recombinase.overlap
+        fragments, None, recombinase.overlap, workers
     )
     products = [recombinase.annotate(p) for p in products]
     return _recast_sources(products, RecombinaseSource, recombinases=recombinase)
@@ -3132,11 +3785,12 @@ def recombinase_assembly(
     frags: list[Dseqrecord],
     recombinase: Recombinase | RecombinaseCollection,
     circular_only: bool = False,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products of a recombinase assembly (assuming no sequence is a genome)"""
 
     products = common_function_assembly_products(
-        frags, None, recombinase.overlap, circular_only
+        frags, None, recombinase.overlap, circular_only, workers=workers
     )
     products = [recombinase.annotate(p) for p in products]
     return _recast_sources(products, RecombinaseSource, recombinases=recombinase)
@@ -3147,6 +3801,7 @@ def crispr_integration(
     inserts: list[Dseqrecord],
     guides: list[Primer],
     limit: int = 40,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """
     Returns the products for CRISPR integration.
@@ -3161,6 +3816,9 @@ def crispr_integration(
         List of guide RNAs as Primer objects. This may change in the future.
     limit : int, optional
         Minimum overlap length required, by default 40
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -3185,15 +3843,20 @@ def crispr_integration(
         raise ValueError("At least one guide RNA is required for CRISPR integration")
 
     # Get all the possible products from the homologous recombination integration
-    products = homologous_recombination_integration(genome, inserts, limit)
+    products = homologous_recombination_integration(genome, inserts, limit, workers)
 
     # Verify that the guides cut in the region that will be repaired
 
-    # First we collect the positions where the guides cut
+    # First we collect the positions where the guides cut. The PAM sites of the
+    # genome are indexed once and all the guides are looked up in the index.
+    found = PamIndex(genome.seq).search([str(guide.seq) for guide in guides])
     guide_cuts = []
     for guide in guides:
         enzyme = cas9(str(guide.seq))
-        possible_cuts = genome.seq.get_cutsites(enzyme)
+        possible_cuts = [
+            ((cut - 1, enzyme.ovhg), enzyme) for cut in found[str(guide.seq)]
+        ]
+        possible_cuts = [c for c in possible_cuts if genome.seq.cutsite_is_valid(c)]
         if len(possible_cuts) == 0:
             raise ValueError(
                 f"Could not find Cas9 cutsite in the target sequence using the guide: {guide.name}"
@@ -3248,6 +3911,7 @@ def pcr_assembly(
     add_primer_features: bool = False,
     limit: int = 14,
     mismatches: int = 0,
+    workers: int | None = None,
 ) -> list[Dseqrecord]:
     """Returns the products for PCR assembly.
 
@@ -3265,6 +3929,9 @@ def pcr_assembly(
         Minimum overlap length required, by default 14
     mismatches : int, optional
         Maximum number of mismatches, by default 0
+    workers : int, optional
+        Number of processes used to find the overlaps between fragments, by default None
+        (serial). See ``Assembly``.
 
     Returns
     -------
@@ -3278,6 +3945,7 @@ def pcr_assembly(
         fragments,
         limit=minimal_annealing,
         mismatches=mismatches,
+        workers=workers,
     )
     products = asm.assemble_linear()
     # If both primers are the same, remove duplicates
@@ -12,7 +12,7 @@ the original code was covered by an MIT licence."""
 
 
 from operator import itemgetter
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 Match = Tuple[int, int, int]  # (x_start, y_start, length)
 
@@ -340,6 +340,112 @@ def common_sub_strings(stringx: str, stringy: str, limit: int = 25) -> List[Matc
     return matches
 
 
+def all_pairs_common_sub_strings(
+    strings: Sequence[str], limit: int = 25
+) -> Dict[Tuple[int, int], List[Match]]:
+    """
+    Finds all common substrings between every pair of strings in ``strings``
+    using a single generalized suffix array.
+
+    The result for each pair is identical to calling
+    ``common_sub_strings(strings[i], strings[j], limit)``, but the strings are
+    only indexed once, instead of once per pair. This function is case sensitive.
+
+    Parameters
+    ----------
+    strings : sequence of str
+        ASCII strings, they can not contain the null character.
+    limit : int, optional
+
+    Returns
+    -------
+    dict
+        {(i, j): [(starti1, startj1, length1), ...], ...} for all i < j
+        that share at least one common substring. The lists are sorted
+        like the output of common_sub_strings.
+
+    Examples
+    --------
+
+    >>> from pydna.common_sub_strings import all_pairs_common_sub_strings
+    >>> all_pairs_common_sub_strings(["gatgatttcgg", "cgtttcggaa", "ccgatgat"], limit=5)
+    {(0, 1): [(5, 2, 6)], (0, 2): [(0, 2, 6)]}
+    """
+    import numpy as np
+    from pydivsufsort import divsufsort, kasai
+
+    limit = max(limit, 1)
+    lengths = np.array([len(s) for s in strings], dtype=np.int64)
+    # Each string is followed by a null separator
+    starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1])).astype(np.int64)
+    text = np.frombuffer(
+        bytearray(b"\x00".join(s.encode("ascii") for s in strings) + b"\x00"),
+        dtype=np.uint8,
+    )
+    if len(text) < 2:
+        return {}
+
+    # For every position of the text, the index of the string it belongs to
+    # and the number of characters left until the end of that string
+    # (0 for separators).
+    string_id = np.repeat(np.arange(len(strings)), lengths + 1)
+    remaining = (starts + lengths)[string_id] - np.arange(len(text))
+
+    suffix_array = divsufsort(text)
+    # lcp[i] is the length of the common prefix of suffix_array[i] and suffix_array[i + 1].
+    # Separators are all the same character, so the lcp is capped at the end of the strings.
+    lcp = kasai(text, suffix_array).astype(np.int64)[:-1]
+    suffix_array = suffix_array.astype(np.int64)
+    lcp = np.minimum(lcp, remaining[suffix_array[:-1]])
+    lcp = np.minimum(lcp, remaining[suffix_array[1:]])
+
+    # Character on the left of each suffix (in suffix array order), -1 at the
+    # start of a string
+    left = np.where(
+        suffix_array == starts[string_id[suffix_array]],
+        -1,
+        text[suffix_array - 1].astype(np.int64),
+    )
+
+    # Runs of consecutive suffixes sharing at least limit characters
+    above = np.concatenate(([False], lcp >= limit, [False]))
+    changes = np.flatnonzero(above[1:] != above[:-1])
+    run_starts, run_ends = changes[::2], changes[1::2]
+
+    result: Dict[Tuple[int, int], List[Match]] = dict()
+    for run_start, run_end in zip(run_starts.tolist(), run_ends.tolist()):
+        members = suffix_array[run_start : run_end + 1]
+        ids = string_id[members]
+        lefts = left[run_start : run_end + 1]
+        # Suffixes from a single string or all preceded by the same character
+        # can not give maximal matches between different strings.
+        if ids.min() == ids.max() or (lefts.min() == lefts.max() and lefts[0] >= 0):
+            continue
+        run_lcp = lcp[run_start:run_end].tolist()
+        members = members.tolist()
+        ids = ids.tolist()
+        lefts = lefts.tolist()
+        for j in range(1, len(members)):
+            length = run_lcp[j - 1]
+            for i in range(j - 1, -1, -1):
+                length = min(length, run_lcp[i])
+                if ids[i] == ids[j] or (lefts[i] == lefts[j] and lefts[i] >= 0):
+                    continue
+                a, b = (i, j) if ids[i] < ids[j] else (j, i)
+                result.setdefault((ids[a], ids[b]), []).append(
+                    (
+                        members[a] - int(starts[ids[a]]),
+                        members[b] - int(starts[ids[b]]),
+                        length,
+                    )
+                )
+
+    for matches in result.values():
+        matches.sort()
+        matches.sort(key=itemgetter(2), reverse=True)
+    return dict(sorted(result.items()))
+
+
 def terminal_overlap(stringx: str, stringy: str, limit: int = 15) -> List[Match]:
     """Finds the the flanking common substrings between stringx and stringy
     longer than limit. This means that the results only contains substrings
@@ -6,15 +6,26 @@
 """
 Utilities for CRISPR/Cas target searching and protospacer extraction.
 
+:class:`PamIndex` finds the target sites of many protospacers in a long
+sequence, like a genome, optionally with mismatches. The PAM sites are found
+once on both strands, and the protospacers are looked up among the
+sequences next to them.
+
 """
 import re
 from abc import ABC
 from abc import abstractmethod
+from typing import Iterable
 from typing import Type
 from typing import TYPE_CHECKING
 from typing import List
 from typing import TypeVar
 
+import numpy as np
+from Bio.Data.IUPACData import ambiguous_dna_values
+
+from pydna.kmer_index import kmer_key, max_k, nucleotide_codes
+
 if TYPE_CHECKING:  # pragma: no cover
     from pydna.dseqrecord import Dseqrecord
 
@@ -187,3 +198,225 @@ def protospacer(guide_construct: DseqrecordType, cas: Type[_cas] = cas9) -> List
         )
 
     return result
+
+
+def _mismatches(a: np.ndarray, b) -> np.ndarray:
+    """Number of different nucleotides in keys from kmer_key."""
+    x = np.bitwise_xor(a, np.uint64(b))
+    # One bit for each different nucleotide, then the number of bits
+    x = (x | (x >> np.uint64(1))) & np.uint64(0x5555555555555555)
+    x = (x & np.uint64(0x3333333333333333)) + (
+        (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+class PamIndex:
+    """
+    The target sites next to each PAM of a sequence, on both strands.
+
+    The protospacers are looked up in a sorted array of the sites, so that
+    many protospacers can be searched in a genome quickly. Protospacers of
+    another length than the size of the nuclease, or with other letters than
+    ACGT, are searched with the search method of the nuclease instead.
+
+    >>> from pydna.crispr import PamIndex
+    >>> from pydna.dseq import Dseq
+    >>> index = PamIndex(Dseq("ttGTTACTTTACCCGACGTCCCaGGtt"))
+    >>> index.search(["GTTACTTTACCCGACGTCCC", "GTTACTTTACCCGACGTCCA"])
+    {'GTTACTTTACCCGACGTCCC': [20], 'GTTACTTTACCCGACGTCCA': []}
+    >>> index.count(["GTTACTTTACCCGACGTCCA"], mismatches=2)
+    {'GTTACTTTACCCGACGTCCA': [0, 1, 0]}
+
+    Parameters
+    ----------
+    dna : str, Bio.Seq.Seq, Dseq or Dseqrecord
+        The sequence.
+    cas : subclass of _cas, optional
+        The nuclease, the default is cas9.
+    linear : bool, optional
+        If the sequence is linear. The default is the topology of dna, or
+        True if dna has no topology.
+    """
+
+    def __init__(self, dna, cas: Type[_cas] = cas9, linear: bool | None = None):
+        if hasattr(dna, "seq"):
+            dna = dna.seq
+        if linear is None:
+            linear = not getattr(dna, "circular", False)
+        if not 1 <= cas.size <= max_k:
+            raise ValueError(f"The size of {cas.__name__} must be 1 to {max_k}")
+        self.dna = dna
+        self.cas = cas
+        self.linear = linear
+
+        from pydna.utils import rc
+
+        text = str(dna)
+        length = len(text)
+        window = cas.size + len(cas.pam)
+        keys, cuts = [], []
+        for strand, strand_text in ((1, text), (-1, rc(text))):
+            if not linear:
+                strand_text += strand_text[: window - 1]
+            starts, strand_keys = self._sites(strand_text)
+            keys.append(strand_keys)
+            # The same cut positions as the search method of cas
+            if strand == 1:
+                cuts.append((starts + cas.fst5 + 1) % length)
+            else:
+                cuts.append((length - (starts + cas.fst5) + 1) % length)
+        keys = np.concatenate(keys)
+        cuts = np.concatenate(cuts)
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._cuts = cuts[order]
+        # Sorted keys of parts of the sites, for searches with mismatches
+        self._parts = dict()
+
+    def __len__(self):
+        """The number of sites (PAMs) on both strands."""
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"PamIndex({self.cas.__name__}, {len(self)} sites)"
+
+    def _sites(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+        """Start positions and keys of the sites in text."""
+        size = self.cas.size
+        pam = self.cas.pam.upper()
+        codes = nucleotide_codes(text)
+        number = len(text) - size - len(pam) + 1
+        if number < 1:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint64)
+
+        valid = np.ones(number, dtype=bool)
+        for j, letter in enumerate(pam):
+            if letter in ".N":
+                continue
+            allowed = np.zeros(256, dtype=bool)
+            allowed[nucleotide_codes(ambiguous_dna_values.get(letter, letter))] = True
+            valid &= allowed[codes[size + j : size + j + number]]
+        # Only protospacers of ACGT are indexed
+        invalid = np.concatenate(([0], np.cumsum(codes == 255)))
+        valid &= (invalid[size : size + number] - invalid[:number]) == 0
+
+        starts = np.flatnonzero(valid)
+        keys = np.zeros(len(starts), dtype=np.uint64)
+        for j in range(size):
+            keys = (keys << np.uint64(2)) | codes[starts + j].astype(np.uint64)
+        return starts, keys
+
+    def _part(self, offset: int, length: int) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted keys of a part of the sites, and the index of each site."""
+        if (offset, length) not in self._parts:
+            shift = np.uint64(2 * (self.cas.size - offset - length))
+            mask = np.uint64((1 << (2 * length)) - 1)
+            keys = (self._keys >> shift) & mask
+            order = np.argsort(keys, kind="stable")
+            self._parts[offset, length] = keys[order], order
+        return self._parts[offset, length]
+
+    def _hits(self, key: int, mismatches: int) -> tuple[np.ndarray, np.ndarray]:
+        """Index of the sites matching a key with at most mismatches differences,
+        and the number of differences."""
+        if mismatches == 0:
+            lo = np.searchsorted(self._keys, np.uint64(key), side="left")
+            hi = np.searchsorted(self._keys, np.uint64(key), side="right")
+            return np.arange(lo, hi), np.zeros(hi - lo, dtype=np.int64)
+
+        size = self.cas.size
+        part_length = size // (mismatches + 1)
+        if part_length == 0:
+            candidates = np.arange(len(self._keys))
+        else:
+            # At least one of mismatches + 1 parts matches exactly
+            found = []
+            for i in range(mismatches + 1):
+                offset = i * part_length
+                keys, order = self._part(offset, part_length)
+                shift = 2 * (size - offset - part_length)
+                part = np.uint64((key >> shift) & ((1 << (2 * part_length)) - 1))
+                lo = np.searchsorted(keys, part, side="left")
+                hi = np.searchsorted(keys, part, side="right")
+                found.append(order[lo:hi])
+            candidates = np.unique(np.concatenate(found))
+        distances = _mismatches(self._keys[candidates], key)
+        keep = distances <= mismatches
+        return candidates[keep], distances[keep]
+
+    def _key(self, protospacer: str) -> int | None:
+        """Key of a protospacer, None if it can not be looked up in the index."""
+        if len(protospacer) != self.cas.size:
+            return None
+        return kmer_key(protospacer)
+
+    def search(
+        self, protospacers: Iterable[str], mismatches: int = 0
+    ) -> dict[str, list[int]]:
+        """
+        Cut positions of each protospacer.
+
+        Without mismatches, the positions are the same as from the search
+        method of the nuclease, ``cas(protospacer).search(dna, linear)``.
+
+        Parameters
+        ----------
+        protospacers : iterable of str
+            The protospacers.
+        mismatches : int, optional
+            Also find the sites with up to this many different nucleotides.
+
+        Returns
+        -------
+        dict[str, list[int]]
+            The sorted cut positions (the first base after the cut, counting
+            from 1) for each protospacer.
+        """
+        result = dict()
+        for protospacer in protospacers:
+            key = self._key(protospacer)
+            if key is None:
+                if mismatches:
+                    raise ValueError(
+                        f"{protospacer} can not be searched with mismatches"
+                    )
+                result[protospacer] = sorted(
+                    set(self.cas(protospacer).search(self.dna, linear=self.linear))
+                )
+                continue
+            sites, _ = self._hits(key, mismatches)
+            result[protospacer] = sorted(set(self._cuts[sites].tolist()))
+        return result
+
+    def count(
+        self, protospacers: Iterable[str], mismatches: int = 3
+    ) -> dict[str, list[int]]:
+        """
+        Number of sites for each protospacer and number of mismatches, to
+        count off-target sites.
+
+        Parameters
+        ----------
+        protospacers : iterable of str
+            The protospacers, of the size of the nuclease and with only ACGT.
+        mismatches : int, optional
+            The largest number of mismatches counted. The default is 3.
+
+        Returns
+        -------
+        dict[str, list[int]]
+            For each protospacer, the number of sites with 0, 1, ...,
+            mismatches different nucleotides.
+        """
+        result = dict()
+        for protospacer in protospacers:
+            key = self._key(protospacer)
+            if key is None:
+                raise ValueError(f"{protospacer} can not be looked up in the index")
+            _, distances = self._hits(key, mismatches)
+            result[protospacer] = np.bincount(
+                distances, minlength=mismatches + 1
+            ).tolist()
+        return result
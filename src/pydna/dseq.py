@@ -12,13 +12,16 @@ which can hold more meta data.
 The Dseq class support the notion of circular and linear DNA topology.
 """
 
+import functools
 import itertools
 import re
 import copy
 import sys
 import math
 import inspect
-from typing import List, Tuple, Union
+from typing import Iterator, List, Tuple, Union
+
+import numpy as np
 
 from Bio.Restriction import RestrictionBatch
 from Bio.Restriction import CommOnly
@@ -33,11 +36,11 @@ from Bio.Data.IUPACData import unambiguous_rna_weights
 from Bio.Data.IUPACData import atom_weights
 from pydna._pretty import pretty_str
 from pydna.utils import rc
-from pydna.utils import flatten
 from pydna.utils import cuts_overlap
 from pydna.utils import deduplicate
 
 from pydna.alphabet import basepair_dict
+from pydna.alphabet import dscode_from_strands
 from pydna.alphabet import dscode_to_watson_table
 from pydna.alphabet import dscode_to_crick_table
 from pydna.alphabet import regex_ds_melt_factory
@@ -52,8 +55,11 @@ from pydna.alphabet import ss_letters_crick
 from pydna.alphabet import get_parts
 from pydna.alphabet import representation_tuple
 from pydna.alphabet import dsbreaks
+from pydna.alphabet import ds_letters
 
 from pydna.common_sub_strings import common_sub_strings
+from pydna.template_index import TemplateIndex
+from pydna.restriction_map import DigestFragment, restriction_map
 from pydna.types import DseqType, EnzymesType, CutSiteType
 
 
@@ -61,9 +67,141 @@ from pydna.types import DseqType, EnzymesType, CutSiteType
 length_limit_for_repr = 30
 placeholder = letters_not_in_dscode[-1]
 
+# True for the dscode symbols of double stranded DNA or RNA
+_ds_symbols = np.zeros(256, dtype=bool)
+_ds_symbols[list(ds_letters.encode("ascii"))] = True
+
 __all__ = ["Dseq", "CircularBytes"]
 
 
+def _cached_on_data(method):
+    """Cache the value of a Dseq method without arguments that only depends on _data.
+
+    Dseq objects are not changed in place, except by assigning a new byte string
+    to _data, so the value is kept until _data is replaced. Callers must not modify
+    the returned value.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        if self.__dict__.get("_cached_data") is not self._data:
+            self._cached_data = self._data
+            self._cached_values = {}
+        try:
+            return self._cached_values[name]
+        except KeyError:
+            value = self._cached_values[name] = method(self)
+            return value
+
+    return wrapper
+
+
+def _circular_window(data: bytes, start: int, length: int) -> bytes:
+    """
+    The length bytes of the circular sequence data that begin at start,
+    wrapping around the origin as many times as needed.
+
+    The window is read from a memoryview of data, so that only the result is
+    allocated and data is never doubled.
+
+    >>> from pydna.dseq import _circular_window
+    >>> _circular_window(b"ABCDE", 3, 7)
+    b'DEABCDE'
+    >>> _circular_window(b"ABCDE", -1, 4)
+    b'EABC'
+    """
+    n = len(data)
+    if n == 0 or length <= 0:
+        return b""
+    start %= n
+    view = memoryview(data)
+    segments = []
+    while length > 0:
+        segment = view[start : start + length]
+        segments.append(segment)
+        length -= len(segment)
+        start = 0
+    return b"".join(segments)
+
+
+def _circular_slice(data: bytes, key: slice) -> bytes:
+    """Slice of the circular sequence data, see CircularBytes.__getitem__."""
+    n = len(data)
+    if n == 0:
+        return b""
+    start, stop, step = key.start, key.stop, key.step
+    step = 1 if step is None else step
+    if step == 0:
+        raise ValueError("slice step cannot be zero")
+
+    if step > 0:
+        start = 0 if start is None else start
+        if stop is None:
+            if start < 0:
+                stop = 0
+            else:
+                stop = n
+        while stop <= start:
+            stop += n
+    else:
+        start = (n - 1) if start is None else start
+        stop = -1 if stop is None else stop
+        while stop >= start:
+            stop -= n
+
+    # The slice is at most one turn plus one base (two turns for steps that
+    # are not a multiple of the length)
+    limit = n if step % n == 0 else n * 2
+    length = min(len(range(start, stop, step)), limit + 1)
+
+    if step == 1:
+        return _circular_window(data, start, length)
+    positions = (start + step * np.arange(length, dtype=np.int64)) % n
+    return np.frombuffer(data, dtype=np.uint8)[positions].tobytes()
+
+
+def _circular_find(
+    data: bytes, sub: bytes | bytearray | memoryview | str, start: int = 0
+) -> int:
+    """
+    Index of the first occurrence of sub in the circular sequence data that
+    starts at start or later. The occurrence may span the origin, but must start
+    before the end of data. Returns -1 if sub is not found.
+
+    This gives the same result as searching in the doubled sequence, without
+    making it: occurrences that do not span the origin are found in data and the
+    others in the window of len(sub) - 1 bases on each side of the origin.
+    """
+    n = len(data)
+    if n == 0:
+        return -1
+    try:
+        sub = sub.encode("ascii")
+    except AttributeError:
+        pass
+    sub = bytes(sub)
+    m = len(sub)
+
+    if start < 0:
+        # As for a negative start in the doubled sequence
+        start = max(0, 2 * n + start)
+    if m == 0:
+        return start if start < n else -1
+
+    # bytes.find, as data can be a CircularBytes
+    pos = bytes.find(data, sub, start)
+    if pos != -1:
+        return pos
+
+    junction_start = max(start, n - m + 1)
+    if junction_start >= n:
+        return -1
+    junction_length = min(n - junction_start + m - 1, 2 * n - junction_start)
+    pos = _circular_window(data, junction_start, junction_length).find(sub)
+    return -1 if pos == -1 else junction_start + pos
+
+
 class CircularBytes(bytes):
     """
     A circular bytes sequence: indexing and slicing wrap around index 0.
@@ -91,36 +229,7 @@ class CircularBytes(bytes):
             return super().__getitem__(key % n)
 
         if isinstance(key, slice):
-            start, stop, step = key.start, key.stop, key.step
-            step = 1 if step is None else step
-            if step == 0:
-                raise ValueError("slice step cannot be zero")
-
-            if step > 0:
-                start = 0 if start is None else start
-                if stop is None:
-                    if start < 0:
-                        stop = 0
-                    else:
-                        stop = n
-                while stop <= start:
-                    stop += n
-            else:
-                start = (n - 1) if start is None else start
-                stop = -1 if stop is None else stop
-                while stop >= start:
-                    stop -= n
-
-            rng = range(start, stop, step)
-            limit = n if step % n == 0 else n * 2
-            out = bytearray()
-            count = 0
-            for i in rng:
-                out.append(super().__getitem__(i % n))
-                count += 1
-                if count > limit:
-                    break
-            return self.__class__(bytes(out))
+            return self.__class__(_circular_slice(self, key))
 
         return super().__getitem__(key)
 
@@ -135,15 +244,7 @@ class CircularBytes(bytes):
         assert s.cutaround(3, 7) == b"DEABCDE"
         assert s.cutaround(-1, 4) == b"EABC"
         """
-        n = len(self)
-        if n == 0 or length <= 0:
-            return self.__class__(b"")
-
-        start %= n
-        out = bytearray()
-        for i in range(length):
-            out.append(self[(start + i) % n])
-        return self.__class__(bytes(out))
+        return self.__class__(_circular_window(self, start, length))
 
     def find(
         self,
@@ -156,22 +257,7 @@ class CircularBytes(bytes):
         wrapping across the origin.
         Returns -1 if not found.
         """
-        n = len(self)
-        if n == 0:
-            return -1
-
-        end = n if end is None else min(end, n)
-        doubled = self + self
-        try:
-            sub = sub.encode("ascii")
-        except AttributeError:
-            pass
-
-        pos = doubled.find(bytes(sub), start, n + len(sub) - 1)
-
-        if pos == -1 or pos >= n:
-            return -1
-        return pos
+        return _circular_find(self, sub, start)
 
     def replace_with(self, start, end, replacement) -> "CircularBytes":
         """
@@ -556,14 +642,7 @@ class Dseq(Seq):
             """both strands padded so that bsepairs align"""
             assert len(sense) == len(antisense)
 
-            data = []
-
-            for w, c in zip(sense, antisense):
-                try:
-                    data.append(basepair_dict[w, c])
-                except KeyError as err:
-                    raise ValueError(f"Base mismatch in representation: {err}") from err
-            data = "".join(data).strip()
+            data = dscode_from_strands(sense, antisense).strip()
             self._data = data.encode("ascii")
 
         self.circular = circular
@@ -681,6 +760,7 @@ class Dseq(Seq):
         return Dseq(watson, crick=crick, ovhg=crick_ovhg)
 
     @property
+    @_cached_on_data
     def watson(self) -> str:
         """
         The watson (upper) strand of the double stranded fragment 5'-3'.
@@ -694,6 +774,7 @@ class Dseq(Seq):
         return self._data.decode("ascii").translate(dscode_to_watson_table).strip()
 
     @property
+    @_cached_on_data
     def crick(self) -> str:
         """
         The crick (lower) strand of the double stranded fragment 5'-3'.
@@ -898,12 +979,52 @@ class Dseq(Seq):
         >>> seq.find("ta")
         2
         """
+        index = self.template_index
+        if index is not None and isinstance(sub, (str, bytes)):
+            result = index.find(sub, start, end)
+            if result is not None:
+                return result
         if self.circular:
-            result = CircularBytes(self._data).find(sub, start, end)
+            result = _circular_find(self._data, sub, start)
         else:
             result = super().find(sub, start, end)
         return result
 
+    @property
+    def template_index(self) -> TemplateIndex | None:
+        """The TemplateIndex made by :meth:`build_index`, or None if there is none or
+        if the sequence was changed since it was made."""
+        index = getattr(self, "_template_index", None)
+        if (
+            index is None
+            or index.data is not self._data
+            or index.circular != self.circular
+        ):
+            return None
+        return index
+
+    def build_index(self) -> TemplateIndex:
+        """Make a :class:`pydna.template_index.TemplateIndex` of the sequence and keep it,
+        so that searches in the sequence are faster.
+
+        The index is made only once, it is reused until the sequence is changed.
+
+        >>> from pydna.dseq import Dseq
+        >>> seq = Dseq("agtaagt")
+        >>> index = seq.build_index()
+        >>> seq.find("taa")
+        2
+        >>> seq.build_index() is index
+        True
+        >>> seq.looped().template_index is None
+        True
+        """
+        index = self.template_index
+        if index is None:
+            index = TemplateIndex(self)
+            self._template_index = index
+        return index
+
     def __contains__(self, sub: [str, bytes]) -> bool:
         return self.find(sub) != -1
 
@@ -912,8 +1033,7 @@ class Dseq(Seq):
             sl = slice(sl, sl + 1, 1)
         sl = slice(sl.start, sl.stop, sl.step)
         if self.circular:
-            cb = CircularBytes(self._data)
-            return self.quick(cb[sl])
+            return self.quick(_circular_slice(self._data, sl))
         return super().__getitem__(sl)
 
     def __eq__(self, other: DseqType) -> bool:
@@ -1859,9 +1979,7 @@ class Dseq(Seq):
         """Enzymes in a RestrictionBatch not cutting sequence."""
         if batch is None:
             batch = CommOnly
-        ana = batch.search(self)
-        ncut = {enz: sitelist for (enz, sitelist) in ana.items() if not sitelist}
-        return RestrictionBatch(ncut)
+        return restriction_map(self, batch).no_cutters()
 
     def unique_cutters(
         self, batch: Union[RestrictionBatch, None] = None
@@ -1887,17 +2005,13 @@ class Dseq(Seq):
         """Enzymes in a RestrictionBatch cutting n times."""
         if batch is None:
             batch = CommOnly
-        ana = batch.search(self)
-        ncut = {enz: sitelist for (enz, sitelist) in ana.items() if len(sitelist) == n}
-        return RestrictionBatch(ncut)
+        return restriction_map(self, batch).n_cutters(n=n)
 
     def cutters(self, batch: Union[RestrictionBatch, None] = None) -> RestrictionBatch:
         """Enzymes in a RestrictionBatch cutting sequence at least once."""
         if batch is None:
             batch = CommOnly
-        ana = batch.search(self)
-        ncut = {enz: sitelist for (enz, sitelist) in ana.items() if sitelist}
-        return RestrictionBatch(ncut)
+        return restriction_map(self, batch).cutters()
 
     def seguid(self) -> str:
         """SEGUID checksum for the sequence."""
@@ -2106,6 +2220,50 @@ class Dseq(Seq):
         cutsite_pairs = self.get_cutsite_pairs(cutsites)
         return tuple(self.apply_cut(*cs) for cs in cutsite_pairs)
 
+    def partial_digest(
+        self,
+        *enzymes: EnzymesType,
+        min_size: int = 0,
+        max_size: Union[int, None] = None,
+        max_missed: Union[int, None] = None,
+    ) -> Iterator[DigestFragment]:
+        """Fragments of a partial digestion, from each cut site to each of the
+        following cut sites.
+
+        The fragments are :class:`pydna.restriction_map.DigestFragment` objects,
+        with the cut sites, size and number of uncut sites of each fragment.
+        The Dseq of a fragment is only made when its seq attribute is used.
+        See :meth:`pydna.restriction_map.RestrictionMap.partial_digest`.
+
+        Parameters
+        ----------
+        enzymes : enzyme object or iterable of such objects
+            A Bio.Restriction.XXX restriction objects or iterable.
+        min_size, max_size : int, optional
+            Only fragments with a size in this range are returned.
+        max_missed : int, optional
+            Only fragments with at most this many uncut sites are returned.
+
+        Examples
+        --------
+        >>> from Bio.Restriction import BamHI, EcoRI
+        >>> from pydna.dseq import Dseq
+        >>> seq = Dseq("ggatccnnngaattc")
+        >>> for fragment in seq.partial_digest(BamHI, EcoRI):
+        ...     print(fragment.size, fragment.missed, fragment.seq.watson)
+        5 0 g
+        14 1 ggatccnnng
+        13 0 gatccnnng
+        14 1 gatccnnngaattc
+        5 0 aattc
+        >>> [len(f.seq) for f in seq.partial_digest(BamHI, EcoRI, min_size=6)]
+        [14, 13, 14]
+
+        """
+        return restriction_map(self, enzymes).partial_digest(
+            min_size=min_size, max_size=max_size, max_missed=max_missed
+        )
+
     def cutsite_is_valid(self, cutsite: CutSiteType) -> bool:
         """
         Check is a cutsite is valid.
@@ -2182,8 +2340,8 @@ class Dseq(Seq):
         watson, crick, ovhg = self.get_cut_parameters(cutsite, True)
 
         # The overhang is double stranded
-        overhang_dseq = self[watson:crick] if ovhg < 0 else self[crick:watson]
-        if overhang_dseq.ovhg != 0 or overhang_dseq.watson_ovhg != 0:
+        overhang = (watson, crick) if ovhg < 0 else (crick, watson)
+        if not self._slice_length_and_ends_ds(*overhang)[1]:
             return False
 
         # The recognition site is double stranded and within the sequence
@@ -2193,12 +2351,10 @@ class Dseq(Seq):
         end_of_recognition_site = start_of_recognition_site + enz.size
         if self.circular:
             end_of_recognition_site %= len(self)
-        recognition_site = self[start_of_recognition_site:end_of_recognition_site]
-        if (
-            len(recognition_site) == 0
-            or recognition_site.ovhg != 0
-            or recognition_site.watson_ovhg != 0
-        ):
+        length, ends_ds = self._slice_length_and_ends_ds(
+            start_of_recognition_site, end_of_recognition_site
+        )
+        if length == 0 or not ends_ds:
             if enz is None or enz.scd5 is None:
                 return False
             else:
@@ -2209,19 +2365,49 @@ class Dseq(Seq):
                 end_of_recognition_site = start_of_recognition_site + enz.size
                 if self.circular:
                     end_of_recognition_site %= len(self)
-                recognition_site = self[
-                    start_of_recognition_site:end_of_recognition_site
-                ]
-
-                if (
-                    len(recognition_site) == 0
-                    or recognition_site.ovhg != 0
-                    or recognition_site.watson_ovhg != 0
-                ):
+                length, ends_ds = self._slice_length_and_ends_ds(
+                    start_of_recognition_site, end_of_recognition_site
+                )
+                if length == 0 or not ends_ds:
                     return False
 
         return True
 
+    @_cached_on_data
+    def _not_ds_count(self) -> np.ndarray:
+        """Number of symbols that are not double stranded before each position,
+        over two turns of the sequence for circular sequences."""
+        not_ds = ~_ds_symbols[np.frombuffer(self._data, dtype=np.uint8)]
+        counts = np.concatenate(([0], np.cumsum(not_ds)))
+        return np.concatenate((counts, counts[-1] + counts[1:]))
+
+    def _slice_length_and_ends_ds(self, start: int, stop: int) -> Tuple[int, bool]:
+        """
+        Length of self[start:stop], and if both ends of it are double stranded
+        (ovhg and watson_ovhg are 0), without making the slice if all of it is
+        double stranded.
+        """
+        n = len(self._data)
+        if self.circular:
+            # As _circular_slice
+            if n == 0:
+                return 0, True
+            while stop <= start:
+                stop += n
+            length = min(stop - start, n + 1)
+            first = start % n
+        else:
+            positions = range(n)[start:stop]
+            first, length = positions.start, len(positions)
+        if length == 0:
+            return 0, True
+        counts = self._not_ds_count()
+        if counts[first + length] == counts[first]:
+            return length, True
+        # Some symbols are not double stranded, only the ends matter
+        part = self[start:stop]
+        return length, part.ovhg == 0 and part.watson_ovhg == 0
+
     def get_cutsites(self: DseqType, *enzymes: EnzymesType) -> List[CutSiteType]:
         """Returns a list of cutsites, represented represented as `((cut_watson, ovhg), enz)`:
 
@@ -2281,16 +2467,9 @@ class Dseq(Seq):
             # argument is probably a RestrictionBatch
             enzymes = [e for e in enzymes[0]]
 
-        enzymes = list(dict.fromkeys(flatten(enzymes)))  # remove duplicate enzymes
-        out = list()
-        for e in enzymes:
-            # Positions of the cut on the watson strand. They are 1-based, so we subtract
-            # 1 to get 0-based positions
-            cuts_watson = [c - 1 for c in e.search(self, linear=(not self.circular))]
-
-            out += [((w, e.ovhg), e) for w in cuts_watson]
-
-        return sorted([cutsite for cutsite in out if self.cutsite_is_valid(cutsite)])
+        # The cut sites are found once for each sequence and group of enzymes,
+        # see pydna.restriction_map
+        return restriction_map(self, enzymes).get_cutsites()
 
     def left_end_position(self) -> Tuple[int, int]:
         """
@@ -2958,6 +3137,7 @@ class Dseq(Seq):
             new_cutsite_pairs = deduplicate(new_cutsite_pairs)
         return new_cutsite_pairs
 
+    @_cached_on_data
     def get_parts(self):
         """
         Returns a DseqParts instance containing the parts (strings) of a dsDNA
@@ -14,10 +14,12 @@ from Bio.Restriction import RestrictionBatch
 from Bio.Restriction import CommOnly
 from pydna.dseq import Dseq
 from pydna._pretty import pretty_str
+from pydna.restriction_map import restriction_map
 from pydna.utils import flatten, location_boundaries
 
 from pydna.utils import shift_location
 from pydna.utils import shift_feature
+from pydna.utils import copy_feature
 from pydna.common_sub_strings import common_sub_strings
 from Bio.SeqFeature import SeqFeature
 from Bio import SeqIO
@@ -25,31 +27,26 @@ from Bio.SeqFeature import CompoundLocation
 from Bio.SeqFeature import SimpleLocation
 from pydna.seqrecord import SeqRecord
 from Bio.Seq import translate
-from Bio.Seq import Seq as BPSeq
 import copy
+import io
 import operator
 import os
 import re
 import time
 import datetime
 from typing import Union, TYPE_CHECKING
-from pydna.opencloning_models import (
-    ReverseComplementSource,
-    SequenceCutSource,
-    SourceInput,
-    PCRSource,
-)
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydna.opencloning_models import Source
 
 
-try:
-    from IPython.display import display_html
-except ImportError:
-
-    def display_html(item, raw=None):
+def display_html(item, raw=None):
+    """IPython.display.display_html if IPython is installed, imported on first use."""
+    try:
+        from IPython.display import display_html as _display_html
+    except ImportError:
         return item
+    return _display_html(item, raw=raw)
 
 
 __all__ = ["Dseqrecord"]
@@ -362,6 +359,53 @@ class Dseqrecord(SeqRecord):
         """
         return self.seq.seguid()
 
+    def build_index(self):
+        """Make a search index of the sequence, see :meth:`pydna.dseq.Dseq.build_index`.
+
+        The index is kept by the Dseq object in the seq property, it is not used
+        anymore if the sequence is replaced.
+
+        Examples
+        --------
+        >>> from pydna.dseqrecord import Dseqrecord
+        >>> a = Dseqrecord("aagaattcaa", circular=True)
+        >>> index = a.build_index()
+        >>> a.find(Dseqrecord("AAAAG"))
+        8
+        >>> a.seq.template_index is index
+        True
+        """
+        return self.seq.build_index()
+
+    def detach(self):
+        """
+        Independent copy of the Dseqrecord.
+
+        The copy can be changed without changing this Dseqrecord, as a copy made
+        with ``copy.deepcopy``, but it is made much faster for records with many
+        features. The features are copied with :func:`pydna.utils.copy_feature`
+        and the Dseq object in the seq property is shared, since Dseq methods
+        return new objects. Assign a new Dseq to change the sequence of the copy.
+
+        Examples
+        --------
+        >>> from pydna.dseqrecord import Dseqrecord
+        >>> a = Dseqrecord("aaat", circular=True)
+        >>> a.add_feature(0, 2)
+        >>> b = a.detach()
+        >>> b.features[0].location += 1
+        >>> a.features[0].location
+        SimpleLocation(ExactPosition(0), ExactPosition(2), strand=1)
+        >>> b.seq is a.seq
+        True
+        """
+        # The memo prevents deepcopy from copying the sequence and the features.
+        memo = {
+            id(self.seq): self.seq,
+            id(self.features): [copy_feature(f) for f in self.features],
+        }
+        return copy.deepcopy(self, memo)
+
     def looped(self):
         """
         Circular version of the Dseqrecord object.
@@ -383,7 +427,7 @@ class Dseqrecord(SeqRecord):
         --------
         pydna.dseq.Dseq.looped
         """
-        new = copy.deepcopy(self)
+        new = self.detach()
         new.seq = self.seq.looped()
 
         old_length = len(self)  # Possibly longer, including sticky ends if any.
@@ -449,7 +493,7 @@ class Dseqrecord(SeqRecord):
 
     def terminal_transferase(self, nucleotides="a"):
         """docstring."""
-        newseq = copy.deepcopy(self)
+        newseq = self.detach()
         newseq.seq = self.seq.terminal_transferase(nucleotides)
         for feature in newseq.features:
             feature.location += len(nucleotides)
@@ -508,19 +552,11 @@ class Dseqrecord(SeqRecord):
 
 
         """
-        record = copy.deepcopy(self)
-        if "dscode" in format:
-            format = format.replace("dscode", "")
-            obj = BPSeq("")
-            obj._data = record.seq._data
-            record.seq = obj
-        format = format.strip(" -")
-        if format in ("genbank", "gb") and self.circular:
-            record.annotations["topology"] = "circular"
-        else:
-            record.annotations["topology"] = "linear"
+        from pydna.writers import write_record
 
-        return SeqRecord.format(record, format).strip()
+        handle = io.StringIO()
+        write_record(self, handle, format)
+        return handle.getvalue().strip()
 
     def write(self, filename=None, f="gb"):
         """Writes the Dseqrecord to a file using the format f, which must
@@ -647,6 +683,14 @@ class Dseqrecord(SeqRecord):
         # TODO add tests and docstring for this method
         o = str(other.seq).upper()
 
+        index = self.seq.template_index
+        if index is not None and not index.has_u and 0 < len(o) <= len(self):
+            # The indexed text is the same as the uppercase sequence when it has no U.
+            positions = index.positions(o)
+            return (
+                int(positions[0]) if len(positions) and positions[0] < len(self) else -1
+            )
+
         if not self.circular:
             s = str(self.seq).upper()
         else:
@@ -810,15 +854,18 @@ class Dseqrecord(SeqRecord):
         if hasattr(other, "seq") and hasattr(other.seq, "watson"):
             # other is likely another Dseqrecord with a Dseq object
             # deepcopy is necessary since we will change other's features
-            other = copy.deepcopy(other)
             newseq = self.seq + other.seq
             # offset is the length of the self Dseq object added to the
             # other Dseq object minus the sum of each length
             # offset is <= 0
             offset = len(newseq) - (len(self) + len(other))
-            for f in other.features:
-                # adding an integer to a feature location shifts it.
-                f.location = f.location + offset
+            # other is not changed, a shallow copy gets copies of its features.
+            # adding an integer to a feature location shifts it.
+            shifted_other = copy.copy(other)
+            shifted_other.features = [
+                copy_feature(f, f.location + offset) for f in other.features
+            ]
+            other = shifted_other
         else:
             # If other is not a Dseqrecord with a Dseq object, the Dseq class
             # handles the result of adding for consistency.
@@ -838,7 +885,7 @@ class Dseqrecord(SeqRecord):
         if self.circular:
             raise TypeError("TypeError: can't multiply circular Dseqrecord.")
         if number > 0:
-            new = copy.deepcopy(self)
+            new = self.detach()
             for i in range(1, number):
                 new += self
             new._per_letter_annotations = self._per_letter_annotations
@@ -862,7 +909,7 @@ class Dseqrecord(SeqRecord):
                 sl = slice(sl.start, len(self.seq), sl.step)
             answer.features = super().__getitem__(sl).features
         elif self.circular and sl_start > sl_stop:
-            answer.features = self.shifted(sl_start).features
+            answer.features = self._shifted_features(sl_start)
             # origin-spanning features should only be included after shifting
             # in cases where the slice comprises the entire sequence, but then
             # sl_start == sl_stop and the second condition is not met
@@ -949,7 +996,8 @@ class Dseqrecord(SeqRecord):
     def number_of_cuts(self, *enzymes):
         """The number of cuts by digestion with the Restriction enzymes
         contained in the iterable."""
-        return sum([len(enzyme.search(self.seq)) for enzyme in flatten(enzymes)])
+        enzymes = flatten(enzymes)
+        return restriction_map(self.seq, enzymes).number_of_cuts(*enzymes)
 
     def reverse_complement(self):
         """Reverse complement.
@@ -981,6 +1029,8 @@ class Dseqrecord(SeqRecord):
         answer.id = self.id + "_rc"
         answer.seq.circular = self.seq.circular
         # answer.seq._linear = self.seq.linear
+        from pydna.opencloning_models import ReverseComplementSource, SourceInput
+
         answer.source = ReverseComplementSource(input=[SourceInput(sequence=self)])
         return answer
 
@@ -1099,7 +1149,7 @@ class Dseqrecord(SeqRecord):
         --------
         pydna.dseqrecord.Dseqrecord.lower"""
 
-        upper = copy.deepcopy(self)
+        upper = self.detach()
         # This is because the @seq.setter methods otherwise sets the _per_letter_annotations to an empty dict
         prev_per_letter_annotation = upper._per_letter_annotations
         upper.seq = upper.seq.upper()
@@ -1133,7 +1183,7 @@ class Dseqrecord(SeqRecord):
         pydna.dseqrecord.Dseqrecord.upper
 
         """
-        lower = copy.deepcopy(self)
+        lower = self.detach()
         prev_per_letter_annotation = lower._per_letter_annotations
         lower.seq = lower.seq.lower()
         lower._per_letter_annotations = prev_per_letter_annotation
@@ -1143,30 +1193,17 @@ class Dseqrecord(SeqRecord):
         """docstring."""
         return tuple(Dseqrecord(self[x:y]) for x, y in self.seq.orfs(minsize=minsize))
 
-    def orfs_to_features(self, minsize=300):
-        """docstring."""
-        features = []
-        for strand, s in ((1, self.seq), (-1, self.seq.rc())):
-            for x, y in s.orfs(minsize=minsize):
-                orf = self[x:y]
-                prt = orf.translate()
-                features.append(
-                    SeqFeature(
-                        SimpleLocation(x, y, strand=strand),
-                        type="CDS",
-                        qualifiers={
-                            "note": f"{y - x}bp {(y - x) // 3}aa",
-                            "checksum": [
-                                orf.seguid() + " (DNA)",
-                                prt.seguid() + " (protein)",
-                            ],
-                            "codon_start": 1,
-                            "transl_table": 11,
-                            "translation": str(prt.seq),
-                        },
-                    )
-                )
-        return features
+    def orfs_to_features(
+        self, minsize=300, startcodons=("ATG",), stopcodons=None, table=11
+    ):
+        """A CDS feature for each ORF on both strands.
+
+        See :func:`pydna.orf_finder.orf_features`, that makes the features one
+        at a time.
+        """
+        from pydna.orf_finder import orf_features
+
+        return list(orf_features(self, minsize, startcodons, stopcodons, table))
 
     def _copy_to_clipboard(self, sequence_format):
         """docstring."""
@@ -1364,18 +1401,28 @@ class Dseqrecord(SeqRecord):
             )
         ln = len(self)
         if not shift % ln:
-            return copy.deepcopy(self)  # shift is a multiple of ln or 0
+            return self.detach()  # shift is a multiple of ln or 0
         else:
             shift %= ln  # 0<=shift<=ln
         newseq = (self.seq[shift:] + self.seq[:shift]).looped()
-        newfeatures = copy.deepcopy(self.features)
-        for feature in newfeatures:
-            feature.location = shift_location(feature.location, -shift, ln)
+        newfeatures = self._shifted_features(shift)
+        # The features and the sequence are replaced in the copy, the memo
+        # prevents them from being deep copied first.
+        memo = {id(self.features): newfeatures, id(self.seq): newseq}
+        return copy.deepcopy(self, memo)
+
+    def _shifted_features(self, shift):
+        """Copies of the features for a new origin at shift, sorted by start (see shifted)."""
+        ln = len(self)
+        if not shift % ln:
+            return [copy_feature(f) for f in self.features]
+        shift %= ln
+        newfeatures = [
+            copy_feature(f, shift_location(f.location, -shift, ln))
+            for f in self.features
+        ]
         newfeatures.sort(key=operator.attrgetter("location.start"))
-        answer = copy.deepcopy(self)
-        answer.features = newfeatures
-        answer.seq = newseq
-        return answer
+        return newfeatures
 
     def cut(self, *enzymes):
         """Digest a Dseqrecord object with one or more restriction enzymes.
@@ -1426,7 +1473,7 @@ class Dseqrecord(SeqRecord):
         if left_cut == right_cut:
             # Not really a cut, but to handle the general case
             if left_cut is None:
-                features = copy.deepcopy(self.features)
+                features = [copy_feature(f) for f in self.features]
             else:
                 # The features that span the origin if shifting with left_cut, but that do not cross
                 # the cut site should be included, and if there is a feature within the cut site, it should
@@ -1512,6 +1559,8 @@ class Dseqrecord(SeqRecord):
             right_edge = right_watson if right_ovhg > 0 else right_crick
             features = self[left_edge:right_edge].features
 
+        from pydna.opencloning_models import SequenceCutSource
+
         # This will need to be generalised to all types of cuts
         source = SequenceCutSource.from_parent(self, left_cut, right_cut)
         result = Dseqrecord(dseq, features=features, source=source)
@@ -1633,4 +1682,8 @@ class Dseqrecord(SeqRecord):
 
     def is_amplicon(self):
         """Returns True if the sequence is the product of a PCR"""
-        return self.source is not None and isinstance(self.source, PCRSource)
+        if self.source is None:
+            return False
+        from pydna.opencloning_models import PCRSource
+
+        return isinstance(self.source, PCRSource)
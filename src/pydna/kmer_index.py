@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Approximate string matching with a k-mer index.
+
+:func:`hamming_search` finds all the positions where a query matches a
+subject with at most a given number of substitutions (Hamming distance).
+It gives the same positions as the fuzzy regex
+``regex.finditer("(query){s<=k}", subject, overlapped=True)``, but
+it is much faster for long subjects.
+
+The query is split in k + 1 parts. If the query matches a position of the
+subject with k mismatches or less, at least one of the parts matches exactly
+(pigeonhole principle). The positions where each part matches exactly are
+looked up in a :class:`KmerIndex` of the subject, and only those positions
+are compared with the full query.
+
+The index can be reused for many queries against the same subject.
+"""
+
+import numpy as np
+
+# 2-bit codes of the nucleotides, 255 for other characters
+_codes = np.full(256, 255, dtype=np.uint8)
+for _code, _letters in enumerate(("Aa", "Cc", "Gg", "Tt")):
+    for _letter in _letters:
+        _codes[ord(_letter)] = _code
+
+_letter_codes = {chr(c): int(_codes[c]) for c in range(256) if _codes[c] != 255}
+
+# Maximum k that fits in the 64 bit keys of the index
+max_k = 31
+
+
+def _ascii_array(text: str) -> np.ndarray:
+    """One byte per character, characters other than ASCII become '?'."""
+    return np.frombuffer(text.encode("ascii", errors="replace"), dtype=np.uint8)
+
+
+def nucleotide_codes(text: str | bytes) -> np.ndarray:
+    """
+    2-bit code of each character of text, as in the keys of a
+    :class:`KmerIndex` (A=0, C=1, G=2, T=3, upper or lower case), 255 for
+    other characters.
+
+    >>> from pydna.kmer_index import nucleotide_codes
+    >>> nucleotide_codes("ACgtN").tolist()
+    [0, 1, 2, 3, 255]
+    """
+    if isinstance(text, str):
+        return _codes[_ascii_array(text)]
+    return _codes[np.frombuffer(text, dtype=np.uint8)]
+
+
+def kmer_key(kmer: str) -> int | None:
+    """
+    Integer key of a k-mer in a :class:`KmerIndex`, or None if kmer contains
+    characters other than ACGT. Each nucleotide is two bits, the first
+    nucleotide in the highest bits.
+
+    >>> from pydna.kmer_index import kmer_key
+    >>> kmer_key("AC"), kmer_key("CA"), kmer_key("ACN")
+    (1, 4, None)
+    """
+    key = 0
+    for letter in kmer:
+        code = _letter_codes.get(letter)
+        if code is None:
+            return None
+        key = (key << 2) | code
+    return key
+
+
+class KmerIndex:
+    """
+    Positions of all the k-mers of a DNA string.
+
+    Only k-mers made of A, C, G and T (upper or lower case) are indexed.
+
+    >>> from pydna.kmer_index import KmerIndex
+    >>> index = KmerIndex("ACGTTACGTN", 3)
+    >>> index.find("ACG")
+    [0, 5]
+    >>> index.find("GTN") is None
+    True
+
+    Parameters
+    ----------
+    text : str
+        The string to index.
+    k : int
+        Length of the k-mers, between 1 and 31.
+    """
+
+    def __init__(self, text: str, k: int):
+        if not 1 <= k <= max_k:
+            raise ValueError(f"k must be between 1 and {max_k}")
+        self.k = k
+        self.text = text
+
+        codes = nucleotide_codes(text)
+        number_of_kmers = len(text) - k + 1
+        if number_of_kmers < 1:
+            self._keys = np.empty(0, dtype=np.uint64)
+            self._positions = np.empty(0, dtype=np.int64)
+            return
+
+        # Number of characters that are not ACGT in each k-mer
+        invalid = np.concatenate(([0], np.cumsum(codes == 255)))
+        valid = (invalid[k:] - invalid[:-k]) == 0
+
+        codes = np.where(codes == 255, 0, codes).astype(np.uint64)
+        keys = np.zeros(number_of_kmers, dtype=np.uint64)
+        for j in range(k):
+            keys = (keys << np.uint64(2)) | codes[j : j + number_of_kmers]
+
+        positions = np.flatnonzero(valid)
+        keys = keys[positions]
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._positions = positions[order]
+
+    def _key(self, kmer: str) -> int | None:
+        if len(kmer) != self.k:
+            return None
+        return kmer_key(kmer)
+
+    def positions(self, kmer: str) -> np.ndarray | None:
+        """Sorted array of the positions of kmer in the text, or None if kmer
+        contains characters other than ACGT and cannot be looked up."""
+        key = self._key(kmer)
+        if key is None:
+            return None
+        key = np.uint64(key)
+        lo = np.searchsorted(self._keys, key, side="left")
+        hi = np.searchsorted(self._keys, key, side="right")
+        return self._positions[lo:hi]
+
+    def find(self, kmer: str) -> list[int] | None:
+        """Same as positions, but returns a list."""
+        positions = self.positions(kmer)
+        return None if positions is None else positions.tolist()
+
+    def lookup(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Positions of many k-mers at once.
+
+        >>> from pydna.kmer_index import KmerIndex, kmer_key
+        >>> index = KmerIndex("ACGTTACGTN", 3)
+        >>> positions, found = index.lookup([kmer_key("CGT"), kmer_key("AAA"), kmer_key("ACG")])
+        >>> positions.tolist(), found.tolist()
+        ([1, 6, 0, 5], [0, 0, 2, 2])
+
+        Parameters
+        ----------
+        keys : array of int
+            The k-mers, as keys from :func:`kmer_key`.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The positions of the k-mers, and the index in keys of the
+            k-mer found at each position.
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        lo = np.searchsorted(self._keys, keys, side="left")
+        hi = np.searchsorted(self._keys, keys, side="right")
+        counts = hi - lo
+        found = np.repeat(np.arange(len(keys)), counts)
+        # Index in self._positions: lo of each key plus 0, 1, 2 ... for its hits
+        steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return self._positions[np.repeat(lo, counts) + steps], found
+
+
+def _find_all(substring: str, text: str) -> np.ndarray:
+    """Positions of all (overlapping) occurrences of substring in text."""
+    out = []
+    position = text.find(substring)
+    while position != -1:
+        out.append(position)
+        position = text.find(substring, position + 1)
+    return np.array(out, dtype=np.int64)
+
+
+def hamming_search(
+    query: str,
+    subject: str,
+    mismatches: int = 0,
+    indices: dict[int, KmerIndex] | None = None,
+) -> list[int]:
+    """
+    Start positions where query matches subject with at most `mismatches`
+    substitutions. Comparisons are case sensitive.
+
+    >>> from pydna.kmer_index import hamming_search
+    >>> hamming_search("ACGTAC", "TTACGTACTTACCTACTT", 0)
+    [2]
+    >>> hamming_search("ACGTAC", "TTACGTACTTACCTACTT", 1)
+    [2, 6, 10]
+
+    Parameters
+    ----------
+    query : str
+        The string to search for.
+    subject : str
+        The string to search in.
+    mismatches : int, optional
+        Maximum number of substitutions. The default is 0.
+    indices : dict[int, KmerIndex], optional
+        KmerIndex of the subject for each k. The indices that are needed
+        and missing are made and added to the dict, so that they can be
+        reused in the next searches in the same subject.
+
+    Returns
+    -------
+    list[int]
+        Sorted start positions.
+    """
+    m = len(query)
+    n = len(subject)
+    if m > n:
+        return []
+    if mismatches >= m:
+        return list(range(n - m + 1))
+
+    parts = mismatches + 1
+    part_length = m // parts
+    k = min(part_length, max_k)
+
+    if indices is None:
+        indices = dict()
+    if k not in indices:
+        indices[k] = KmerIndex(subject, k)
+    index = indices[k]
+
+    candidates = []
+    for i in range(parts):
+        offset = i * part_length
+        seed = query[offset : offset + k]
+        positions = index.positions(seed)
+        if positions is None:
+            # Seeds with other characters than ACGT are not indexed
+            positions = _find_all(seed, subject)
+        candidates.append(positions - offset)
+    candidates = np.unique(np.concatenate(candidates))
+    candidates = candidates[(candidates >= 0) & (candidates <= n - m)]
+
+    # Verification, in chunks to limit the memory used
+    subject_bytes = _ascii_array(subject)
+    query_bytes = _ascii_array(query)
+    window = np.arange(m)
+    chunk = max(1, 2**20 // m)
+    out = []
+    for start in range(0, len(candidates), chunk):
+        starts = candidates[start : start + chunk]
+        distances = (subject_bytes[starts[:, None] + window] != query_bytes).sum(axis=1)
+        out.extend(starts[distances <= mismatches].tolist())
+    return out
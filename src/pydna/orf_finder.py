@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Open reading frames (ORFs) in all six frames.
+
+Each codon of the sequence is encoded as an integer with NumPy, for the
+codons starting at every position of both strands at once. The ORFs are
+found from the positions of the start and stop codons in each frame, without
+Python loops over the codons.
+
+:func:`find_orfs` yields the ORFs and :func:`orf_features` yields a CDS
+feature for each ORF. They are used by :func:`pydna.utils.three_frame_orfs`,
+:meth:`pydna.seq.Seq.orfs`, :meth:`pydna.seq.Seq.orfs2` and
+:meth:`pydna.dseqrecord.Dseqrecord.orfs_to_features`.
+
+>>> from pydna.orf_finder import find_orfs
+>>> list(find_orfs("ccATGAAATAGccCTATTTCATgg", minsize=9))
+[(1, 2, 2, 11), (-1, 2, 13, 22)]
+>>> list(find_orfs("ccATGAAATAGccCTATTTCATgg", minsize=9, strands=[-1]))
+[(-1, 2, 13, 22)]
+"""
+
+import base64
+import hashlib
+import re
+from typing import Iterable, Iterator
+
+import numpy as np
+from Bio.Data import CodonTable
+from Bio.Seq import translate
+from Bio.SeqFeature import SeqFeature, SimpleLocation
+from seguid import ldseguid
+
+from pydna.kmer_index import kmer_key, nucleotide_codes
+from pydna.utils import rc
+
+# Codes of the codons, a codon with other letters than ACGT is 64
+_invalid_codon = 64
+standard_startcodons = ("ATG",)
+standard_stopcodons = ("TAG", "TAA", "TGA")
+_acgt = re.compile("[ACGT]+")
+
+
+def _codon_table(table: int | str) -> CodonTable.CodonTable:
+    """A Biopython DNA codon table from its NCBI number or name."""
+    if isinstance(table, int):
+        return CodonTable.unambiguous_dna_by_id[table]
+    return CodonTable.unambiguous_dna_by_name[table]
+
+
+def _codon_codes(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Code of the codon starting at each position of the watson strand, and of
+    each position of the crick strand (counted from the 5' end of the crick
+    strand).
+    """
+    codes = nucleotide_codes(data).astype(np.int64)
+    if len(codes) < 3:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    first, second, third = codes[:-2], codes[1:-1], codes[2:]
+    invalid = (first == 255) | (second == 255) | (third == 255)
+    # A=0, C=1, G=2 and T=3, so the complement of a code x is 3 - x
+    watson = np.where(invalid, _invalid_codon, first * 16 + second * 4 + third)
+    crick = np.where(
+        invalid, _invalid_codon, (3 - third) * 16 + (3 - second) * 4 + (3 - first)
+    )
+    return watson, crick[::-1]
+
+
+def _keys(codons: Iterable[str]) -> np.ndarray:
+    """Codes of codons, codons with other letters than ACGT are ignored."""
+    keys = [kmer_key(codon) for codon in codons if len(codon) == 3]
+    return np.array([k for k in keys if k is not None], dtype=np.int64)
+
+
+def _frame_orfs(
+    codes: np.ndarray,
+    startcodons: np.ndarray,
+    stopcodons: np.ndarray,
+    offset: int = 1,
+    min_length: int = 0,
+    nested: bool = True,
+) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Frame, start and end positions of the ORFs in the codon codes of one strand.
+
+    The ORF of a start codon ends with the first stop codon in the same frame
+    at least offset bases after the start codon. Only ORFs of at least
+    min_length bases are kept. If nested is False, only the ORF of the first
+    start codon is kept for each stop codon.
+    """
+    starts = np.flatnonzero(np.isin(codes, startcodons))
+    stops = np.flatnonzero(np.isin(codes, stopcodons))
+    for frame in (0, 1, 2):
+        frame_starts = starts[starts % 3 == frame]
+        frame_stops = stops[stops % 3 == frame]
+        index = np.searchsorted(frame_stops, frame_starts + offset)
+        found = index < len(frame_stops)
+        frame_starts = frame_starts[found]
+        ends = frame_stops[index[found]] + 3
+        if not nested:
+            ends, first = np.unique(ends, return_index=True)
+            frame_starts = frame_starts[first]
+        keep = ends - frame_starts >= min_length
+        yield frame, frame_starts[keep], ends[keep]
+
+
+def _as_bytes(dna) -> bytes:
+    """The letters of a str, bytes or sequence object."""
+    data = getattr(dna, "_data", dna)
+    if isinstance(data, str):
+        return data.encode("ascii", errors="replace")
+    return bytes(data)
+
+
+def _checksum(prefix: str, text: str) -> str:
+    """SEGUID checksum as from the seguid package, without checking the letters."""
+    digest = hashlib.sha1(text.encode("ascii")).digest()
+    return prefix + base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+
+def find_orfs(
+    dna,
+    minsize: int = 100,
+    startcodons: Iterable[str] | None = standard_startcodons,
+    stopcodons: Iterable[str] | None = None,
+    table: int | str | None = None,
+    strands: Iterable[int] = (1, -1),
+    nested: bool = True,
+    offset: int = 1,
+) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Open reading frames in the six frames of a sequence.
+
+    An ORF starts with a start codon and ends with the first stop codon after
+    it in the same frame. Each start codon starts an ORF, so ORFs can be
+    nested in longer ORFs with the same stop codon. The sequence is read as
+    linear.
+
+    Parameters
+    ----------
+    dna : str, bytes, Bio.Seq.Seq or Dseq
+        The sequence.
+    minsize : int, optional
+        Smallest ORF size in bp, including the stop codon. It is rounded up
+        to whole codons. The default is 100.
+    startcodons, stopcodons : iterable of str, optional
+        The start and stop codons, upper or lower case. If None, the codons of
+        the genetic table are used. The default start codon is ATG, and the
+        default stop codons are the ones of the table.
+    table : int or str, optional
+        NCBI number or name of a genetic table. The default is the standard
+        table.
+    strands : iterable of int, optional
+        1 for the watson strand and -1 for the crick strand. The default is both.
+    nested : bool, optional
+        If False, only the longest ORF ending with each stop codon is returned.
+    offset : int, optional
+        The stop codon is the first one in frame at least offset bases after
+        the start of the start codon. The default is 1, the first stop codon
+        after the start codon.
+
+    Yields
+    ------
+    tuple[int, int, int, int]
+        Strand, frame, start and end of each ORF. The frame is counted from the
+        5' end of the strand. Start and end are positions in the watson
+        strand, ``dna[start:end]`` (reverse complemented for strand -1) is the
+        ORF. The ORFs are yielded for strand 1, then -1, and by frame and
+        position in the strand.
+    """
+    codon_table = _codon_table(1 if table is None else table)
+    if startcodons is None:
+        startcodons = codon_table.start_codons
+    if stopcodons is None:
+        stopcodons = codon_table.stop_codons
+    startcodons = _keys(codon.upper() for codon in startcodons)
+    stopcodons = _keys(codon.upper() for codon in stopcodons)
+    min_length = 3 * -(-minsize // 3)
+
+    data = _as_bytes(dna)
+    length = len(data)
+    watson, crick = _codon_codes(data)
+    for strand in strands:
+        codes = watson if strand == 1 else crick
+        for frame, starts, ends in _frame_orfs(
+            codes, startcodons, stopcodons, offset, min_length, nested
+        ):
+            if strand == 1:
+                for start, end in zip(starts.tolist(), ends.tolist()):
+                    yield strand, frame, start, end
+            else:
+                for start, end in zip(starts.tolist(), ends.tolist()):
+                    yield strand, frame, length - end, length - start
+
+
+def orf_features(
+    dna,
+    minsize: int = 300,
+    startcodons: Iterable[str] | None = standard_startcodons,
+    stopcodons: Iterable[str] | None = None,
+    table: int | str = 11,
+    nested: bool = True,
+) -> Iterator[SeqFeature]:
+    """
+    A CDS feature for each ORF in a sequence, see :func:`find_orfs`.
+
+    The features are made one at a time, as they are needed.
+
+    >>> from pydna.orf_finder import orf_features
+    >>> feature, = orf_features("ccATGAAATAGcc", minsize=9)
+    >>> feature.location, feature.qualifiers["translation"]
+    (SimpleLocation(ExactPosition(2), ExactPosition(11), strand=1), 'MK')
+
+    Parameters
+    ----------
+    dna : str, Bio.Seq.Seq, Dseq or Dseqrecord
+        The sequence.
+    minsize, startcodons, stopcodons, nested
+        See :func:`find_orfs`.
+    table : int or str, optional
+        The genetic table, used for the stop codons and the translation.
+        The default is 11.
+
+    Yields
+    ------
+    Bio.SeqFeature.SeqFeature
+    """
+    from pydna.seq import ProteinSeq
+
+    if hasattr(dna, "seq"):
+        dna = dna.seq
+    text = _as_bytes(dna).decode("ascii")
+    for strand, _, start, end in find_orfs(
+        text, minsize, startcodons, stopcodons, table, nested=nested
+    ):
+        orf = text[start:end] if strand == 1 else rc(text[start:end])
+        protein = translate(orf, table=table, to_stop=True)
+        watson = orf.upper()
+        crick = rc(watson)
+        if _acgt.fullmatch(watson) and protein:
+            # The letters are known to be valid, the seguid package checks
+            # them one by one.
+            dna_checksum = _checksum("ldseguid=", ";".join(sorted((watson, crick))))
+            protein_checksum = _checksum("lsseguid=", protein)
+        else:
+            dna_checksum = ldseguid(watson, crick, alphabet="{DNA-extended},AU")
+            protein_checksum = ProteinSeq(protein).seguid()
+        yield SeqFeature(
+            SimpleLocation(start, end, strand=strand),
+            type="CDS",
+            qualifiers={
+                "note": f"{end - start}bp {(end - start) // 3}aa",
+                "checksum": [dna_checksum + " (DNA)", protein_checksum + " (protein)"],
+                "codon_start": 1,
+                "transl_table": table,
+                "translation": protein,
+            },
+        )
@@ -3,19 +3,23 @@
 # SPDX-FileCopyrightText: 2023-2026 The Project Contributors
 # SPDX-License-Identifier: BSD-3-Clause
 
-"""Provides two functions, parse and parse_primers"""
+"""Provides the functions parse, iparse, parse_files and parse_primers"""
 
 import re
 import io
+import codecs
+import glob
 import textwrap
 import os
 from Bio import SeqIO
 from Bio.SeqIO.InsdcIO import GenBankScanner, GenBankIterator
 import warnings
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator
 
 from pydna.dseqrecord import Dseqrecord
 from Bio.SeqRecord import SeqRecord
-from pydna.opencloning_models import UploadedFileSource
 from pydna.primer import Primer
 
 
@@ -138,6 +142,27 @@ def parse_genbank(handle: io.StringIO) -> SeqRecord:
         return next(CustomGenBankIterator(filtered_handle))
 
 
+def _read_embl(handle):
+    return SeqIO.read(handle, "embl")
+
+
+def _read_fasta(handle):
+    return SeqIO.read(handle, "fasta-blast")
+
+
+def _sniff(first_line):
+    """Formats to try for a chunk, the most likely first. At most one of them can
+    read the chunk, so the order only changes how many parsers are tried."""
+    if first_line.startswith(">"):
+        return ("fasta", "embl", "genbank")
+    if first_line.startswith("LOCUS"):
+        return ("genbank", "embl", "fasta")
+    return ("embl", "genbank", "fasta")
+
+
+_chunk_readers = {"embl": _read_embl, "genbank": parse_genbank, "fasta": _read_fasta}
+
+
 def embl_gb_fasta(text):
     """Parse embl, genbank or fasta format from text.
 
@@ -151,32 +176,23 @@ def embl_gb_fasta(text):
     result_list = []
 
     for chunk in chunks:
-        handle = io.StringIO(chunk)
-        first_line = chunk.splitlines()[0].lower().split()
-        try:
-            parsed = SeqIO.read(handle, "embl")
-            parsed.annotations["pydna_parse_sequence_file_format"] = "embl"
-        except ValueError:
-            handle.seek(0)
+        first_line = chunk.splitlines()[0]
+        for sequence_file_format in _sniff(first_line):
             try:
-                parsed = parse_genbank(handle)
-                parsed.annotations["pydna_parse_sequence_file_format"] = "genbank"
+                with io.StringIO(chunk) as handle:
+                    parsed = _chunk_readers[sequence_file_format](handle)
             except ValueError:
-                handle.seek(0)
-                try:
-                    parsed = SeqIO.read(handle, "fasta-blast")
-                    parsed.annotations["pydna_parse_sequence_file_format"] = "fasta"
-                except ValueError:
-                    handle.close()
-                    continue
-                else:
-                    # molecule_type is not set by the Biopython FASTA parser
-                    parsed.annotations["molecule_type"] = "DNA"
-        handle.close()
+                continue
+            break
+        else:
+            continue
+        parsed.annotations["pydna_parse_sequence_file_format"] = sequence_file_format
+        if sequence_file_format == "fasta":
+            # molecule_type is not set by the Biopython FASTA parser
+            parsed.annotations["molecule_type"] = "DNA"
         # hack to pick up topology from FASTA and malformed gb files
-        first_line = chunk.splitlines()[0].lower().split()
         parsed.annotations["topology"] = "linear"
-        if "circular" in first_line:
+        if "circular" in first_line.lower().split():
             parsed.annotations["topology"] = "circular"
         molecule_type = parsed.annotations.get("molecule_type")
         assert molecule_type, "molecule_type must be set"
@@ -275,6 +291,251 @@ def parse(data, ds=True, is_path=None) -> list[Dseqrecord | SeqRecord]:
     return sequences
 
 
+def _record_blocks(lines):
+    """Split lines of text into blocks with at most one sequence each.
+
+    A block starts at a line starting with ">", "LOCUS" or "ID". An EMBL or
+    Genbank record is not split before the line starting with "//". The
+    blocks give the same sequences with :func:`embl_gb_fasta` as the whole text.
+    """
+    block = []
+    in_record = False
+    for line in lines:
+        stripped = line.lstrip()
+        if in_record:
+            block.append(line)
+            if stripped.startswith("//"):
+                yield "".join(block)
+                block = []
+                in_record = False
+        elif stripped.startswith((">", "LOCUS", "ID")):
+            if block:
+                yield "".join(block)
+            block = [line]
+            in_record = not stripped.startswith(">")
+        else:
+            block.append(line)
+    if block:
+        yield "".join(block)
+
+
+def _is_text_file(path) -> bool:
+    """True if the start of a file is UTF-8 text. Binary files, such as ABIF
+    traces (.ab1) and SnapGene files (.dna), are not."""
+    with open(path, "rb") as f:
+        start = f.read(8192)
+    if b"\0" in start:
+        return False
+    try:
+        # Not final, the last character can be cut by the read
+        codecs.getincrementaldecoder("utf-8")().decode(start)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _expand_path(item) -> list[str] | None:
+    """Text files of a directory, text files matching a glob pattern, the path
+    of a file or None if item is not a path."""
+    if isinstance(item, bytes):
+        item = item.decode("utf-8")
+    item = os.fspath(item)
+    if os.path.isdir(item):
+        paths = (entry.path for entry in os.scandir(item) if entry.is_file())
+    elif os.path.isfile(item):
+        return [item]
+    elif glob.has_magic(item) and "\n" not in item:
+        paths = (path for path in glob.glob(item) if os.path.isfile(path))
+    else:
+        return None
+    return sorted(path for path in paths if _is_text_file(path))
+
+
+def _as_items(data):
+    if not hasattr(data, "__iter__") or isinstance(data, (str, bytes)):
+        return (data,)
+    if hasattr(data, "readline"):
+        return (data,)
+    return data
+
+
+def _iparse_sources(data):
+    """Pairs of (path or None, iterable of lines) for each item in data (see iparse)."""
+    for item in _as_items(data):
+        if hasattr(item, "readline"):
+            yield None, item
+            continue
+        paths = _expand_path(item)
+        if paths is None:
+            yield None, io.StringIO(os.fspath(item))
+            continue
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                yield path, f
+
+
+def iparse(data, ds=True) -> Iterator[Dseqrecord | SeqRecord]:
+    """Yield the DNA sequences found in data, one at a time.
+
+    The same sequences are found as with :func:`parse`, but the files are read
+    one record at a time, so that large multi-record files can be parsed without
+    reading them into memory. The format of each record is guessed from its
+    first line.
+
+    >>> from pydna.parsers import iparse
+    >>> records = iparse(">a\\nACGT\\n>b circular\\nGGCC\\n")
+    >>> next(records)
+    Dseqrecord(-4)
+    >>> next(records)
+    Dseqrecord(o4)
+
+    Parameters
+    ----------
+    data : str, path, file handle or iterable
+        A path to a file or directory, a glob pattern (e.g. ``"seqs/*.gb"``),
+        an open file handle in text mode or a string containing sequences in EMBL,
+        Genbank or FASTA format. Directories are not read recursively, and binary
+        files in a directory or matching a glob pattern (e.g. ABIF traces) are
+        skipped. Can also be an iterable of these.
+
+    ds : bool
+        If True double stranded :class:`Dseqrecord` objects are returned.
+        If False single stranded :class:`Bio.SeqRecord.SeqRecord` objects are
+        returned.
+
+    Yields
+    ------
+    Dseqrecord or SeqRecord
+
+    See Also
+    --------
+    parse
+    """
+    for path, lines in _iparse_sources(data):
+        index_in_file = 0
+        for block in _record_blocks(lines):
+            for s in embl_gb_fasta(block):
+                if not ds:
+                    yield s
+                    continue
+                result = Dseqrecord.from_SeqRecord(s)
+                if path:
+                    from pydna.opencloning_models import UploadedFileSource
+
+                    result.source = UploadedFileSource(
+                        file_name=str(path),
+                        sequence_file_format=s.annotations[
+                            "pydna_parse_sequence_file_format"
+                        ],
+                        index_in_file=index_in_file,
+                    )
+                index_in_file += 1
+                yield result
+
+
+def _parse_file_task(path, ds):
+    """Records of a file, or the exception raised when parsing it (see parse_files)."""
+    try:
+        return path, list(iparse(path, ds=ds)), None
+    except Exception as error:
+        return path, None, error
+
+
+def parse_files(
+    data,
+    ds=True,
+    workers: int | None = None,
+    ordered: bool = True,
+    errors: list | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> Iterator[tuple[str, list[Dseqrecord | SeqRecord]]]:
+    """Parse many sequence files, optionally in a pool of processes.
+
+    Each file is parsed with :func:`iparse`, and the records of each file are
+    yielded together with its path.
+
+    >>> import os, tempfile
+    >>> from pydna.parsers import parse_files
+    >>> folder = tempfile.mkdtemp()
+    >>> with open(os.path.join(folder, "a.fasta"), "w") as f:
+    ...     _ = f.write(">a\\nACGT\\n>b\\nGGCC\\n")
+    >>> for path, records in parse_files(folder):
+    ...     print(os.path.basename(path), records)
+    a.fasta [Dseqrecord(-4), Dseqrecord(-4)]
+
+    Parameters
+    ----------
+    data : str, path or iterable
+        A path to a file or directory, a glob pattern (e.g. ``"seqs/*.gb"``) or
+        an iterable of these. Directories are not read recursively, and binary
+        files in a directory or matching a glob pattern are skipped.
+    ds : bool
+        If True :class:`Dseqrecord` objects are returned, otherwise
+        :class:`Bio.SeqRecord.SeqRecord` objects.
+    workers : int, optional
+        If larger than 1, the files are parsed in a pool of this many processes.
+    ordered : bool, optional
+        If True (default), the files are yielded in the order of data, otherwise
+        as soon as they are parsed. Only has an effect if workers is larger than 1.
+    errors : list, optional
+        If given, a (path, exception) tuple is appended to this list for each file
+        that could not be parsed, and the other files are still parsed. By default,
+        the first error is raised.
+    progress : callable, optional
+        Called with the number of files parsed so far and the total number of
+        files, each time a file is parsed.
+
+    Yields
+    ------
+    tuple[str, list]
+        The path of each file and the records found in it.
+
+    See Also
+    --------
+    iparse
+    """
+    paths = []
+    for item in _as_items(data):
+        expanded = _expand_path(item)
+        if expanded is None:
+            raise FileNotFoundError(f"No such file or directory: {item!r}")
+        paths.extend(expanded)
+    total = len(paths)
+
+    if workers is None or workers < 2 or total < 2:
+        results = (_parse_file_task(path, ds) for path in paths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        if ordered:
+            results = executor.map(
+                _parse_file_task,
+                paths,
+                itertools.repeat(ds),
+                chunksize=max(1, total // (4 * workers)),
+            )
+        else:
+            results = (
+                future.result()
+                for future in as_completed(
+                    [executor.submit(_parse_file_task, path, ds) for path in paths]
+                )
+            )
+    try:
+        for done, (path, records, error) in enumerate(results, 1):
+            if progress is not None:
+                progress(done, total)
+            if error is not None:
+                if errors is None:
+                    raise error
+                errors.append((path, error))
+                continue
+            yield path, records
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 def parse_primers(data):
     """docstring."""
     return [Primer(x) for x in parse(data, ds=False)]
@@ -319,6 +580,8 @@ def parse_snapgene(
         )
         parsed_seq.annotations["pydna_parse_sequence_file_format"] = "snapgene"
 
+        from pydna.opencloning_models import UploadedFileSource
+
         source = UploadedFileSource(
             file_name=file_name,
             sequence_file_format="snapgene",
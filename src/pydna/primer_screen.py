@@ -18,13 +18,17 @@ or :class:`Bio.SeqRecord.SeqRecord`.
 The Aho-Corasick algorithm efficiently finds all occurrences of a set of sequences
 within a larger text. If the same primer list is used repeatedly, creating an
 automaton greatly speeds up repeated searches. See :func:`make_automaton` for
-information on creating, saving, and loading such automata.
+information on creating, saving, and loading such automata, and
+:class:`AutomatonCache` for a cache of automata on disk.
 
 Functions
 ---------
 
+- :func:`make_automaton`
+- :class:`AutomatonCache`
 - :func:`forward_primers`
 - :func:`reverse_primers`
+- :func:`screen_sequences`
 - :func:`primer_pairs`
 - :func:`flanking_primer_pairs`
 - :func:`diff_primer_pairs`
@@ -42,12 +46,22 @@ This module uses `pyahocorasick`:
     PyPI: https://pypi.python.org/pypi/pyahocorasick
 """
 
+import hashlib
+import os
+import pickle
+import tempfile
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as package_version
 from operator import attrgetter
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from itertools import product
 from itertools import combinations
 from collections import defaultdict
 from collections import namedtuple
 from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Sequence
 
 from pydna.dseqrecord import Dseqrecord
@@ -55,6 +69,7 @@ from pydna.primer import Primer
 from pydna.utils import _directed_interval_overlap
 
 import ahocorasick
+import numpy as np
 
 import warnings
 
@@ -72,6 +87,20 @@ amplicon_tuple = namedtuple(
 )
 primer_tuple = namedtuple(typename="primer_tuple", field_names="seq, fp, rp, size")
 
+# Structured array version of amplicon_tuple, see primer_pairs
+amplicon_dtype = np.dtype(
+    [(name, np.int64) for name in amplicon_tuple._fields],
+)
+# Rows returned by screen_sequences
+binding_dtype = np.dtype(
+    [
+        ("sequence", np.int64),
+        ("primer", np.int64),
+        ("strand", np.int8),
+        ("position", np.int64),
+    ]
+)
+
 
 def contained(a: int, b: int, x: int, y: int, L: int, circular=True) -> bool:
     """
@@ -223,6 +252,8 @@ def make_automaton(
         # use automaton
         fps = forward_primers(template, primer_list, automaton=atm)
 
+    :class:`AutomatonCache` does this automatically.
+
 
     Parameters
     ----------
@@ -261,6 +292,186 @@ def make_automaton(
     return automaton
 
 
+class AutomatonCache:
+    """
+    Cache of automata made by :func:`make_automaton`, stored on disk.
+
+    The automata are stored in `directory` under a key that is a hash of the
+    sequences in the primer list (in order), the limit and the versions of
+    the cache format and pyahocorasick. If the primer list changes, a new
+    automaton is made. The least recently used automata are deleted when
+    there are more than `max_entries` files or when they take more than
+    `max_bytes` in total.
+
+    The cache can be passed instead of an automaton to :func:`forward_primers`,
+    :func:`reverse_primers`, :func:`primer_pairs`, :func:`flanking_primer_pairs`,
+    :func:`diff_primer_pairs`, and :func:`diff_primer_triplets`:
+
+    ::
+
+        from pydna.primer_screen import AutomatonCache, primer_pairs
+
+        cache = AutomatonCache()
+        pairs = primer_pairs(template, primer_list, automaton=cache)
+
+
+    Parameters
+    ----------
+    directory : str | os.PathLike, optional
+        Folder where the automata are stored. The default is the
+        "primer_automata" folder in the folder given by the environment
+        variable pydna_data_dir, or in ~/.cache/pydna if it is not set.
+    max_entries : int, optional
+        Maximum number of automata kept on disk. The default is 32.
+    max_bytes : int, optional
+        Maximum size of all automata on disk. The default is 1 GiB.
+
+    """
+
+    version = 1
+
+    def __init__(
+        self,
+        directory: str | os.PathLike = None,
+        max_entries: int = 32,
+        max_bytes: int = 2**30,
+    ):
+        if directory is None:
+            data_dir = os.environ.get("pydna_data_dir") or os.path.join(
+                os.path.expanduser("~"), ".cache", "pydna"
+            )
+            directory = os.path.join(data_dir, "primer_automata")
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # The last automaton used is also kept in memory
+        self._last = (None, None)
+
+    def key(self, primer_list: Sequence[Primer | None], limit: int = 16) -> str:
+        """
+        Hash of the primer list and limit, used as file name.
+
+        Parameters
+        ----------
+        primer_list : list[Primer] | tuple[Primer]
+            Same as for :func:`make_automaton`.
+        limit : int, optional
+            Same as for :func:`make_automaton`. The default is 16.
+
+        Returns
+        -------
+        str
+            Hexadecimal sha256 digest.
+
+        """
+        try:
+            ahocorasick_version = package_version("pyahocorasick")
+        except PackageNotFoundError:  # pragma: no cover
+            ahocorasick_version = ""
+        digest = hashlib.sha256(
+            f"{self.version} {ahocorasick_version} {limit}".encode()
+        )
+        for s in primer_list:
+            # Primers that evaluate to False are skipped by make_automaton,
+            # but they keep their index.
+            digest.update(b"\n" + (str(s.seq).upper().encode() if s else b""))
+        return digest.hexdigest()
+
+    def get(
+        self, primer_list: Sequence[Primer | None], limit: int = 16
+    ) -> ahocorasick.Automaton:
+        """
+        Automaton for the primer list, loaded from disk or made with
+        :func:`make_automaton` and saved.
+
+        Parameters
+        ----------
+        primer_list : list[Primer] | tuple[Primer]
+            Same as for :func:`make_automaton`.
+        limit : int, optional
+            Same as for :func:`make_automaton`. The default is 16.
+
+        Returns
+        -------
+        ahocorasick.Automaton
+            pyahocorasick automaton made for the list of Primer objects.
+
+        """
+        key = self.key(primer_list, limit)
+        path = self.directory / f"{key}.automaton"
+        last_key, automaton = self._last
+
+        if last_key != key:
+            automaton = None
+            if path.exists():
+                try:
+                    automaton = ahocorasick.load(str(path), pickle.loads)
+                except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+                    # Incomplete or corrupted file, it is made again
+                    automaton = None
+            if automaton is None:
+                automaton = make_automaton(primer_list, limit=limit)
+                self._save(automaton, path)
+            self._last = (key, automaton)
+
+        if path.exists():
+            # The modification time is used to find the least recently used files
+            os.utime(path)
+        else:
+            self._save(automaton, path)
+        return automaton
+
+    def clear(self) -> None:
+        """Delete all automata in the cache."""
+        for path in self.directory.glob("*.automaton"):
+            path.unlink(missing_ok=True)
+        self._last = (None, None)
+
+    def _save(self, automaton: ahocorasick.Automaton, path: Path) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, so that other processes never
+        # read an incomplete file.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            automaton.save(tmp, pickle.dumps)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        """Delete the least recently used automata above max_entries or max_bytes."""
+        entries = []
+        for path in self.directory.glob("*.automaton"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(key=lambda e: e[0], reverse=True)
+
+        total = 0
+        for count, (_, size, path) in enumerate(entries, start=1):
+            total += size
+            if path != keep and (count > self.max_entries or total > self.max_bytes):
+                path.unlink(missing_ok=True)
+                total -= size
+
+
+def _get_automaton(
+    primer_list: Sequence[Primer | None],
+    limit: int,
+    automaton: ahocorasick.Automaton | AutomatonCache | None,
+) -> ahocorasick.Automaton:
+    """Automaton given as argument to the functions below, see :func:`forward_primers`."""
+    if isinstance(automaton, AutomatonCache):
+        return automaton.get(primer_list, limit=limit)
+    # if no automaton is given, we make one.
+    return automaton or make_automaton(primer_list, limit=limit)
+
+
 def callback(a: int, b: int) -> bool:
     """
     PCR product sizes quality control.
@@ -291,7 +502,7 @@ def forward_primers(
     seq: Dseqrecord,
     primer_list: Sequence[Primer | None],
     limit: int = 16,
-    automaton: ahocorasick.Automaton = None,
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
 ) -> dict[int, list[int]]:
     """
     Forward primers from `primer_list` annealing to `seq` with at least `limit`
@@ -340,8 +551,9 @@ def forward_primers(
     limit : str, optional
         This is the part at the 3'-end of each primer that has to
         anneal. The default is 16.
-    automaton : ahocorasick.Automaton, optional
-        Automaton made with the :func:`make_automaton`. The default is None.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
 
     Returns
     -------
@@ -352,8 +564,7 @@ def forward_primers(
     """
     assert primer_list, "primer_list must not be empty."
 
-    # if no automaton is given, we make one.
-    automaton = automaton or make_automaton(primer_list, limit=limit)
+    automaton = _get_automaton(primer_list, limit, automaton)
 
     # The limit is taken from automaton stats.
     # If the automaton is given, the limit argument will be ignored.
@@ -376,7 +587,7 @@ def reverse_primers(
     seq: Dseqrecord,
     primer_list: Sequence[Primer | None],
     limit: int = 16,
-    automaton: ahocorasick.Automaton = None,
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
 ) -> dict[int, list[int]]:
     """
     Primers from `primer_list` annealing in reverse to `seq` with at least
@@ -423,8 +634,9 @@ def reverse_primers(
     limit : str, optional
         This is the part in the 3'-end of each primer that has to
         anneal. The default is 16.
-    automaton : ahocorasick.Automaton, optional
-        Automaton made with the :func:`make_automaton`. The default is None.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
 
     Returns
     -------
@@ -435,8 +647,7 @@ def reverse_primers(
     """
     assert primer_list, "primer_list must not be empty."
 
-    # if no automaton is given, we make one.
-    automaton = automaton or make_automaton(primer_list, limit=limit)
+    automaton = _get_automaton(primer_list, limit, automaton)
 
     # The limit is taken from automaton stats.
     # If the automaton is given, the limit argument will be ignored.
@@ -458,14 +669,136 @@ def reverse_primers(
     return dict(rps)
 
 
+# Set in each worker process by _init_screen_worker, see screen_sequences
+_screen_worker_state: dict = dict()
+
+
+def _init_screen_worker(
+    primer_list: Sequence[Primer | None], automaton: ahocorasick.Automaton
+) -> None:
+    """Initializer of the worker processes, so that the primers and the automaton
+    are sent only once per worker."""
+    _screen_worker_state.update(primer_list=primer_list, automaton=automaton)
+
+
+def _screen_worker_task(seq: Dseqrecord) -> tuple[dict, dict]:
+    primer_list = _screen_worker_state["primer_list"]
+    automaton = _screen_worker_state["automaton"]
+    return (
+        forward_primers(seq, primer_list, automaton=automaton),
+        reverse_primers(seq, primer_list, automaton=automaton),
+    )
+
+
+def screen_sequences(
+    sequences: Iterable[Dseqrecord],
+    primer_list: Sequence[Primer | None],
+    limit: int = 16,
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
+    workers: int = None,
+    batch_size: int = 1000,
+) -> np.ndarray:
+    """
+    Binding positions of the primers in `primer_list` on many sequences.
+
+    This is the same as calling :func:`forward_primers` and :func:`reverse_primers`
+    for each sequence, but the result is a single table, and the sequences
+    can be distributed over a pool of processes. The automaton and the primer
+    list are sent only once to each process.
+
+    `sequences` can be any iterable, for example a generator reading a
+    large number of files. It is read `batch_size` sequences at a time.
+
+    The result is a numpy structured array with dtype :data:`binding_dtype`
+    and one row per binding site. The columns are:
+
+    - sequence: index of the sequence in `sequences`
+    - primer: index of the primer in `primer_list`
+    - strand: 1 for forward primers, -1 for reverse primers
+    - position: position as described in :func:`forward_primers` and :func:`reverse_primers`
+
+    Rows are sorted by sequence, with forward primers first.
+
+    Parameters
+    ----------
+    sequences : Iterable[Dseqrecord]
+        Target sequences to find primer annealing positions.
+    primer_list : list[Primer] | tuple[Primer]
+        This is a list of pydna.primer.Primer objects or any object
+        with a seq property such as Bio.SeqRecord.SeqRecord.
+    limit : str, optional
+        This is the part in the 3'-end of each primer that has to
+        anneal. The default is 16.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
+    workers : int, optional
+        Number of processes. The default is None, meaning that the sequences
+        are screened in the current process.
+    batch_size : int, optional
+        Number of sequences read from `sequences` at a time. The default is 1000.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with the columns sequence, primer, strand and position.
+
+    """
+    assert primer_list, "primer_list must not be empty."
+
+    automaton = _get_automaton(primer_list, limit, automaton)
+
+    sequences = iter(sequences)
+    batches = iter(lambda: list(islice(sequences, batch_size)), [])
+
+    if workers is None or workers < 2:
+        executor = None
+        results = (
+            (
+                forward_primers(seq, primer_list, automaton=automaton),
+                reverse_primers(seq, primer_list, automaton=automaton),
+            )
+            for batch in batches
+            for seq in batch
+        )
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_screen_worker,
+            initargs=(primer_list, automaton),
+        )
+        results = (
+            result
+            for batch in batches
+            for result in executor.map(
+                _screen_worker_task,
+                batch,
+                chunksize=max(1, len(batch) // (4 * workers)),
+            )
+        )
+
+    rows = []
+    try:
+        for index, (fps, rps) in enumerate(results):
+            for strand, positions in ((1, fps), (-1, rps)):
+                for primer, locations in positions.items():
+                    rows.extend((index, primer, strand, loc) for loc in locations)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return np.array(rows, dtype=binding_dtype)
+
+
 def primer_pairs(
     seq: Dseqrecord,
     primer_list: Sequence[Primer | None],
     short: int = 500,
     long: int = 2000,
     limit: int = 16,
-    automaton: ahocorasick.Automaton = None,
-) -> list[amplicon_tuple[int, int, int, int, int]]:
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
+    as_array: bool = False,
+) -> list[amplicon_tuple[int, int, int, int, int]] | np.ndarray:
     """
     Primer pairs that form PCR products larger than `short` and smaller
     than `long`.
@@ -508,8 +841,12 @@ def primer_pairs(
         Lower limit for the size of the PCR products. The default is 500.
     long : int, optional
         Upper limit for the size of the PCR products. The default is 1500.
-    automaton : ahocorasick.Automaton, optional
-        Automaton made with the :func:`make_automaton`. The default is None.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
+    as_array : bool, optional
+        Return a numpy structured array with dtype :data:`amplicon_dtype`
+        (same fields as amplicon_tuple) instead of a list. The default is False.
 
     Returns
     -------
@@ -519,8 +856,7 @@ def primer_pairs(
     """
     assert primer_list, "primer_list must not be empty."
 
-    # if no automaton is given, we make one.
-    automaton = automaton or make_automaton(primer_list, limit=limit)
+    automaton = _get_automaton(primer_list, limit, automaton)
 
     # The limit is taken from automaton stats.
     # If the automaton is given, the limit argument will be ignored.
@@ -539,35 +875,68 @@ def primer_pairs(
         for rp, pos in reverse_primers(seq, primer_list, automaton=automaton).items()
         if len(pos) == 1
     }
-    products = []
 
-    for fp, fposition in fps.items():
-        for rp, rposition in rps.items():
-            # We calculate the size of a potential PCR product
-            size = len(primer_list[fp]) + rposition - fposition + len(primer_list[rp])
-            # If the size falls within long and short, the data is kept.
-            if short <= size <= long and fposition <= rposition:
-                products.append(amplicon_tuple(fp, rp, fposition, rposition, size))
+    fp_ids = np.fromiter(fps.keys(), dtype=np.int64, count=len(fps))
+    fp_pos = np.fromiter(fps.values(), dtype=np.int64, count=len(fps))
+    fp_len = np.fromiter(
+        (len(primer_list[fp]) for fp in fps), dtype=np.int64, count=len(fps)
+    )
+    rp_ids = np.fromiter(rps.keys(), dtype=np.int64, count=len(rps))
+    rp_pos = np.fromiter(rps.values(), dtype=np.int64, count=len(rps))
+    rp_len = np.fromiter(
+        (len(primer_list[rp]) for rp in rps), dtype=np.int64, count=len(rps)
+    )
+
+    # The size of a PCR product is len(fp) + rposition - fposition + len(rp).
+    # For each forward primer, the reverse primers giving sizes between short
+    # and long are found by binary search in the reverse primers sorted by
+    # rposition + len(rp).
+    rp_key = rp_pos + rp_len
+    rp_order = np.argsort(rp_key, kind="stable")
+    sorted_rp_key = rp_key[rp_order]
+
+    def pairs_in_window(offset):
+        base = fp_len - fp_pos + offset
+        lo = np.searchsorted(sorted_rp_key, short - base, side="left")
+        hi = np.searchsorted(sorted_rp_key, long - base, side="right")
+        counts = np.maximum(hi - lo, 0)
+        fi = np.repeat(np.arange(len(fp_ids)), counts)
+        first = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        ri = rp_order[first + np.arange(len(fi))]
+        return fi, ri, fp_len[fi] + rp_key[ri] - fp_pos[fi] + offset
+
+    def sorted_pairs(fi, ri, size, keep):
+        # Same order as looping over the forward and then the reverse primers
+        fi, ri, size = fi[keep], ri[keep], size[keep]
+        order = np.lexsort((ri, fi))
+        return fi[order], ri[order], size[order]
+
+    fi, ri, size = pairs_in_window(0)
+    fi, ri, size = sorted_pairs(fi, ri, size, fp_pos[fi] <= rp_pos[ri])
+    columns = [fp_ids[fi], rp_ids[ri], fp_pos[fi], rp_pos[ri], size]
+
     # if sequence is circular we also look at forward primers that sits after the
     # reverse primer and amplify across the origin
     if seq.circular:
         ln = len(seq)
-        for fp, fposition in fps.items():
-            for rp, rposition in rps.items():
-                if fposition > rposition:
-                    size = (
-                        len(primer_list[fp])
-                        + rposition
-                        + (ln - fposition)
-                        + len(primer_list[rp])
-                    )
-                    if short <= size <= long:
-                        products.append(
-                            amplicon_tuple(
-                                fp, rp, fposition % len(seq), rposition % len(seq), size
-                            )
-                        )
-    return products
+        fi, ri, size = pairs_in_window(ln)
+        fi, ri, size = sorted_pairs(fi, ri, size, fp_pos[fi] > rp_pos[ri])
+        circular_columns = [
+            fp_ids[fi],
+            rp_ids[ri],
+            fp_pos[fi] % ln,
+            rp_pos[ri] % ln,
+            size,
+        ]
+        columns = [np.concatenate(c) for c in zip(columns, circular_columns)]
+
+    if as_array:
+        products = np.empty(len(columns[0]), dtype=amplicon_dtype)
+        for name, column in zip(amplicon_tuple._fields, columns):
+            products[name] = column
+        return products
+
+    return [amplicon_tuple(*row) for row in zip(*(c.tolist() for c in columns))]
 
 
 def flanking_primer_pairs(
@@ -575,7 +944,7 @@ def flanking_primer_pairs(
     primer_list: Sequence[Primer | None],
     target: tuple[int, int] = (None, None),
     limit: int = 16,
-    automaton: ahocorasick.Automaton = None,
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
 ) -> list[amplicon_tuple[int, int, int, int, int]]:
     """
     Primer pairs that flank a target position (begin..end). This means that
@@ -605,8 +974,9 @@ def flanking_primer_pairs(
     limit : str, optional
         This is the part in the 3'-end of each primer that has to
         anneal. The default is 16.
-    automaton : ahocorasick.Automaton, optional
-        Automaton made with the :func:`make_automaton`. The default is None.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
 
 
     Returns
@@ -651,7 +1021,7 @@ def diff_primer_pairs(
     short: int = 500,
     long: int = 1500,
     limit: int = 16,
-    automaton: ahocorasick.Automaton = None,
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
     callback: Callable[[list], bool] = callback,
 ) -> tuple[tuple[Dseqrecord, int, int, int]]:
     """
@@ -708,8 +1078,9 @@ def diff_primer_pairs(
         Lower limit for the size of the PCR products. The default is 500.
     long : int, optional
         Upper limit for the size of the PCR products. The default is 1500.
-    automaton : ahocorasick.Automaton, optional
-        Automaton made with the :func:`make_automaton`. The default is None.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
     callback : callable[[list], bool], optional
         A function accepting a list of integers and returning True or False.
         The default is callback.
@@ -721,7 +1092,7 @@ def diff_primer_pairs(
 
     """
 
-    automaton = automaton or make_automaton(primer_list, limit=limit)
+    automaton = _get_automaton(primer_list, limit, automaton)
     limit = automaton.get_stats()["longest_word"]
     primer_pair_dict = defaultdict(list)
 
@@ -763,7 +1134,7 @@ def diff_primer_triplets(
     limit: int = 16,
     short: int = 500,
     long: int = 1500,
-    automaton: ahocorasick.Automaton = None,
+    automaton: ahocorasick.Automaton | AutomatonCache = None,
     callback: Callable[[list], bool] = callback,
 ) -> tuple[tuple[tuple[Dseqrecord, int, int, int]]]:
     """
@@ -823,8 +1194,9 @@ def diff_primer_triplets(
         Lower limit for the size of the PCR products. The default is 500.
     long : int, optional
         Upper limit for the size of the PCR products. The default is 2000.
-    automaton : ahocorasick.Automaton, optional
-        Automaton made with the :func:`make_automaton`. The default is None.
+    automaton : ahocorasick.Automaton | AutomatonCache, optional
+        Automaton made with the :func:`make_automaton`, or an
+        :class:`AutomatonCache` to get it from. The default is None.
     callback : callable[[list], bool], optional
         A function accepting a list of integers and returning True or False.
         The default is callback.
@@ -836,7 +1208,7 @@ def diff_primer_triplets(
 
     """
 
-    automaton = automaton or make_automaton(primer_list, limit=limit)
+    automaton = _get_automaton(primer_list, limit, automaton)
     limit = automaton.get_stats()["longest_word"]
     # number_of_sequences = len(sequences)
     sequences = list(dict.fromkeys(sequences))
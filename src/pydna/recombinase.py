@@ -100,7 +100,6 @@ Using a Recombinase as Assembly algorithm::
 
 import re
 import itertools
-import copy
 
 from Bio.Seq import reverse_complement
 from Bio.SeqFeature import SimpleLocation, SeqFeature
@@ -359,7 +358,7 @@ class Recombinase:
         Dseqrecord
             A copy of the sequence with added features.
         """
-        out_seq = copy.deepcopy(seq)
+        out_seq = seq.detach()
         sites = self.find(out_seq)
         for name, locs in sites.items():
             for loc in locs:
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Binary file format for collections of Dseqrecord objects.
+
+:func:`write_store` writes many Dseqrecords to one file and
+:class:`RecordStore` reads them back. The file is memory mapped, and a record
+is only read when it is requested, by position, name or SEGUID, so that
+opening a large collection takes milliseconds instead of parsing all the
+Genbank text.
+
+>>> import os, tempfile
+>>> from pydna.dseqrecord import Dseqrecord
+>>> from pydna.record_store import RecordStore, write_store
+>>> a = Dseqrecord("aaGAATTCaa", circular=True, name="a")
+>>> a.add_feature(2, 8, label="EcoRI")
+>>> path = os.path.join(tempfile.mkdtemp(), "seqs.pydna")
+>>> write_store(path, [a, Dseqrecord("ccc", name="b")])
+2
+>>> with RecordStore(path) as store:
+...     print(store.names, store["a"].features[0].qualifiers)
+['a', 'b'] {'label': 'EcoRI'}
+
+The file contains:
+
+- the dscode of each sequence (``Dseq._data``), so that sticky ends are kept,
+- the columns of a table of features and of a table of their location parts,
+- the name, id, description, annotations and other attributes of each record
+  and the qualifiers of each feature as JSON,
+- the ``source`` of each record, as the JSON of a
+  :class:`pydna.opencloning_models.CloningStrategy`, see :meth:`RecordStore.source_json`.
+
+Annotations and qualifiers that can not be represented as JSON are not stored,
+except literature references. Positions of feature locations are stored as
+exact, before (<) or after (>) positions.
+"""
+
+import json
+import mmap
+import struct
+from typing import Iterable, Iterator
+
+import numpy as np
+from Bio.SeqFeature import (
+    AfterPosition,
+    BeforePosition,
+    CompoundLocation,
+    ExactPosition,
+    Reference,
+    SeqFeature,
+    SimpleLocation,
+)
+from Bio.SeqRecord import _RestrictedDict
+
+from pydna.dseq import Dseq
+from pydna.dseqrecord import Dseqrecord
+
+_magic = b"PYDNARS1"
+_version = 1
+
+# Codes of the location positions
+_position_types = (ExactPosition, BeforePosition, AfterPosition)
+# Code of the strand None
+_no_strand = 2
+# Codes of the operators of compound locations
+_operators = ("join", "order", "bond")
+
+# dtype of each column
+_columns = {
+    "record_seq_offset": "<i8",
+    "record_seq_length": "<i8",
+    "record_circular": "u1",
+    "record_meta_offset": "<i8",
+    "record_meta_length": "<i8",
+    "record_source_offset": "<i8",
+    "record_source_length": "<i8",
+    "record_feature_start": "<i8",
+    "record_feature_count": "<i8",
+    "feature_type": "<u4",
+    "feature_operator": "u1",
+    "feature_part_start": "<i8",
+    "feature_part_count": "<i8",
+    "feature_meta_offset": "<i8",
+    "feature_meta_length": "<i8",
+    "part_start": "<i8",
+    "part_end": "<i8",
+    "part_strand": "i1",
+    "part_start_type": "u1",
+    "part_end_type": "u1",
+}
+
+
+def _encode(obj):
+    """JSON encoding of the objects that json does not know."""
+    if isinstance(obj, Reference):
+        return {
+            "__reference__": {
+                key: value for key, value in obj.__dict__.items() if key != "location"
+            },
+            "location": [
+                [int(loc.start), int(loc.end), loc.strand] for loc in obj.location
+            ],
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _decode(obj):
+    if "__reference__" in obj:
+        reference = Reference()
+        reference.__dict__.update(obj["__reference__"])
+        reference.location = [SimpleLocation(*loc) for loc in obj["location"]]
+        return reference
+    return obj
+
+
+def _dict_to_json(values: dict) -> dict:
+    """Items of values that can be represented as JSON."""
+    out = {}
+    for key, value in values.items():
+        try:
+            json.dumps(value, default=_encode)
+        except (TypeError, ValueError):
+            continue
+        out[key] = value
+    return out
+
+
+def _position_type(position) -> int:
+    for code, position_type in enumerate(_position_types):
+        if type(position) is position_type:
+            return code
+    return 0
+
+
+def write_store(path: str, records: Iterable[Dseqrecord]) -> int:
+    """
+    Write Dseqrecord objects to a file that can be read with :class:`RecordStore`.
+
+    The sequences are written as they are read from records, so records can be
+    a generator, for example :func:`pydna.parsers.iparse`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, it is overwritten if it exists.
+    records : iterable of Dseqrecord
+        The records to write.
+
+    Returns
+    -------
+    int
+        The number of records written.
+    """
+    from pydna.opencloning_models import CloningStrategy
+
+    columns = {name: [] for name in _columns}
+    names = []
+    seguids = []
+    feature_types = {}
+
+    with open(path, "wb") as f:
+        f.write(_magic)
+
+        def append(data: bytes, prefix: str):
+            columns[prefix + "_offset"].append(f.tell())
+            columns[prefix + "_length"].append(len(data))
+            f.write(data)
+
+        for record in records:
+            seq = record.seq
+            names.append(str(record.name))
+            seguids.append(seq.seguid())
+            append(seq._data, "record_seq")
+            columns["record_circular"].append(seq.circular)
+            meta = {
+                "id": str(record.id),
+                "name": str(record.name),
+                "description": str(record.description),
+                "dbxrefs": list(record.dbxrefs),
+                "annotations": _dict_to_json(record.annotations),
+                "letter_annotations": _dict_to_json(record.letter_annotations),
+                "n": record.n,
+            }
+            append(json.dumps(meta, default=_encode).encode("utf-8"), "record_meta")
+            if record.source is None:
+                columns["record_source_offset"].append(0)
+                columns["record_source_length"].append(-1)
+            else:
+                strategy = CloningStrategy.from_dseqrecords([record])
+                append(strategy.model_dump_json().encode("utf-8"), "record_source")
+
+            columns["record_feature_start"].append(len(columns["feature_type"]))
+            columns["record_feature_count"].append(len(record.features))
+            for feature in record.features:
+                code = feature_types.setdefault(feature.type, len(feature_types))
+                columns["feature_type"].append(code)
+                location = feature.location
+                parts = [] if location is None else location.parts
+                operator = getattr(location, "operator", "join")
+                columns["feature_operator"].append(_operators.index(operator))
+                columns["feature_part_start"].append(len(columns["part_start"]))
+                columns["feature_part_count"].append(len(parts))
+                for part in parts:
+                    columns["part_start"].append(int(part.start))
+                    columns["part_end"].append(int(part.end))
+                    strand = _no_strand if part.strand is None else part.strand
+                    columns["part_strand"].append(strand)
+                    columns["part_start_type"].append(_position_type(part.start))
+                    columns["part_end_type"].append(_position_type(part.end))
+                feature_meta = [feature.id, _dict_to_json(feature.qualifiers)]
+                append(
+                    json.dumps(feature_meta, default=_encode).encode("utf-8"),
+                    "feature_meta",
+                )
+
+        arrays = {}
+        for name, dtype in _columns.items():
+            f.write(b"\0" * (-f.tell() % 8))  # aligned columns
+            array = np.array(columns[name], dtype=dtype)
+            arrays[name] = [f.tell(), dtype, len(array)]
+            f.write(array.tobytes())
+
+        footer = {
+            "version": _version,
+            "names": names,
+            "seguids": seguids,
+            "feature_types": list(feature_types),
+            "arrays": arrays,
+        }
+        footer = json.dumps(footer).encode("utf-8")
+        footer_offset = f.tell()
+        f.write(footer)
+        f.write(struct.pack("<QQ", footer_offset, len(footer)))
+        f.write(_magic)
+    return len(names)
+
+
+class RecordStore:
+    """
+    Dseqrecord objects in a file written by :func:`write_store`.
+
+    The file is memory mapped, and the records are made when they are
+    requested. Records can be requested by position, or by name or SEGUID
+    (see :meth:`pydna.dseq.Dseq.seguid`) of the sequence. If several records
+    have the same name or SEGUID, the first one is returned. Each request makes a
+    new Dseqrecord object.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Attributes
+    ----------
+    names : list[str]
+        Names of the records.
+    seguids : list[str]
+        SEGUID of the sequence of each record.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._map
+        if len(data) < 3 * len(_magic) or not (
+            data[: len(_magic)] == _magic and data[-len(_magic) :] == _magic
+        ):
+            self._map.close()
+            raise ValueError(f"{path} is not a pydna record store")
+        footer_offset, footer_length = struct.unpack(
+            "<QQ", data[-len(_magic) - 16 : -len(_magic)]
+        )
+        footer = json.loads(data[footer_offset : footer_offset + footer_length])
+        if footer["version"] != _version:
+            self._map.close()
+            raise ValueError(f"Unsupported record store version {footer['version']}")
+        self.names = footer["names"]
+        self.seguids = footer["seguids"]
+        self._feature_types = footer["feature_types"]
+        self._arrays = {
+            name: np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+            for name, (offset, dtype, count) in footer["arrays"].items()
+        }
+        self._keys = None
+
+    def close(self):
+        """Close the file."""
+        if not self._map.closed:
+            # The arrays are views of the memory map, they must be released first.
+            self._arrays = {}
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[Dseqrecord]:
+        for index in range(len(self)):
+            yield self._record(index)
+
+    def __contains__(self, key) -> bool:
+        return self.index(key) is not None
+
+    def __getitem__(self, key: int | str) -> Dseqrecord:
+        if isinstance(key, str):
+            index = self.index(key)
+            if index is None:
+                raise KeyError(key)
+            return self._record(index)
+        if not -len(self) <= key < len(self):
+            raise IndexError("record index out of range")
+        return self._record(key % len(self))
+
+    def get(self, key: str, default=None) -> Dseqrecord | None:
+        """Record with the name or SEGUID key, or default if there is none."""
+        index = self.index(key)
+        return default if index is None else self._record(index)
+
+    def index(self, key: str) -> int | None:
+        """Position of the first record with the name or SEGUID key, or None."""
+        if self._keys is None:
+            self._keys = dict()
+            for keys in (self.seguids, self.names):
+                for index in reversed(range(len(keys))):
+                    self._keys[keys[index]] = index
+        return self._keys.get(key)
+
+    def source_json(self, key: int | str) -> str | None:
+        """JSON of a CloningStrategy with the source of the record, or None if the
+        record had no source. Can be read with
+        ``CloningStrategy.model_validate_json``."""
+        index = self.index(key) if isinstance(key, str) else key
+        if index is None:
+            raise KeyError(key)
+        length = int(self._arrays["record_source_length"][index])
+        if length < 0:
+            return None
+        offset = int(self._arrays["record_source_offset"][index])
+        return self._map[offset : offset + length].decode("utf-8")
+
+    def _json(self, prefix: str, index: int):
+        offset = int(self._arrays[prefix + "_offset"][index])
+        length = int(self._arrays[prefix + "_length"][index])
+        return json.loads(self._map[offset : offset + length], object_hook=_decode)
+
+    def _record(self, index: int) -> Dseqrecord:
+        arrays = self._arrays
+        offset = int(arrays["record_seq_offset"][index])
+        length = int(arrays["record_seq_length"][index])
+        seq = Dseq.quick(
+            self._map[offset : offset + length],
+            circular=bool(arrays["record_circular"][index]),
+        )
+        meta = self._json("record_meta", index)
+
+        # As Dseqrecord.from_SeqRecord
+        obj = Dseqrecord.__new__(Dseqrecord)
+        obj._per_letter_annotations = _RestrictedDict(length=length)
+        obj._per_letter_annotations.update(meta["letter_annotations"])
+        obj.id = meta["id"]
+        obj.name = meta["name"]
+        obj.description = meta["description"]
+        obj.dbxrefs = meta["dbxrefs"]
+        obj.annotations = meta["annotations"]
+        obj.features = [
+            self._feature(i)
+            for i in range(
+                int(arrays["record_feature_start"][index]),
+                int(
+                    arrays["record_feature_start"][index]
+                    + arrays["record_feature_count"][index]
+                ),
+            )
+        ]
+        obj.n = meta["n"]
+        obj.map_target = None
+        obj.source = None
+        obj._seq = seq
+        return obj
+
+    def _feature(self, index: int) -> SeqFeature:
+        arrays = self._arrays
+        start = int(arrays["feature_part_start"][index])
+        stop = start + int(arrays["feature_part_count"][index])
+        parts = [
+            SimpleLocation(
+                _position_types[part_start_type](part_start),
+                _position_types[part_end_type](part_end),
+                None if strand == _no_strand else strand,
+            )
+            for part_start, part_end, strand, part_start_type, part_end_type in zip(
+                arrays["part_start"][start:stop].tolist(),
+                arrays["part_end"][start:stop].tolist(),
+                arrays["part_strand"][start:stop].tolist(),
+                arrays["part_start_type"][start:stop].tolist(),
+                arrays["part_end_type"][start:stop].tolist(),
+            )
+        ]
+        if not parts:
+            location = None
+        elif len(parts) == 1:
+            location = parts[0]
+        else:
+            operator = _operators[int(arrays["feature_operator"][index])]
+            location = CompoundLocation(parts, operator=operator)
+        feature_id, qualifiers = self._json("feature_meta", index)
+        return SeqFeature(
+            location,
+            type=self._feature_types[int(arrays["feature_type"][index])],
+            id=feature_id,
+            qualifiers=qualifiers,
+        )
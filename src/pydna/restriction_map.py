@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Restriction maps, the cut positions of a group of enzymes in a sequence.
+
+A :class:`RestrictionMap` searches the sequence once, with a
+:class:`pydna.restriction_scanner.RestrictionScanner`, and answers the
+questions about which enzymes cut and where from the positions found.
+:func:`restriction_map` keeps the most recently used maps, so that a map is
+only made once for each sequence and group of enzymes. It is used by
+:meth:`pydna.dseq.Dseq.get_cutsites`, :meth:`pydna.dseq.Dseq.cut`, the
+``cutters`` methods of Dseq and Dseqrecord and
+:meth:`pydna.dseqrecord.Dseqrecord.number_of_cuts`.
+
+:meth:`RestrictionMap.partial_digest` lists the fragments of a partial
+digest as :class:`DigestFragment` objects, that only make their sequence when
+it is needed. :func:`digest_many` digests many records, optionally in a pool
+of processes.
+
+>>> from Bio.Restriction import BamHI, EcoRI, RestrictionBatch
+>>> from pydna.dseq import Dseq
+>>> from pydna.restriction_map import restriction_map
+>>> seq = Dseq("GGATCCaaGAATTCaaGAATTC")
+>>> rmap = restriction_map(seq, RestrictionBatch([BamHI, EcoRI]))
+>>> rmap.get_cutsites(EcoRI)
+[((9, -4), EcoRI), ((17, -4), EcoRI)]
+>>> rmap.unique_cutters()
+RestrictionBatch(['BamHI'])
+>>> rmap is restriction_map(seq, RestrictionBatch([BamHI, EcoRI]))
+True
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import itertools
+from typing import Iterable, Iterator, TYPE_CHECKING
+
+from Bio.Restriction import CommOnly, RestrictionBatch
+
+from pydna.restriction_scanner import RestrictionScanner, get_scanner
+from pydna.utils import cuts_overlap, flatten
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydna.dseq import Dseq
+    from pydna.dseqrecord import Dseqrecord
+    from pydna.types import CutSiteType, EnzymesType
+
+# Number of restriction maps kept by restriction_map
+cache_size = 64
+
+
+class DigestFragment:
+    """
+    A fragment of a digest, between two cut sites.
+
+    The cut sites are as returned by :meth:`pydna.dseq.Dseq.get_cutsite_pairs`. The
+    fragment (a Dseq) is made from the parent sequence the first time the
+    seq attribute is used.
+
+    Attributes
+    ----------
+    parent : Dseq
+        The digested sequence.
+    left_cut, right_cut : cut site or None
+        The cut sites at the ends of the fragment. None for the ends of a
+        linear sequence.
+    size : int
+        The length of the fragment, including the single stranded ends.
+    missed : int
+        The number of cut sites in the fragment that were not cut.
+    """
+
+    __slots__ = ("parent", "left_cut", "right_cut", "size", "missed", "_seq")
+
+    def __init__(self, parent, left_cut, right_cut, size, missed):
+        self.parent = parent
+        self.left_cut = left_cut
+        self.right_cut = right_cut
+        self.size = size
+        self.missed = missed
+        self._seq = None
+
+    def __repr__(self):
+        return f"DigestFragment({self.size}, missed={self.missed})"
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def seq(self) -> "Dseq":
+        """The fragment, see :meth:`pydna.dseq.Dseq.apply_cut`."""
+        if self._seq is None:
+            self._seq = self.parent.apply_cut(self.left_cut, self.right_cut)
+        return self._seq
+
+
+class RestrictionMap:
+    """
+    Cut positions of a group of enzymes in a sequence.
+
+    The sequence is searched when the map is made, the cut sites are
+    checked the first time they are needed.
+
+    Parameters
+    ----------
+    seq : Dseq
+        The sequence. The map keeps its own Dseq object with the same data.
+    enzymes : iterable of enzymes, RestrictionBatch or RestrictionScanner, optional
+        The enzymes. The default is Bio.Restriction.CommOnly.
+    """
+
+    def __init__(self, seq: "Dseq", enzymes=None):
+        self.seq = type(seq).quick(seq._data, circular=seq.circular)
+        if not isinstance(enzymes, RestrictionScanner):
+            enzymes = get_scanner(CommOnly if enzymes is None else enzymes)
+        self.scanner = enzymes
+        self.enzymes = self.scanner.enzymes
+        self._search = {not seq.circular: self.scanner.search(self.seq)}
+        self._cutsites = None
+
+    def __repr__(self):
+        return f"RestrictionMap({self.seq!r}, {len(self.enzymes)} enzymes)"
+
+    def search(self, linear: bool | None = None) -> dict:
+        """
+        Cut positions of each enzyme, as from the search method of the enzymes.
+
+        Parameters
+        ----------
+        linear : bool, optional
+            If the sequence is searched as a linear sequence. The default is
+            the topology of the sequence.
+
+        Returns
+        -------
+        dict
+            The positions (the first base after each cut, counting from 1)
+            for each enzyme. The dict must not be changed.
+        """
+        if linear is None:
+            linear = not self.seq.circular
+        if linear not in self._search:
+            self._search[linear] = self.scanner.search(self.seq, linear=linear)
+        return self._search[linear]
+
+    def _enzymes_in_map(self, enzymes) -> list:
+        """The enzymes, that must be in the map. All the enzymes if none are given."""
+        if not enzymes:
+            return list(self.enzymes)
+        enzymes = flatten(enzymes)
+        missing = [e for e in enzymes if e not in self.search()]
+        if missing:
+            raise ValueError(f"Enzymes not in the restriction map: {missing}")
+        return enzymes
+
+    def get_cutsites(self, *enzymes: "EnzymesType") -> list["CutSiteType"]:
+        """
+        The same cut sites as :meth:`pydna.dseq.Dseq.get_cutsites`, for all the
+        enzymes in the map or for the enzymes given.
+        """
+        if self._cutsites is None:
+            out = []
+            for e, cuts in self.search().items():
+                out += [((c - 1, e.ovhg), e) for c in cuts]
+            self._cutsites = sorted(c for c in out if self.seq.cutsite_is_valid(c))
+        if not enzymes:
+            return list(self._cutsites)
+        wanted = set(self._enzymes_in_map(enzymes))
+        return [c for c in self._cutsites if c[1] in wanted]
+
+    def cut(self, *enzymes: "EnzymesType") -> tuple["Dseq", ...]:
+        """The same fragments as :meth:`pydna.dseq.Dseq.cut`, for all the
+        enzymes in the map or for the enzymes given."""
+        cutsite_pairs = self.seq.get_cutsite_pairs(self.get_cutsites(*enzymes))
+        return tuple(self.seq.apply_cut(*pair) for pair in cutsite_pairs)
+
+    def partial_digest(
+        self,
+        *enzymes: "EnzymesType",
+        min_size: int = 0,
+        max_size: int | None = None,
+        max_missed: int | None = None,
+    ) -> Iterator[DigestFragment]:
+        """
+        Fragments of a partial digest, for all the enzymes in the map or for
+        the enzymes given.
+
+        There is a fragment between each cut site and each of the following
+        cut sites (on a circular sequence, also the same cut site, that opens
+        the sequence) and between the cut sites and the ends of a linear
+        sequence. The uncut sequence is not included. Cut sites that overlap,
+        or whose single stranded ends touch, do not make a fragment: the
+        ends of a fragment are joined by at least one double stranded base.
+
+        The fragments with ``missed=0`` are the fragments of :meth:`cut`,
+        except between such cut sites. There, :meth:`cut` makes a fragment
+        without a double stranded part (e.g. the four single stranded bases
+        between the SgeI and AluBI cuts in ``CCTAGCT``) or raises an error.
+
+        The sizes are found from the cut positions, so the fragments outside
+        the size range are never made. The fragments are yielded in the order
+        of their left cut site, and then by size.
+
+        >>> from Bio.Restriction import EcoRI
+        >>> from pydna.dseq import Dseq
+        >>> from pydna.restriction_map import RestrictionMap
+        >>> rmap = RestrictionMap(Dseq("aaGAATTCaaGAATTCaa"), [EcoRI])
+        >>> list(rmap.partial_digest())
+        [DigestFragment(7, missed=0), DigestFragment(15, missed=1), DigestFragment(12, missed=0), DigestFragment(15, missed=1), DigestFragment(7, missed=0)]
+        >>> [str(f.seq) for f in rmap.partial_digest(min_size=10)]
+        ['aaGAATTCaaGAATT', 'AATTCaaGAATT', 'AATTCaaGAATTCaa']
+
+        Parameters
+        ----------
+        enzymes : enzymes, optional
+            Enzymes in the map. The default is all the enzymes in the map.
+        min_size, max_size : int, optional
+            Only fragments with a size in this range are returned.
+        max_missed : int, optional
+            Only fragments with at most this many uncut sites are returned.
+
+        Yields
+        ------
+        DigestFragment
+        """
+        # A cut site found twice (e.g. on both strands) is only cut once
+        cutsites = list(dict.fromkeys(self.get_cutsites(*enzymes)))
+        seq = self.seq
+        n = len(seq)
+        k = len(cutsites)
+        if k == 0:
+            return
+        max_missed = k if max_missed is None else max_missed
+        max_size = float("inf") if max_size is None else max_size
+        # The position of each cut on the watson strand and the single stranded
+        # part of the ends made by it, from lo to hi. A fragment starts at lo of
+        # its left cut and ends at hi of its right cut.
+        positions = [watson for (watson, ovhg), _ in cutsites]
+        lo = [watson - max(ovhg, 0) for (watson, ovhg), _ in cutsites]
+        hi = [watson + max(-ovhg, 0) for (watson, ovhg), _ in cutsites]
+
+        if seq.circular:
+            for i in range(k):
+                for d in range(1, min(k, max_missed + 1) + 1):
+                    j = (i + d) % k
+                    # A single cut site opens the sequence, two cut sites at the
+                    # same position do not
+                    span = n if d == k else (positions[j] - positions[i]) % n
+                    if span > max_size:  # the sizes are at least the span
+                        break
+                    shift = span - positions[j] + positions[i]
+                    size = hi[j] - lo[i] + shift
+                    if not min_size <= size <= max_size:
+                        continue
+                    if lo[j] + shift <= hi[i]:  # no double stranded part
+                        continue
+                    if cuts_overlap(cutsites[i], cutsites[j], n):
+                        continue
+                    yield DigestFragment(seq, cutsites[i], cutsites[j], size, d - 1)
+            return
+
+        cutsites = [None, *cutsites, None]
+        positions = [
+            min(seq.left_end_position()),
+            *positions,
+            max(seq.right_end_position()),
+        ]
+        lo = [min(seq.left_end_position()), *lo, min(seq.right_end_position())]
+        hi = [max(seq.left_end_position()), *hi, max(seq.right_end_position())]
+        for i in range(k + 1):
+            for j in range(i + 1, min(k + 1, i + max_missed + 1) + 1):
+                if i == 0 and j == k + 1:  # not cut
+                    continue
+                if positions[j] - positions[i] > max_size:
+                    break
+                size = hi[j] - lo[i]
+                if not min_size <= size <= max_size:
+                    continue
+                if lo[j] <= hi[i]:  # no double stranded part
+                    continue
+                if cuts_overlap(cutsites[i], cutsites[j], n):
+                    continue
+                yield DigestFragment(seq, cutsites[i], cutsites[j], size, j - i - 1)
+
+    def number_of_cuts(self, *enzymes: "EnzymesType") -> int:
+        """Number of cuts, as :meth:`pydna.dseqrecord.Dseqrecord.number_of_cuts`.
+
+        The positions are from a linear search, as from ``enzyme.search(seq)``.
+        """
+        found = self.search(linear=True)
+        return sum(len(found[e]) for e in self._enzymes_in_map(enzymes))
+
+    # The cutters methods search the sequence as linear, as RestrictionBatch.search
+
+    def cutters(self) -> RestrictionBatch:
+        """Enzymes cutting the sequence at least once."""
+        found = self.search(linear=True)
+        return RestrictionBatch([e for e, cuts in found.items() if cuts])
+
+    def no_cutters(self) -> RestrictionBatch:
+        """Enzymes not cutting the sequence."""
+        found = self.search(linear=True)
+        return RestrictionBatch([e for e, cuts in found.items() if not cuts])
+
+    def n_cutters(self, n: int = 3) -> RestrictionBatch:
+        """Enzymes cutting the sequence n times."""
+        found = self.search(linear=True)
+        return RestrictionBatch([e for e, cuts in found.items() if len(cuts) == n])
+
+    def unique_cutters(self) -> RestrictionBatch:
+        """Enzymes cutting the sequence once."""
+        return self.n_cutters(n=1)
+
+    once_cutters = unique_cutters
+
+    def twice_cutters(self) -> RestrictionBatch:
+        """Enzymes cutting the sequence twice."""
+        return self.n_cutters(n=2)
+
+
+@lru_cache(maxsize=cache_size)
+def _cached_map(data: bytes, circular: bool, scanner: RestrictionScanner, cls):
+    return RestrictionMap(cls.quick(data, circular=circular), scanner)
+
+
+def restriction_map(seq: "Dseq", enzymes=None) -> RestrictionMap:
+    """
+    The restriction map of a sequence, made once and reused.
+
+    The :data:`cache_size` most recently used maps are kept. Maps are found
+    by the data and topology of the sequence, not by its seguid, as a
+    circular sequence has the same seguid for all rotations, while the cut
+    positions are different.
+
+    Parameters
+    ----------
+    seq : Dseq
+        The sequence.
+    enzymes : iterable of enzymes or RestrictionBatch, optional
+        The enzymes. The default is Bio.Restriction.CommOnly.
+
+    Returns
+    -------
+    RestrictionMap
+    """
+    scanner = get_scanner(CommOnly if enzymes is None else enzymes)
+    return _cached_map(seq._data, seq.circular, scanner, type(seq))
+
+
+def _digest_task(record, enzymes):
+    """Fragments of a record (see digest_many)."""
+    return tuple(record.cut(*enzymes))
+
+
+def digest_many(
+    records: Iterable["Dseqrecord"],
+    enzymes: "EnzymesType",
+    workers: int | None = None,
+) -> list[tuple["Dseqrecord", ...]]:
+    """
+    Digest many records with the same enzymes, optionally in a pool of processes.
+
+    Each record is cut as with :meth:`pydna.dseqrecord.Dseqrecord.cut`.
+
+    >>> from Bio.Restriction import EcoRI
+    >>> from pydna.dseqrecord import Dseqrecord
+    >>> from pydna.restriction_map import digest_many
+    >>> records = [Dseqrecord("aaGAATTCaa"), Dseqrecord("ccccc")]
+    >>> digest_many(records, EcoRI)
+    [(Dseqrecord(-7), Dseqrecord(-7)), ()]
+
+    Parameters
+    ----------
+    records : iterable of Dseqrecord
+        The records to digest.
+    enzymes : enzyme, RestrictionBatch or iterable of enzymes
+        The enzymes.
+    workers : int, optional
+        If larger than 1, the records are digested in a pool of this many
+        processes.
+
+    Returns
+    -------
+    list[tuple[Dseqrecord, ...]]
+        The fragments of each record, in the order of the records.
+    """
+    records = list(records)
+    enzymes = tuple(flatten([enzymes]))
+    total = len(records)
+    if workers is None or workers < 2 or total < 2:
+        return [_digest_task(record, enzymes) for record in records]
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        return list(
+            executor.map(
+                _digest_task,
+                records,
+                itertools.repeat(enzymes),
+                chunksize=max(1, total // (4 * workers)),
+            )
+        )
+    finally:
+        executor.shutdown(cancel_futures=True)
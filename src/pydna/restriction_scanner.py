@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Search for the recognition sites of many restriction enzymes at once.
+
+Biopython searches a sequence once for each enzyme, with one regular
+expression per enzyme. A :class:`RestrictionScanner` is made once for a
+group of enzymes, and finds the sites of all of them together:
+
+- Enzymes that recognise the same site share it.
+- Each recognition site (and its reverse complement for non palindromic
+  enzymes) has an anchor, the part of the site expected to match the fewest
+  positions. The anchor has no N and is expanded to the A, C, G and T k-mers
+  that it matches.
+- The positions of all the anchor k-mers are looked up in a
+  :class:`pydna.kmer_index.KmerIndex` of the sequence, made once for each
+  anchor length.
+- The complete sites are compared with the sequence for all these positions
+  at once, with a bit mask for each IUPAC letter of the sites.
+
+Groups of a few sites are searched with regular expressions instead, which is
+faster when there are only a few. The cut positions are the same as from the
+search method of the enzymes in Biopython, also for circular sequences and
+for enzymes that cut twice.
+
+>>> from Bio.Restriction import EcoRI, BsaI
+>>> from pydna.dseq import Dseq
+>>> from pydna.restriction_scanner import RestrictionScanner
+>>> scanner = RestrictionScanner([EcoRI, BsaI])
+>>> scanner.search(Dseq("GAATTCaaGGTCTCaaaaaGAATTC"))
+{EcoRI: [2, 21], BsaI: [16]}
+>>> EcoRI.search(Dseq("GAATTCaaGGTCTCaaaaaGAATTC"))
+[2, 21]
+"""
+
+from functools import lru_cache
+from itertools import product
+import re
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
+from Bio.Restriction.Restriction import AbstractCut, FormattedSeq, NotDefined
+
+from pydna.kmer_index import KmerIndex, kmer_key
+from pydna.utils import flatten
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydna.dseq import Dseq
+
+# Longest anchor, and the largest number of k-mers an anchor may expand to
+_max_anchor_length = 6
+_max_anchor_kmers = 64
+
+# Groups with this many sites or fewer are searched with regular expressions
+_max_sites_for_regex = 24
+
+# Bit masks of the letters of the sequence, letters other than ACGT only match "."
+_bits = {"A": 1, "C": 2, "G": 4, "T": 8}
+_sequence_masks = np.full(256, 16, dtype=np.uint8)
+for _letter, _bit in _bits.items():
+    _sequence_masks[ord(_letter)] = _bit
+_any = 0xFF
+
+# The sites in the regular expressions of the Biopython enzymes, see _Site
+_compsite_group = re.compile(r"\(\?=\(\?P<(\w+)>([^)]*)\)\)")
+_compsite_token = re.compile(r"\[([ACGT]+)\]|([ACGT.])")
+
+
+class _Site:
+    """
+    A recognition site in one orientation, with the anchor used to find it.
+
+    The site is given as in the regular expressions of the Biopython enzymes,
+    with A, C, G, T, character classes like [AG] and "." for any letter.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.regex = re.compile(f"(?=({pattern}))")
+        tokens = [cls or letter for cls, letter in _compsite_token.findall(pattern)]
+        if "".join(f"[{t}]" if len(t) > 1 else t for t in tokens) != pattern:
+            raise ValueError(f"Unexpected recognition site {pattern!r}")
+        self.size = len(tokens)
+        self.masks = [
+            _any if token == "." else sum(_bits[base] for base in token)
+            for token in tokens
+        ]
+
+        # The anchor with the fewest expected matches in a random sequence,
+        # the longest of these if several are equally good.
+        best = None
+        for k in range(1, min(_max_anchor_length, self.size) + 1):
+            for offset in range(self.size - k + 1):
+                part = tokens[offset : offset + k]
+                if "." in part:
+                    continue
+                kmers = 1
+                for token in part:
+                    kmers *= len(token)
+                if kmers > _max_anchor_kmers:
+                    continue
+                key = (kmers / 4**k, -k)
+                if best is None or key < best[0]:
+                    best = (key, k, offset, part)
+        if best is None:
+            # Only ".", every position is a candidate
+            self.k = self.offset = None
+            self.keys = []
+        else:
+            _, self.k, self.offset, part = best
+            self.keys = [kmer_key("".join(bases)) for bases in product(*part)]
+
+
+class RestrictionScanner:
+    """
+    Recognition sites of a group of restriction enzymes, prepared for searching.
+
+    The same scanner can be used for many sequences.
+    :func:`get_scanner` returns a cached scanner for a group of enzymes.
+
+    Parameters
+    ----------
+    enzymes : iterable of Biopython restriction enzymes, or a RestrictionBatch
+        Nested iterables are flattened and duplicate enzymes are removed.
+        Other objects with a search method like the enzymes (for example
+        :class:`pydna.crispr.cas9`) are searched with their own method.
+    """
+
+    def __init__(self, enzymes: Iterable[AbstractCut]):
+        self.enzymes = tuple(dict.fromkeys(flatten(enzymes)))
+        sites = {}
+
+        def site(pattern):
+            if pattern not in sites:
+                sites[pattern] = _get_site(pattern)
+            return sites[pattern]
+
+        self._enzymes = []
+        for enzyme in self.enzymes:
+            if not (isinstance(enzyme, type) and issubclass(enzyme, AbstractCut)):
+                # Other objects with a search method, like pydna.crispr.cas9
+                self._enzymes.append((enzyme, None, None, None, None, None))
+                continue
+            # One site for palindromic enzymes, the site and its reverse
+            # complement (group name ending with _as) for the others.
+            groups = dict(_compsite_group.findall(enzyme.compsite.pattern))
+            backward = groups.get(f"{enzyme}_as")
+            self._enzymes.append(
+                (
+                    enzyme,
+                    site(groups[str(enzyme)]),
+                    None if backward is None else site(backward),
+                    list(enzyme._modify(0)),
+                    list(enzyme._rev_modify(0)),
+                    issubclass(enzyme, NotDefined),
+                )
+            )
+
+        self._sites = list(sites.values())
+        self._max_size = max((s.size for s in self._sites), default=1)
+        self._sizes = np.array([s.size for s in self._sites], dtype=np.int64)
+        self._anchors = None
+
+    def _prepare_anchors(self):
+        """Arrays used by _find_anchors, made when first needed."""
+        # Site masks padded with "any letter" to the longest site
+        self._masks = np.full((len(self._sites), self._max_size), _any, dtype=np.uint8)
+        for i, s in enumerate(self._sites):
+            self._masks[i, : s.size] = s.masks
+        # Anchor k-mers for each anchor length k: keys, site numbers and offsets
+        anchors = {}
+        for i, s in enumerate(self._sites):
+            keys, numbers, offsets = anchors.setdefault(s.k, ([], [], []))
+            keys.extend(s.keys)
+            numbers.extend([i] * len(s.keys))
+            offsets.extend([s.offset] * len(s.keys))
+        self._anchors = {
+            k: (
+                np.array(keys, dtype=np.uint64),
+                np.array(numbers, dtype=np.int64),
+                np.array(offsets, dtype=np.int64),
+            )
+            for k, (keys, numbers, offsets) in anchors.items()
+        }
+
+    def _find_regex(self, text: str, limits: np.ndarray) -> list:
+        """Start positions of each site, with regular expressions."""
+        return [
+            [m.start() for m in s.regex.finditer(text, 0, limit + s.size)]
+            for s, limit in zip(self._sites, limits.tolist())
+        ]
+
+    def _find_anchors(self, text: str, limits: np.ndarray) -> list:
+        """Start positions of each site, from the anchors."""
+        if self._anchors is None:
+            self._prepare_anchors()
+        starts = []
+        numbers = []
+        for k, (keys, site_numbers, offsets) in self._anchors.items():
+            if k is None:
+                # Sites without anchor, every position is a candidate
+                for number in np.unique(site_numbers).tolist():
+                    starts.append(np.arange(limits[number] + 1, dtype=np.int64))
+                    numbers.append(np.full(len(starts[-1]), number, dtype=np.int64))
+                continue
+            positions, found = KmerIndex(text, k).lookup(keys)
+            starts.append(positions - offsets[found])
+            numbers.append(site_numbers[found])
+        starts = np.concatenate(starts)
+        numbers = np.concatenate(numbers)
+        keep = (starts >= 0) & (starts <= limits[numbers])
+        starts = starts[keep]
+        numbers = numbers[keep]
+
+        # Compare the sites with the sequence, in chunks to limit the memory used.
+        # The sequence is padded, as the padded sites match any letter.
+        masks = _sequence_masks[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+        masks = np.concatenate((masks, np.full(self._max_size, 16, dtype=np.uint8)))
+        window = np.arange(self._max_size)
+        chunk = max(1, 2**20 // self._max_size)
+        keep = np.empty(len(starts), dtype=bool)
+        for start in range(0, len(starts), chunk):
+            s = starts[start : start + chunk]
+            n = numbers[start : start + chunk]
+            keep[start : start + chunk] = (
+                masks[s[:, None] + window] & self._masks[n]
+            ).all(axis=1)
+        starts = starts[keep]
+        numbers = numbers[keep]
+
+        order = np.lexsort((starts, numbers))
+        starts = starts[order]
+        bounds = np.searchsorted(numbers[order], np.arange(len(self._sites) + 1))
+        return [starts[lo:hi].tolist() for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def search(self, seq: "Dseq", linear: bool | None = None) -> dict:
+        """
+        Cut positions of each enzyme in seq.
+
+        The positions are the same as from ``enzyme.search(seq, linear)``
+        in Biopython, the first base after the cut, counting from 1.
+
+        Parameters
+        ----------
+        seq : Dseq
+            The sequence to search.
+        linear : bool, optional
+            If the sequence is searched as a linear sequence. The default is
+            the topology of seq.
+
+        Returns
+        -------
+        dict
+            A list of cut positions for each enzyme, in the same order as the enzymes.
+        """
+        if linear is None:
+            linear = not seq.circular
+        if not self._sites:
+            return {e: e.search(seq, linear=linear) for e, *_ in self._enzymes}
+
+        raw = bytes(seq)
+        data = raw.translate(FormattedSeq._table, delete=FormattedSeq._remove_chars)
+        if 0 in data:
+            raise TypeError(f"Invalid character found in {raw.decode()}")
+        length = len(data)
+        # Sites across the origin of circular sequences are found in the first
+        # bases added to the end, as in Biopython.
+        text = (data if linear else data + data[: self._max_size - 1]).decode("ascii")
+
+        # Last possible start of each site
+        if linear:
+            limits = length - self._sizes
+        else:
+            limits = np.minimum(self._sizes - 1, length) + length - self._sizes
+
+        if len(self._sites) <= _max_sites_for_regex:
+            found = self._find_regex(text, limits)
+        else:
+            found = self._find_anchors(text, limits)
+        # Biopython positions start at 1
+        found = {s: [x + 1 for x in f] for s, f in zip(self._sites, found)}
+
+        result = {}
+        for enzyme, forward, backward, modify, rev_modify, not_defined in self._enzymes:
+            if forward is None:
+                result[enzyme] = enzyme.search(seq, linear=linear)
+                continue
+            cuts = [x + m for x in found[forward] for m in modify]
+            if backward is not None:
+                # Where both orientations match, Biopython only uses the first
+                on_plus = set(found[forward])
+                cuts += [
+                    x + m
+                    for x in found[backward]
+                    if x not in on_plus
+                    for m in rev_modify
+                ]
+                cuts.sort()
+            if cuts and not (linear and not_defined):
+                cuts = _drop(cuts, length, linear, enzyme.ovhg)
+            result[enzyme] = cuts
+        return result
+
+
+def _drop(cuts: list, length: int, linear: bool, ovhg: int) -> list:
+    """Same as the _drop method of the Biopython enzymes."""
+    if linear:
+        return [cut for cut in cuts if 1 < cut <= length and 1 < cut - ovhg <= length]
+    for index, location in enumerate(cuts):
+        if location < 1:
+            cuts[index] += length
+        else:
+            break
+    for index, location in enumerate(cuts[::-1]):
+        if location > length:
+            cuts[-(index + 1)] -= length
+        else:
+            break
+    return cuts
+
+
+@lru_cache(maxsize=None)
+def _get_site(pattern: str) -> _Site:
+    return _Site(pattern)
+
+
+@lru_cache(maxsize=128)
+def _cached_scanner(enzymes: tuple) -> RestrictionScanner:
+    return RestrictionScanner(enzymes)
+
+
+def get_scanner(enzymes: Iterable[AbstractCut]) -> RestrictionScanner:
+    """
+    RestrictionScanner for the enzymes, the last few scanners are cached.
+
+    >>> from Bio.Restriction import EcoRI
+    >>> from pydna.restriction_scanner import get_scanner
+    >>> get_scanner([EcoRI]) is get_scanner((EcoRI,))
+    True
+    """
+    return _cached_scanner(tuple(dict.fromkeys(flatten(enzymes))))
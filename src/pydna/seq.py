@@ -21,7 +21,6 @@ from pydna.utils import rc
 
 from Bio.SeqUtils import seq3
 from Bio.SeqUtils import gc_fraction
-import re
 from Bio.Seq import Seq as _Seq
 from pydna._pretty import PrettyTable
 
@@ -202,22 +201,17 @@ class Seq(_Seq):
         return x
 
     def orfs2(self, minsize: int = 30) -> List[str]:
-        """docstring."""
-        orf = re.compile(
-            f"ATG(?:...){{{minsize},}}?(?:TAG|TAA|TGA)", flags=re.IGNORECASE
+        """ORFs starting with ATG, followed by at least minsize codons and
+        the first stop codon after those, longest first."""
+        from pydna.orf_finder import find_orfs
+
+        matches = sorted(
+            (start, end)
+            for _, _, start, end in find_orfs(
+                self, minsize=0, strands=(1,), offset=3 * (minsize + 1)
+            )
         )
-        start = 0
-        matches: List[slice] = []
-        s = self._data.decode("ASCII")
-
-        while True:
-            match = orf.search(s, pos=start)
-            if match:
-                matches.append(slice(match.start(), match.end()))
-                start = match.start() + 1
-            else:
-                break
-        return sorted([self[sl] for sl in matches], key=len, reverse=True)
+        return sorted([self[x:y] for x, y in matches], key=len, reverse=True)
 
     def orfs(self, minsize: int = 100) -> List[Tuple[int, int]]:
         dna = self._data.decode("ASCII")
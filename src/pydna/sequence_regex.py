@@ -4,7 +4,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from pydna.dseqrecord import Dseqrecord
+from pydna.template_index import TemplateIndex, normalize
 import re
+from typing import Iterator
 from Bio.Data.IUPACData import ambiguous_dna_values
 
 custom_ambiguous_only_dna_values = {**ambiguous_dna_values}
@@ -43,6 +45,76 @@ def dseqrecord_finditer(pattern: str, seq: Dseqrecord) -> list[re.Match]:
     Returns:
         A list of matches.
     """
-    query = str(seq.seq) if not seq.circular else str(seq.seq) * 2
-    matches = re.finditer(pattern, query)
+    text = str(seq.seq)
+    tokens = _site_tokens(pattern)
+    if not seq.circular:
+        query = text
+    elif tokens is not None:
+        # The matches have one base per token, so the ones that start in the
+        # sequence end in the first len(tokens) bases after the origin.
+        query = text + text[: len(tokens)]
+    else:
+        query = text * 2
+    index = seq.seq.template_index
+    seed = _literal_seed(tokens) if index is not None and tokens else None
+    if seed is None:
+        matches = re.finditer(pattern, query)
+    else:
+        matches = _indexed_finditer(pattern, query, index, *seed)
     return (m for m in matches if m.start() <= len(seq))
+
+
+def _site_tokens(pattern: str) -> list[str] | None:
+    """The bases of a pattern made by compute_regex_site, each one is a letter,
+    a set of letters in brackets or a dot. None if the pattern has another form."""
+    if not isinstance(pattern, str) or not pattern.startswith("(?i)"):
+        return None
+    body = pattern[4:]
+    tokens = re.findall(r"\[[A-Z]+\]|[A-Z]|\.", body)
+    if "".join(tokens) != body:
+        return None
+    return tokens
+
+
+# Shorter seeds have too many occurrences for the index to be faster than the regex
+_min_seed_length = 6
+
+
+def _literal_seed(tokens: list[str]) -> tuple[str, int] | None:
+    """Longest run of plain bases in the tokens of a pattern (see _site_tokens), and
+    its offset in the match. None if the run is too short."""
+    best, best_offset = "", 0
+    run, run_offset = "", 0
+    for i, token in enumerate(tokens):
+        if token.isalpha():
+            if not run:
+                run_offset = i
+            run += token
+            if len(run) > len(best):
+                best, best_offset = run, run_offset
+        else:
+            run = ""
+    if len(best) < _min_seed_length:
+        return None
+    return best, best_offset
+
+
+def _indexed_finditer(
+    pattern: str, query: str, index: TemplateIndex, seed: str, offset: int
+) -> Iterator[re.Match]:
+    """Same matches as re.finditer(pattern, query), but only the positions where the
+    seed is found in the index are tried. The pattern must match a fixed length."""
+    compiled = re.compile(pattern)
+    end = 0
+    for position in index.find_all(normalize(seed)):
+        start = position - offset
+        if start > len(query):
+            break
+        if start < end:
+            # Before the query, or overlapping the previous match (re.finditer
+            # does not return overlapping matches)
+            continue
+        match = compiled.match(query, start)
+        if match is not None:
+            end = match.end()
+            yield match
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Search index of a template sequence.
+
+A :class:`TemplateIndex` holds a suffix array of a sequence, so that all the
+occurrences of a substring are found by binary search instead of scanning the
+whole sequence. It also keeps the :class:`pydna.kmer_index.KmerIndex` tables
+used for searches with mismatches.
+
+The index is opt-in: it is made with :meth:`pydna.dseq.Dseq.build_index` or
+:meth:`pydna.dseqrecord.Dseqrecord.build_index` and stored on the Dseq object.
+The search functions that know about the index use it automatically
+(:meth:`pydna.dseq.Dseq.find`, :meth:`pydna.dseqrecord.Dseqrecord.find`,
+:func:`pydna.sequence_regex.dseqrecord_finditer` and
+:func:`pydna.assembly2.primer_template_overlap`). An index is only used while
+the sequence it was made from is unchanged.
+
+>>> from pydna.dseq import Dseq
+>>> seq = Dseq("aaGAATTCaagaattc")
+>>> index = seq.build_index()
+>>> index.find_all("GAATTC")
+[2, 10]
+>>> seq.find("gaattc")
+10
+>>> seq.template_index is index
+True
+"""
+
+from bisect import bisect_left, bisect_right
+import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pydna.alphabet import dscode_to_full_sequence_table
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydna.dseq import Dseq
+
+
+def normalize(text: str) -> str:
+    """Uppercase string where U is replaced by T, as used in the index."""
+    return text.upper().replace("U", "T")
+
+
+class TemplateIndex:
+    """
+    Suffix array of a Dseq object.
+
+    The indexed text is the sequence as returned by ``str(seq)``, uppercase
+    and with U replaced by T. Circular sequences are repeated twice, so that
+    matches spanning the origin are found.
+
+    Parameters
+    ----------
+    seq : Dseq
+        The sequence to index.
+    """
+
+    def __init__(self, seq: "Dseq"):
+        from pydivsufsort import divsufsort
+
+        # To detect if the sequence was replaced, see Dseq.template_index
+        self.data = seq._data
+        self.circular = seq.circular
+        self.length = len(seq._data)
+
+        uppercase = self.data.translate(dscode_to_full_sequence_table).upper()
+        self.has_u = b"U" in uppercase
+        text = uppercase.replace(b"U", b"T")
+        if self.circular:
+            text = text * 2
+        self.text = text.decode("ascii")
+        if text:
+            self.suffix_array = divsufsort(text)
+        else:
+            self.suffix_array = np.empty(0, dtype=np.int64)
+        # KmerIndex of text for each k, see pydna.kmer_index.hamming_search
+        self.kmer_indices = dict()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # The index is never modified, so copies of a sequence can share it.
+        return self
+
+    def positions(self, sub: str) -> np.ndarray:
+        """Sorted array of the start positions of all (overlapping) occurrences of sub in
+        the indexed text. The search is exact, sub should be normalized first."""
+        m = len(sub)
+        if m == 0 or m > len(self.text):
+            return np.empty(0, dtype=np.int64)
+        text = self.text
+
+        def prefix(i):
+            return text[i : i + m]
+
+        lo = bisect_left(self.suffix_array, sub, key=prefix)
+        hi = bisect_right(self.suffix_array, sub, lo=lo, key=prefix)
+        return np.sort(self.suffix_array[lo:hi]).astype(np.int64)
+
+    def find_all(self, sub: str) -> list[int]:
+        """Same as positions, but returns a list."""
+        return self.positions(sub).tolist()
+
+    def find(
+        self, sub: str | bytes, start: int = 0, end: int = sys.maxsize
+    ) -> int | None:
+        """
+        Same result as :meth:`pydna.dseq.Dseq.find` for the indexed sequence.
+
+        Returns None if the search can not be made with the index (empty or too
+        long sub, negative start), in that case the caller should search without it.
+        """
+        if isinstance(sub, str):
+            sub = sub.encode("ascii")
+        sub = bytes(sub)
+        n = self.length
+        m = len(sub)
+        if m == 0 or m > n or start < 0:
+            return None
+
+        if self.circular:
+            # Matches can span the origin, but must start in the sequence.
+            last = n - 1
+        else:
+            start, end, _ = slice(start, end).indices(n)
+            last = end - m
+
+        candidates = self.positions(
+            normalize(sub.translate(dscode_to_full_sequence_table).decode("ascii"))
+        )
+        data = self.data
+        for position in candidates[np.searchsorted(candidates, start) :].tolist():
+            if position > last:
+                break
+            # The index is case insensitive, Dseq.find is not.
+            found = data[position : position + m]
+            if position + m > n:
+                found += data[: position + m - n]
+            if found == sub:
+                return position
+        return -1
@@ -18,8 +18,14 @@ from typing import (
 
 # Import AbstractCut at runtime for CutSiteType
 from Bio.Restriction.Restriction import AbstractCut
+from Bio.Restriction.Restriction import FormattedSeq
+from pydna import _make_FormattedSeq_table
 from pydna.crispr import _cas
 
+# Override Bio.Restriction.FormattedSeq._table when Bio.Restriction is first
+# needed, rather than when pydna is imported.
+FormattedSeq._table = _make_FormattedSeq_table()
+
 if TYPE_CHECKING:
     from Bio.Restriction import RestrictionBatch
     from pydna.dseq import Dseq
@@ -9,13 +9,11 @@ import re
 import keyword
 import collections
 import itertools
-from copy import deepcopy
+from copy import copy, deepcopy
 from pydna.types import CutSiteType
 import sys
 import random
 import subprocess
-from bisect import bisect
-from math import ceil
 
 from pydna.codon import weights
 from pydna.codon import rare_codons
@@ -39,32 +37,18 @@ def three_frame_orfs(
     # startcodons: tuple[str, ...] = ("ATG",),
     # stopcodons: tuple[str, ...] = ("TAG", "TAA", "TGA"),
 ):
-    """Overlapping orfs in three frames."""
-    # breakpoint()
-    limit = ceil(limit / 3) - 1
-    dna = dna.upper()
+    """Overlapping orfs in three frames.
 
-    orfs = []
-
-    for frame in (0, 1, 2):
-
-        codons = [dna[i : i + 3] for i in range(frame, len(dna), 3)]
-
-        startdindices = [i for i, cd in enumerate(codons) if cd in startcodons]
-        stopdindices = [i for i, cd in enumerate(codons) if cd in stopcodons]
+    Returns (frame, start, end) for each ORF, see :func:`pydna.orf_finder.find_orfs`.
+    """
+    from pydna.orf_finder import find_orfs
 
-        for startindex in startdindices:
-            try:
-                stopindex = stopdindices[bisect(stopdindices, startindex)]
-            except IndexError:
-                pass
-            else:
-                if stopindex - startindex >= limit:
-                    orfs.append(
-                        (frame, startindex * 3 + frame, (stopindex + 1) * 3 + frame)
-                    )
-                # print(stopindex, startindex, limit)
-    return orfs
+    return [
+        (frame, start, end)
+        for _, frame, start, end in find_orfs(
+            dna, limit, startcodons, stopcodons, strands=(1,)
+        )
+    ]
 
 
 def shift_location(original_location, shift, lim):
@@ -133,8 +117,46 @@ def shift_feature(feature, shift, lim):
     """Return a new feature with shifted location."""
     # TODO: Missing tests
     new_location = shift_location(feature.location, shift, lim)
-    new_feature = deepcopy(feature)
-    new_feature.location = new_location
+    return copy_feature(feature, new_location)
+
+
+def _copy_qualifier(value):
+    # Qualifiers are almost always strings or lists of strings, strings can be shared.
+    if isinstance(value, str):
+        return value
+    if type(value) is list and all(isinstance(item, str) for item in value):
+        return list(value)
+    return deepcopy(value)
+
+
+def copy_feature(feature, location=None):
+    """
+    Copy of a SeqFeature, with a new location if given.
+
+    The copy is as independent from the original as a deepcopy (the qualifiers
+    dict and the lists it holds are new objects) but much faster, since the
+    strings in the qualifiers are shared instead of copied.
+
+    >>> from Bio.SeqFeature import SeqFeature, SimpleLocation
+    >>> from pydna.utils import copy_feature
+    >>> feature = SeqFeature(SimpleLocation(1, 5), type="CDS", qualifiers={"label": ["a"]})
+    >>> new = copy_feature(feature, SimpleLocation(2, 6))
+    >>> new.location
+    SimpleLocation(ExactPosition(2), ExactPosition(6))
+    >>> new.qualifiers == feature.qualifiers, new.qualifiers["label"] is feature.qualifiers["label"]
+    (True, False)
+    """
+    new_feature = copy(feature)
+    for key, value in vars(feature).items():
+        if key == "qualifiers":
+            value = copy(value)
+            for name, qualifier in value.items():
+                value[name] = _copy_qualifier(qualifier)
+        elif key == "location" and location is not None:
+            value = location
+        elif not isinstance(value, (str, int, float, type(None))):
+            value = deepcopy(value)
+        setattr(new_feature, key, value)
     return new_feature
 
 
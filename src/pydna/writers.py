@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2013-2026 Björn Johansson
+# SPDX-FileCopyrightText: 2023-2026 The Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Writers for Dseqrecord objects.
+
+:func:`write_record` writes the same text as :meth:`pydna.dseqrecord.Dseqrecord.format`
+to a file handle, and :func:`write_many` writes many records to one file.
+The Genbank ("gb" or "genbank"), "fasta" and "fasta-dscode" formats are
+written with faster versions of the Biopython writers, that give the
+same text. The Biopython writers are used for the features and qualifiers
+that the faster versions do not handle, and for the other formats.
+
+>>> import io
+>>> from pydna.dseqrecord import Dseqrecord
+>>> from pydna.writers import write_many
+>>> handle = io.StringIO()
+>>> write_many([Dseqrecord("acgt", id="a"), Dseqrecord("gg", id="b")], handle, "fasta")
+2
+>>> print(handle.getvalue())
+>a description
+acgt
+>b description
+gg
+<BLANKLINE>
+"""
+
+import copy
+import os
+import re
+from typing import Iterable, TextIO, TYPE_CHECKING
+
+from Bio.Seq import Seq as BPSeq
+from Bio.SeqFeature import ExactPosition, SimpleLocation
+from Bio.SeqIO.FastaIO import FastaWriter
+from Bio.SeqIO.InsdcIO import GenBankWriter
+
+from pydna.seqrecord import SeqRecord
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydna.dseqrecord import Dseqrecord
+
+# Feature keys and qualifier keys that Biopython writes without warnings
+_clean_feature_type = re.compile(r"[A-Za-z0-9_'*-]{1,15}")
+_clean_qualifier_key = re.compile(r"[A-Za-z0-9_'*-]{1,20}")
+_words = re.compile(".{1,10}", re.DOTALL)
+_clean_keys = {_clean_feature_type: set(), _clean_qualifier_key: set()}
+
+
+def _is_clean(key, pattern) -> bool:
+    """True if key is a str matching pattern, the keys found are cached."""
+    known = _clean_keys[pattern]
+    if key in known:
+        return True
+    if isinstance(key, str) and pattern.fullmatch(key):
+        if len(known) < 10000:
+            known.add(key)
+        return True
+    return False
+
+
+class _GenBankWriter(GenBankWriter):
+    """GenBankWriter with faster methods for the most common features and for
+    the sequence. The text is the same as with GenBankWriter."""
+
+    def _write_feature(self, feature, record_length):
+        location = feature.location
+        if (
+            type(location) is not SimpleLocation
+            or location.ref
+            or type(location._start) is not ExactPosition
+            or type(location._end) is not ExactPosition
+            or location._end - location._start < 2
+            or not _is_clean(feature.type, _clean_feature_type)
+        ):
+            return super()._write_feature(feature, record_length)
+
+        text = f"{int(location._start) + 1}..{int(location._end)}"
+        if location._strand == -1:
+            text = f"complement({text})"
+        lines = [
+            (self.QUALIFIER_INDENT_TMP % feature.type)[: self.QUALIFIER_INDENT]
+            + self._wrap_location(text)
+            + "\n"
+        ]
+        indent = self.QUALIFIER_INDENT_STR
+        for key, values in feature.qualifiers.items():
+            if not isinstance(values, (list, tuple)):
+                values = (values,)
+            fast = key not in self.FTQUAL_NO_QUOTE and _is_clean(
+                key, _clean_qualifier_key
+            )
+            for value in values:
+                if fast and isinstance(value, str):
+                    line = f'{indent}/{key}="' + value.replace('"', '""') + '"'
+                    if len(line) <= self.MAX_WIDTH:
+                        lines.append(line + "\n")
+                        continue
+                # Biopython wraps long lines and handles the other values.
+                self.handle.write("".join(lines))
+                lines = []
+                self._write_feature_qualifier(key, value)
+        self.handle.write("".join(lines))
+
+    def _write_sequence(self, record):
+        if (
+            not isinstance(record.seq, BPSeq)
+            or not record.seq.defined
+            or self.LETTERS_PER_LINE % 10
+        ):
+            return super()._write_sequence(record)
+        data = str(record.seq).lower()
+        # Words of 10 letters separated by spaces, each line has the same length
+        words = " ".join(_words.findall(data))
+        width = self.LETTERS_PER_LINE + self.LETTERS_PER_LINE // 10
+        lines = ["ORIGIN\n"]
+        lines.extend(
+            str(line_number + 1).rjust(self.SEQUENCE_INDENT)
+            + " "
+            + words[start : start + width - 1]
+            + "\n"
+            for line_number, start in zip(
+                range(0, len(data), self.LETTERS_PER_LINE),
+                range(0, len(words), width),
+            )
+        )
+        self.handle.write("".join(lines))
+
+
+class _FastaWriter(FastaWriter):
+    """FastaWriter that writes the sequence with one call to write."""
+
+    def write_record(self, record):
+        if self.record2title or not self.wrap or not isinstance(record.seq, BPSeq):
+            return super().write_record(record)
+        id = self.clean(record.id)
+        description = self.clean(record.description)
+        if description and description.split(None, 1)[0] == id:
+            title = description
+        elif description:
+            title = f"{id} {description}"
+        else:
+            title = id
+        assert "\n" not in title
+        assert "\r" not in title
+        data = str(record.seq)
+        assert "\n" not in data
+        assert "\r" not in data
+        lines = [f">{title}\n"]
+        lines.extend(
+            data[i : i + self.wrap] + "\n" for i in range(0, len(data), self.wrap)
+        )
+        self.handle.write("".join(lines))
+
+
+_writers = {"gb": _GenBankWriter, "genbank": _GenBankWriter, "fasta": _FastaWriter}
+
+
+def write_record(record: "Dseqrecord", handle: TextIO, format: str = "gb") -> None:
+    """
+    Write a Dseqrecord to an open text file handle.
+
+    The text is the same as :meth:`pydna.dseqrecord.Dseqrecord.format`
+    followed by a newline. The record is not copied, only its annotations dict.
+
+    Parameters
+    ----------
+    record : Dseqrecord
+        The record to write.
+    handle : file handle
+        A file handle opened in text mode, or an io.StringIO.
+    format : str, optional
+        A format supported by Biopython SeqIO for writing, or a format followed by
+        "dscode" (e.g. "fasta-dscode") to write the dscode of the sequence.
+        The default is "gb".
+    """
+    circular = record.circular
+    # Only the seq and the annotations are changed in this shallow copy.
+    record = copy.copy(record)
+    record.annotations = dict(record.annotations)
+    if "dscode" in format:
+        format = format.replace("dscode", "")
+        obj = BPSeq("")
+        obj._data = record.seq._data
+        record.seq = obj
+    format = format.strip(" -")
+    if format in ("genbank", "gb") and circular:
+        record.annotations["topology"] = "circular"
+    else:
+        record.annotations["topology"] = "linear"
+
+    writer = _writers.get(format)
+    if writer is None:
+        handle.write(SeqRecord.format(record, format).strip() + "\n")
+    else:
+        writer(handle).write_record(record)
+
+
+def write_many(
+    records: Iterable["Dseqrecord"], target: str | os.PathLike | TextIO, format="gb"
+) -> int:
+    """
+    Write Dseqrecord objects to one file.
+
+    Each record is written as with :func:`write_record`.
+
+    Parameters
+    ----------
+    records : iterable of Dseqrecord
+        The records to write.
+    target : str, path or file handle
+        Path of the file, it is overwritten if it exists, or a file handle
+        opened in text mode.
+    format : str, optional
+        See :func:`write_record`. The default is "gb".
+
+    Returns
+    -------
+    int
+        The number of records written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf8") as handle:
+            return write_many(records, handle, format)
+    count = 0
+    for record in records:
+        write_record(record, target, format)
+        count += 1
+    return count
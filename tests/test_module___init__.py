@@ -1,5 +1,54 @@
 #!/usr/bin/env python
 
+import os
+import subprocess
+import sys
+
 import pytest
 
-pytest
+import pydna
+
+
+def _imported(statement):
+    """Modules in sys.modules after statement in a new interpreter."""
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))\n"
+    # The new interpreter imports the same pydna as the tests
+    path = [os.path.dirname(os.path.dirname(pydna.__file__))]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path + sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(result.stdout.split())
+
+
+def test_lazy_submodules():
+    assert pydna.readers.__name__ == "pydna.readers"
+    assert "dseqrecord" in dir(pydna)
+    with pytest.raises(AttributeError):
+        pydna.not_a_module
+
+
+def test_lazy_imports():
+    heavy = {"Bio.Restriction", "networkx", "pydantic", "IPython", "pydna.dseq"}
+
+    assert not heavy & _imported("import pydna")
+    assert not heavy & _imported("import pydna.all")
+
+    modules = _imported("from pydna.dseqrecord import Dseqrecord")
+    assert not {"networkx", "pydantic", "IPython"} & modules
+
+    modules = _imported("from pydna.all import Dseq")
+    assert "pydna.dseq" in modules and "pydantic" not in modules
+
+
+def test_FormattedSeq_table():
+    from Bio.Restriction import EcoRI, FormattedSeq
+
+    from pydna.dseq import Dseq
+
+    assert FormattedSeq._table == pydna._make_FormattedSeq_table()
+    assert EcoRI.search(Dseq("aagaattcaa")) == [4]
@@ -25,3 +25,13 @@ def test_repr():
         "eq",
         "gbtext_clean",
     ]
+
+
+def test_lazy_names():
+    from pydna import all
+    from pydna.dseq import Dseq
+
+    assert all.Dseq is Dseq
+    assert set(all.__all__) <= set(dir(all))
+    with pytest.raises(AttributeError):
+        all.not_a_name
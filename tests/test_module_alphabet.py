@@ -2,10 +2,13 @@
 
 from textwrap import dedent
 
+import pytest
+
 from pydna.dseq import Dseq
 from pydna.alphabet import (
     # dictionaries
     basepair_dict,
+    basepair_table,
     annealing_dict,
     annealing_dict_w_holes,
     complement_dict_for_dscode,
@@ -29,6 +32,7 @@ from pydna.alphabet import (
     # helpers
     get_parts,
     dsbreaks,
+    dscode_from_strands,
     representation_tuple,
     anneal_strands,
 )
@@ -82,6 +86,30 @@ def test_basepair_dict():
     assert basepair_dict["G", "c"] == "G"
 
 
+def test_basepair_table():
+
+    for (w, c), symbol in basepair_dict.items():
+        assert chr(basepair_table[ord(w), ord(c)]) == symbol
+    assert (basepair_table != 0).sum() == len(basepair_dict)
+
+
+def test_dscode_from_strands():
+
+    assert dscode_from_strands("", "") == ""
+    assert dscode_from_strands("GATCga", "CTAGct") == "GATCga"
+    assert dscode_from_strands("GATC  ", "  AG  ") == "PETC  "
+
+    with pytest.raises(ValueError, match=r"\('A', 'A'\) at position 1"):
+        dscode_from_strands("GAT", "CAA")
+    with pytest.raises(ValueError, match="and 2 more"):
+        dscode_from_strands("A" * 12, "A" * 12)
+    with pytest.raises(ValueError):
+        dscode_from_strands("GAT", "CT")
+
+    with pytest.raises(ValueError, match=r"\('G', 'G'\) at position 0"):
+        Dseq("GATC", "GATG", ovhg=0)
+
+
 def test_complement_dict_for_dscode():
 
     assert complement_dict_for_dscode["G"] == "C"
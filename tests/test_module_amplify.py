@@ -846,3 +846,55 @@ def test_annotation():
         )
 
         assert product_seqs == feature_seqs, f"Shift {shift}"
+
+
+def test_annealing_positions_multi():
+    import random
+
+    from Bio.Seq import reverse_complement
+    from pydna.amplify import _annealing_positions, _annealing_positions_multi
+    from pydna.primer import Primer
+
+    random.seed(42)
+
+    # Short repeats, so that primers anneal at overlapping positions
+    unit = "".join(random.choice("acgt") for _ in range(6))
+    template = (
+        "".join(random.choice("acgt") for _ in range(300))
+        + unit * 8
+        + "".join(random.choice("acgtu") for _ in range(300))
+    )
+    primers = []
+    for _ in range(60):
+        start = random.randrange(len(template) - 30)
+        primer = list(template[start : start + random.randint(8, 30)])
+        # Mismatches in the tail, ambiguous nucleotides and tails
+        for j in random.sample(range(len(primer)), 2):
+            primer[j] = random.choice("acgtnryU")
+        primer = "".join(primer).replace("u", "t")
+        primers.append(random.choice(["", "gg"]) + primer)
+        primers.append(reverse_complement(primer))
+    primers += [unit * 2, "acg", "nnnnnnnn"]
+
+    for limit in (5, 8, 13):
+        assert _annealing_positions_multi(primers, template, limit) == [
+            _annealing_positions(p, template, limit) for p in primers
+        ]
+
+    # The Anneal results are the same in both modes
+    for circular in (False, True):
+        tmpl = Dseqrecord(template.replace("u", "t"), circular=circular)
+        for limit in (8, 13):
+            primer_objects = [Primer(p) for p in primers[:20]]
+            ann = Anneal(primer_objects, tmpl, limit=limit)
+            ann_multi = Anneal(primer_objects, tmpl, limit=limit, multi_pattern=True)
+            for attr in ("forward_primers", "reverse_primers"):
+                assert [
+                    (str(p.seq), p.position, p._fp) for p in getattr(ann, attr)
+                ] == [(str(p.seq), p.position, p._fp) for p in getattr(ann_multi, attr)]
+            assert [str(p.seq) for p in ann.products] == [
+                str(p.seq) for p in ann_multi.products
+            ]
+
+    ann = Anneal([Primer("GGATGACACCAGCTT")], tmpl, multi_pattern=True)
+    assert "multi_pattern" not in ann.kwargs
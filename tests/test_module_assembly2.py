@@ -30,6 +30,7 @@ from Bio.Seq import reverse_complement
 from pydna.primer import Primer
 import os
 import textwrap
+import itertools
 
 test_files = os.path.join(os.path.dirname(__file__))
 
@@ -2817,6 +2818,210 @@ def test_common_sub_strings():
             assert result[0][2] == 6
 
 
+def test_indexed_common_sub_strings():
+
+    a = Dseqrecord("RYBDKM", circular=True)
+    for shift_1 in range(len(a)):
+        a_shifted = a.shifted(shift_1)
+        for shift_2 in range(len(a)):
+            a_shifted_2 = a.shifted(shift_2)
+            algorithm = assembly.IndexedCommonSubStrings()
+            algorithm.index_sequences([a_shifted, a_shifted_2], 3)
+            assert algorithm(a_shifted, a_shifted_2, 3) == assembly.common_sub_strings(
+                a_shifted, a_shifted_2, 3
+            )
+
+    # Same graph as with common_sub_strings
+    fragments = [
+        Dseqrecord("AacgatCAtgctccTAAattctgc", name="a"),
+        Dseqrecord("TtgctccTAAattctgcGAGGacgatG", name="b"),
+        Dseqrecord("CattctgcGAGGacgatGacgatCAtgc", name="c", circular=True),
+        Dseqrecord("TtgctccTAAattctgcGAGGacgatG", name="d"),
+    ]
+    asm = assembly.Assembly(fragments, limit=5, use_fragment_order=False)
+    asm_indexed = assembly.Assembly(
+        fragments,
+        limit=5,
+        algorithm=assembly.IndexedCommonSubStrings(),
+        use_fragment_order=False,
+    )
+    assert list(asm.G.edges(keys=True)) == list(asm_indexed.G.edges(keys=True))
+    assert "IndexedCommonSubStrings" in repr(asm_indexed)
+
+    # Not indexed or different limit falls back to common_sub_strings
+    algorithm = assembly.IndexedCommonSubStrings()
+    x, y = fragments[:2]
+    assert algorithm(x, y, 5) == assembly.common_sub_strings(x, y, 5)
+    algorithm.index_sequences([x, y], 5)
+    assert algorithm(x, y, 6) == assembly.common_sub_strings(x, y, 6)
+    assert algorithm(y, x, 5) == assembly.common_sub_strings(y, x, 5)
+    assert algorithm(x, x, 5) == assembly.common_sub_strings(x, x, 5)
+
+
+def test_assembly_workers():
+    import pickle
+
+    fragments = [
+        Dseqrecord("AacgatCAtgctccTAAattctgc", name="a"),
+        Dseqrecord("TtgctccTAAattctgcGAGGacgatG", name="b"),
+        Dseqrecord("CattctgcGAGGacgatGacgatCAtgc", name="c", circular=True),
+    ]
+    asm = assembly.Assembly(fragments, limit=5, use_fragment_order=False)
+    asm_parallel = assembly.Assembly(
+        fragments, limit=5, use_fragment_order=False, workers=2
+    )
+    assert list(asm.G.edges(keys=True)) == list(asm_parallel.G.edges(keys=True))
+    assert [assembly.assembly2str(a) for a in asm.get_linear_assemblies()] == [
+        assembly.assembly2str(a) for a in asm_parallel.get_linear_assemblies()
+    ]
+
+    # Algorithms built by the assembly functions can be sent to worker processes
+    algorithm = assembly.combine_algorithms(
+        assembly.blunt_overlap, assembly.sticky_end_sub_strings
+    )
+    assert pickle.loads(pickle.dumps(algorithm)).__name__ == "combined"
+
+    backbone = Dseqrecord("cccGAATTCaaaGTCGACccc", circular=True)
+    insert = Dseqrecord("ggGAATTCaggtGTCGACgg")
+    products = assembly.restriction_ligation_assembly(
+        [backbone, insert], [EcoRI, SalI], circular_only=True
+    )
+    products_parallel = assembly.restriction_ligation_assembly(
+        [backbone, insert], [EcoRI, SalI], circular_only=True, workers=2
+    )
+    assert [str(p.seq) for p in products] == [str(p.seq) for p in products_parallel]
+
+    template = Dseqrecord("AATTAGCAGCGATCGAGTaaaCCCATTGTCGCAGTCG")
+    fwd = Primer("TTAGCAGCGATCG")
+    rvs = Primer("CGACTGCGACAATG")
+    products = assembly.pcr_assembly(template, fwd, rvs, limit=10)
+    products_parallel = assembly.pcr_assembly(template, fwd, rvs, limit=10, workers=2)
+    assert len(products) == 1
+    assert [str(p.seq) for p in products] == [str(p.seq) for p in products_parallel]
+
+
+def test_fragment_cache():
+    seqr = Dseqrecord("aaacgU", circular=True)
+    cache = assembly.FragmentCache(seqr)
+    assert cache.uppercase == "AAACGU"
+    assert cache.uppercase_dna == "AAACGT"
+    assert cache.doubled_uppercase == "AAACGUAAACGU"
+    assert cache.doubled_uppercase_dna == assembly.seqrecord2_uppercase_DNA_string(seqr)
+    assert cache.reverse_complement is cache.reverse_complement
+    assert str(cache.reverse_complement.seq) == str(seqr.reverse_complement().seq)
+
+    # Caches are only shared inside a scope, and a new one is made if the sequence is replaced
+    with assembly.fragment_cache_scope([cache]):
+        assert assembly.fragment_cache(seqr) is cache
+        with assembly.fragment_cache_scope([]):
+            assert assembly.fragment_cache(seqr) is cache
+        seqr.seq = Dseq("ttt")
+        assert assembly.fragment_cache(seqr).uppercase == "TTT"
+    assert assembly.fragment_cache(seqr) is not cache
+
+    # The assembly graph uses the cached reverse complements
+    fragments = [
+        Dseqrecord("AacgatCAtgctccTAAattctgc", name="a"),
+        Dseqrecord("TtgctccTAAattctgcGAGGacgatG", name="b"),
+    ]
+    asm = assembly.Assembly(fragments, limit=5)
+    assert asm.G.nodes[-1]["seq"] is asm.fragment_caches[0].reverse_complement
+    assert [str(p.seq) for p in asm.assemble_linear()] == [
+        str(assembly.assemble(fragments, a).seq) for a in asm.get_linear_assemblies()
+    ]
+
+
+def test_iter_assemblies():
+    fragments = [
+        Dseqrecord("AacgatCAtgctccTAAattctgc", name="a"),
+        Dseqrecord("TtgctccTAAattctgcGAGGacgatG", name="b"),
+        Dseqrecord("CattctgcGAGGacgatGacgatCAtgc", name="c", circular=True),
+    ]
+    asm = assembly.Assembly(fragments, limit=5, use_fragment_order=False)
+
+    # Same results and order as the list versions
+    linear = asm.get_linear_assemblies()
+    circular = asm.get_circular_assemblies()
+    assert len(linear) > 1
+    assert len(circular) > 0
+    assert list(asm.iter_linear_assemblies()) == linear
+    assert list(asm.iter_circular_assemblies()) == circular
+    assert [str(p.seq) for p in asm.iter_assemble_linear()] == [
+        str(p.seq) for p in asm.assemble_linear()
+    ]
+    assert [str(p.seq) for p in asm.iter_assemble_circular()] == [
+        str(p.seq) for p in asm.assemble_circular()
+    ]
+    assert list(asm.iter_linear_assemblies(only_adjacent_edges=True)) == (
+        asm.get_linear_assemblies(only_adjacent_edges=True)
+    )
+
+    # No max_assemblies limit, and we can stop early
+    with pytest.raises(ValueError):
+        asm.get_linear_assemblies(max_assemblies=1)
+    assert list(itertools.islice(asm.iter_linear_assemblies(), 1)) == linear[:1]
+
+    # Ordering
+    by_length = list(asm.iter_linear_assemblies(order="longest"))
+    assert sorted(map(assembly.assembly2str, by_length)) == sorted(
+        map(assembly.assembly2str, linear)
+    )
+    product_lengths = [
+        sum(len(fragments[abs(n) - 1]) for n in {e[0] for e in a} | {e[1] for e in a})
+        for a in by_length
+    ]
+    assert product_lengths == sorted(product_lengths, reverse=True)
+    with pytest.raises(ValueError):
+        asm.iter_linear_assemblies(order="fewest_edges")
+    with pytest.raises(ValueError):
+        asm.iter_circular_assemblies(order="wrong")
+    fewest = list(asm.iter_circular_assemblies(order="fewest_edges"))
+    assert sorted(map(assembly.assembly2str, fewest)) == sorted(
+        map(assembly.assembly2str, circular)
+    )
+    assert [len(a) for a in fewest] == sorted(len(a) for a in fewest)
+
+    # Subclasses
+    template = Dseqrecord("AATTAGCAGCGATCGAGTaaaCCCATTGTCGCAGTCG")
+    fwd = Primer("TTAGCAGCGATCG")
+    rvs = Primer("CGACTGCGACAATG")
+    asm = assembly.PCRAssembly([fwd, template, rvs], limit=10)
+    assert [str(p.seq) for p in asm.iter_assemble_linear()] == [
+        str(p.seq) for p in asm.assemble_linear()
+    ]
+    with pytest.raises(NotImplementedError):
+        asm.iter_linear_assemblies(only_adjacent_edges=True)
+    with pytest.raises(NotImplementedError, match="iter_circular_assemblies"):
+        asm.iter_circular_assemblies()
+
+    asm = assembly.SingleFragmentAssembly([Dseqrecord("cccTTTTTaaaTTTTTggg")], limit=5)
+    assert list(asm.iter_circular_assemblies()) == asm.get_circular_assemblies()
+    with pytest.raises(NotImplementedError):
+        asm.iter_linear_assemblies()
+
+    # A combinatorial library, too large for the list versions
+    homology = "ACGTTGCAAGCT"
+    fragments = [
+        Dseqrecord(homology + motif * 3 + homology)
+        for motif in ("AAAC", "CCCA", "GGGT", "TTTG", "ACAC", "GAGA", "CTCT")
+    ]
+    asm = assembly.Assembly(fragments, limit=12, use_fragment_order=False)
+    with pytest.raises(ValueError):
+        asm.get_linear_assemblies()
+    with pytest.raises(ValueError):
+        asm.get_circular_assemblies()
+    # The paths are found as they are needed, so the first hits come at once
+    first = list(itertools.islice(asm.iter_linear_assemblies(), 3))
+    assert len(first) == 3
+    assert all(len(a) == len(fragments) - 1 for a in first)
+    assert len(list(itertools.islice(asm.iter_circular_assemblies(), 3))) == 3
+    # At most max_paths node paths are used, with a warning
+    with pytest.warns(UserWarning, match="max_paths"):
+        assert len(list(asm.iter_linear_assemblies(max_paths=5))) > 0
+    with pytest.warns(UserWarning, match="max_paths"):
+        assert len(list(asm.iter_circular_assemblies(max_paths=5))) > 0
+
+
 def test_in_vivo_assembly():
     # For the test we pass input fragments + expected output
     test_cases = [
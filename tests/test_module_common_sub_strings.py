@@ -67,3 +67,31 @@ def test_fast():
     (8, 1, 2)
     (8, 4, 2) 6
     """
+
+
+def test_all_pairs_common_sub_strings():
+    import random
+    from pydna import common_sub_strings
+
+    random.seed(42)
+    for _ in range(200):
+        alphabet = random.choice(["A", "AC", "ACGT"])
+        strings = [
+            "".join(random.choice(alphabet) for _ in range(random.randint(0, 30)))
+            for _ in range(random.randint(1, 5))
+        ]
+        # Identical strings
+        strings.append(strings[0])
+        limit = random.randint(1, 6)
+        result = common_sub_strings.all_pairs_common_sub_strings(strings, limit)
+        for i in range(len(strings)):
+            for j in range(i + 1, len(strings)):
+                expected = (
+                    common_sub_strings.common_sub_strings(strings[i], strings[j], limit)
+                    if strings[i] and strings[j]
+                    else []
+                )
+                assert result.get((i, j), []) == expected
+
+    assert common_sub_strings.all_pairs_common_sub_strings([]) == {}
+    assert common_sub_strings.all_pairs_common_sub_strings(["", ""]) == {}
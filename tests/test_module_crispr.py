@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 
+import random
+
 import pytest
+import regex
 from Bio.Restriction import BamHI
 from pydna.dseqrecord import Dseqrecord
 from pydna.dseq import Dseq
 from Bio.Restriction import SapI
 from pydna.parsers import parse_primers
-from pydna.crispr import cas9, protospacer
+from pydna.crispr import PamIndex, cas9, protospacer
+from pydna.utils import rc as reverse_complement
 from pydna.assembly import Assembly
 from textwrap import dedent
 from Bio.Seq import Seq
@@ -352,3 +356,59 @@ def test_cut():
             products = seq_shifted_rc.cut(enz)
             seguids = set(f.seq.seguid() for f in products)
             assert seguids == expected
+
+
+def test_pam_index():
+    random.seed(42)
+    text = "".join(random.choice("ACGTacgt") for _ in range(3000))
+    guides = [text[p : p + 20].upper() for p in range(0, 2900, 97)]
+    guides += [reverse_complement(g) for g in guides[:10]]
+    guides += ["ACGTACGTACGTACGTACGT", "GTTACTTTACCCGACGTCC", "GTTACTTTACNCGACGTCCC"]
+
+    for circular in (False, True):
+        dseq = Dseq(text, circular=circular)
+        index = PamIndex(Dseqrecord(dseq))
+        assert index.linear is not circular
+        found = index.search(guides)
+        for guide in guides:
+            expected = sorted(set(cas9(guide).search(dseq, linear=not circular)))
+            assert found[guide] == expected
+
+        # With mismatches, compared with all the sites found with regex
+        sites = {}
+        for strand, strand_text in (
+            (1, text.upper()),
+            (-1, reverse_complement(text.upper())),
+        ):
+            if circular:
+                strand_text += strand_text[:22]
+            for m in regex.finditer(
+                "(?=([ACGT]{20}).GG)", strand_text, overlapped=True
+            ):
+                start = m.start()
+                cut = start + 18 if strand == 1 else len(text) - start - 16
+                sites.setdefault(m.group(1), set()).add(cut % len(text))
+        for guide in guides[:-2]:
+            distances = {}
+            for site, cuts in sites.items():
+                distance = sum(a != b for a, b in zip(site, guide))
+                if distance <= 3:
+                    distances.setdefault(distance, []).extend(cuts)
+            within = sorted(set(c for d in range(3) for c in distances.get(d, [])))
+            assert index.search([guide], mismatches=2)[guide] == within
+            assert index.count([guide], mismatches=3)[guide] == [
+                sum(
+                    1
+                    for site in sites
+                    if sum(a != b for a, b in zip(site, guide)) == d
+                    for _ in sites[site]
+                )
+                for d in range(4)
+            ]
+
+    with pytest.raises(ValueError):
+        index.search(["GTTACTTTACNCGACGTCCC"], mismatches=1)
+    with pytest.raises(ValueError):
+        index.count(["GTTACTTTACCCGACGTCC"])
+    assert len(PamIndex("AAAA")) == 0
+    assert repr(PamIndex("ACGTACGTACGTACGTACGTAGGTT")) == "PamIndex(cas9, 1 sites)"
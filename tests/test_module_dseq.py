@@ -1919,3 +1919,63 @@ def test_shifted2():
     for i in range(len(x)):
         assert x.shifted(i)._data == x._data[i:] + x._data[:i]
         repr_strings[i] == "\n".join(repr(x).splitlines()[1:])
+
+
+def test_cached_parts():
+    from pydna.dseq import Dseq
+    import copy
+
+    a = Dseq.from_representation(
+        """
+    GATCaa
+      AGttcc
+    """
+    )
+    assert a.ovhg == -2
+    assert a.watson == "GATCaa"
+    assert a.crick == "ccttGA"
+    assert a.get_parts() is a.get_parts()
+    assert a.watson is a.watson
+
+    # The cached values are not used when _data is replaced
+    b = copy.copy(a)
+    b._data = b"GATC"
+    assert b.ovhg == 0
+    assert b.watson == "GATC"
+    assert b.crick == "GATC"
+    assert a.ovhg == -2
+    assert a.watson == "GATCaa"
+
+    # Copies can keep the cached values
+    c = copy.deepcopy(a)
+    assert c.get_parts() == a.get_parts()
+    assert c.five_prime_end() == a.five_prime_end()
+    assert c.three_prime_end() == a.three_prime_end()
+
+
+def test_circular_bytes():
+    from pydna.dseq import CircularBytes, Dseq
+
+    cb = CircularBytes(b"ABCDE")
+    assert cb[3:2] == b"DEAB"
+    assert cb[-2:] == b"DE"
+    assert cb[3:3] == b"DEABC"
+    assert cb[0:12] == b"ABCDEABCDEA"
+    assert cb[4:1:-1] == b"EDC"
+    assert cb[1:1:2] == b"BDA"
+    assert cb.cutaround(3, 7) == b"DEABCDE"
+    assert cb.cutaround(-1, 4) == b"EABC"
+
+    assert cb.find("EA") == 4
+    assert cb.find(b"DEAB") == 3
+    assert cb.find("EAB", 2) == 4
+    assert cb.find("AB", 1) == -1
+    assert cb.find("CDEABC") == 2
+    assert cb.find("CDEABCDEAB") == -1
+    assert cb.find("") == 0
+
+    # Slices of circular Dseq objects are linear with plain bytes
+    ds = Dseq("GATCCaa", circular=True)
+    assert ds[5:2] == Dseq("aaGA")
+    assert type(ds[5:2]._data) is bytes
+    assert ds.find("aaG") == 5
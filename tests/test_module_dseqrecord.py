@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # flake8: noqa: B950
 
+import copy
 import pytest
 import warnings
 
@@ -556,7 +557,7 @@ def test_write_different_file_to_stamped_existing_file(monkeypatch):
 
     assert m.called
     # m.write().assert_called_once_with(new.format())
-    assert m.call_count == 4  # 6
+    assert m.call_count == 3  # 6
     assert m.mock_calls[0]
     assert m.mock_calls[4]
 
@@ -595,7 +596,7 @@ def test_write_different_file_to_stamped_existing_file2(monkeypatch):
 
     assert m.called
     # m.write().assert_called_once_with(new.format())
-    assert m.call_count == 4  # 6
+    assert m.call_count == 3  # 6
     assert m.mock_calls[0]
     assert m.mock_calls[4]
 
@@ -2044,6 +2045,55 @@ def test_shifted():
     with pytest.raises(TypeError):
         s.shifted(1)
 
+    # The shifted record and its features are independent copies
+    s = Dseqrecord("GGATCCgaattc", circular=True)
+    s.add_feature(1, 4, label="a")
+    s.add_feature(10, 12, label="b")
+    s.features[0].qualifiers["note"] = ["n"]
+    s.annotations["note"] = ["x"]
+    b = s.shifted(2)
+    assert str(b.seq) == "ATCCgaattcGG"
+    assert [str(f.location) for f in b.features] == [
+        "join{[11:12](+), [0:2](+)}",
+        "[8:10](+)",
+    ]
+    b.features[0].qualifiers["note"].append("c")
+    b.annotations["note"].append("y")
+    assert s.features[0].qualifiers["note"] == ["n"]
+    assert s.annotations["note"] == ["x"]
+    assert s.features[0].location.start == 1
+
+    # Adding does not change the features of the second record
+    c = Dseqrecord("aaa") + s[:]
+    assert str(c.features[0].location) == "[4:7](+)"
+    assert str(s.features[0].location) == "[1:4](+)"
+
+
+def test_detach():
+    s = Dseqrecord("GGATCCgaattc", circular=True)
+    s.add_feature(1, 4, label="a")
+    s.features[0].qualifiers["note"] = ["n"]
+    s.annotations["note"] = ["x"]
+    s.letter_annotations["quality"] = list(range(12))
+    d = s.detach()
+    assert d == copy.deepcopy(s)
+    assert d.seq is s.seq
+    d.features[0].location += 1
+    d.features[0].qualifiers["note"].append("c")
+    d.annotations["note"].append("y")
+    d.letter_annotations["quality"][0] = 100
+    d.add_feature(2, 3)
+    assert str(s.features[0].location) == "[1:4](+)"
+    assert s.features[0].qualifiers["note"] == ["n"]
+    assert s.annotations["note"] == ["x"]
+    assert s.letter_annotations["quality"][0] == 0
+    assert len(s.features) == 1
+
+    # format does not change the record
+    s.annotations["topology"] = "linear"
+    assert "circular" in s.format("gb").splitlines()[0]
+    assert s.annotations["topology"] == "linear"
+
 
 def test_looped():
 
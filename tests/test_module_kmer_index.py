@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+import random
+
+import pytest
+import regex
+
+from pydna.kmer_index import KmerIndex, hamming_search, kmer_key
+
+
+def test_kmer_index():
+    index = KmerIndex("ACGTTACGTNacg", 3)
+    assert index.find("ACG") == [0, 5, 10]
+    assert index.find("acg") == [0, 5, 10]
+    assert index.find("TTT") == []
+    assert index.find("GTN") is None
+    assert index.find("AC") is None
+    assert KmerIndex("AC", 3).find("ACG") == []
+    with pytest.raises(ValueError):
+        KmerIndex("ACGT", 0)
+    with pytest.raises(ValueError):
+        KmerIndex("ACGT", 32)
+
+
+def test_lookup():
+    index = KmerIndex("ACGTTACGTNacg", 3)
+    kmers = ["ACG", "TTT", "GTT", "CGT"]
+    positions, found = index.lookup([kmer_key(kmer) for kmer in kmers])
+    assert positions.tolist() == [0, 5, 10, 2, 1, 6]
+    assert found.tolist() == [0, 0, 0, 2, 3, 3]
+    positions, found = index.lookup([])
+    assert positions.tolist() == found.tolist() == []
+    assert kmer_key("TTT") == 63
+    assert kmer_key("TTN") is None
+
+
+def test_hamming_search():
+    random.seed(0)
+    for trial in range(500):
+        alphabet = "ACGTN" if trial % 5 == 0 else "ACGT"
+        subject = "".join(
+            random.choice(alphabet) for _ in range(random.randint(0, 300))
+        )
+        m = random.randint(1, 70)
+        if len(subject) > m and random.random() < 0.7:
+            start = random.randrange(len(subject) - m)
+            query = list(subject[start : start + m])
+            for _ in range(random.randint(0, 4)):
+                query[random.randrange(m)] = random.choice("ACGTN")
+            query = "".join(query)
+        else:
+            query = "".join(random.choice("ACGT") for _ in range(m))
+        mismatches = random.randint(0, 4)
+
+        pattern = "(" + query + "){s<=" + str(mismatches) + "}"
+        expected = {
+            m.start() for m in regex.finditer(pattern, subject, overlapped=True)
+        }
+        assert hamming_search(query, subject, mismatches) == sorted(expected)
+
+    # Indices are reused
+    indices = dict()
+    assert hamming_search("ACGTAC", "TTACGTACTTACCTACTT", 1, indices) == [2, 6, 10]
+    assert list(indices) == [3]
+    index = indices[3]
+    assert hamming_search("ACGCAC", "TTACGTACTTACCTACTT", 1, indices) == [2]
+    assert indices[3] is index
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import random
+
+from Bio.Data import CodonTable
+from Bio.Seq import translate
+
+from pydna.dseq import Dseq
+from pydna.dseqrecord import Dseqrecord
+from pydna.orf_finder import find_orfs, orf_features
+from pydna.seq import ProteinSeq
+from pydna.utils import rc
+
+
+def _orfs(text, minsize, startcodons, stopcodons):
+    """ORFs of the watson strand, codon by codon."""
+    out = []
+    text = text.upper()
+    startcodons = [codon.upper() for codon in startcodons]
+    for frame in (0, 1, 2):
+        codons = [text[i : i + 3] for i in range(frame, len(text) - 2, 3)]
+        for i, codon in enumerate(codons):
+            if codon not in startcodons:
+                continue
+            for j in range(i + 1, len(codons)):
+                if codons[j] in stopcodons:
+                    if (j - i + 1) * 3 >= minsize:
+                        out.append((frame, frame + 3 * i, frame + 3 * j + 3))
+                    break
+    return out
+
+
+def test_find_orfs():
+    random.seed(1)
+    table = CodonTable.unambiguous_dna_by_id[11]
+    for _ in range(100):
+        text = "".join(
+            random.choice("ACGTacgtN") for _ in range(random.randint(0, 400))
+        )
+        for minsize, startcodons, stopcodons in (
+            (0, ("ATG",), ("TAG", "TAA", "TGA")),
+            (31, ("ATG", "gtg"), ("TAA",)),
+            (60, table.start_codons, table.stop_codons),
+        ):
+            expected = [
+                (1, *orf) for orf in _orfs(text, minsize, startcodons, stopcodons)
+            ]
+            for frame, start, end in _orfs(rc(text), minsize, startcodons, stopcodons):
+                expected.append((-1, frame, len(text) - end, len(text) - start))
+            assert list(find_orfs(text, minsize, startcodons, stopcodons)) == expected
+            assert list(find_orfs(text.encode(), minsize, startcodons, stopcodons)) == (
+                expected
+            )
+
+    assert list(find_orfs("ATGATGAAATAA", 0, nested=False)) == [(1, 0, 0, 12)]
+    assert list(find_orfs("ATGATGAAATAA", 0)) == [(1, 0, 0, 12), (1, 0, 3, 12)]
+    # TTG is a start codon in table 11
+    assert list(find_orfs("TTGAAATAA", 0, startcodons=None, table=11)) == [(1, 0, 0, 9)]
+    assert list(find_orfs("TTGAAATAA", 0)) == []
+    assert list(find_orfs(Dseq("ccATGAAATAGcc"), 9, strands=(-1,))) == []
+    assert list(find_orfs("", 0)) == []
+    # The stop codon is searched at least offset bases after the start codon
+    assert list(find_orfs("ATGTAAAAATAG", 0, strands=(1,))) == [(1, 0, 0, 6)]
+    assert list(find_orfs("ATGTAAAAATAG", 0, strands=(1,), offset=6)) == [(1, 0, 0, 12)]
+
+
+def test_orf_features():
+    random.seed(2)
+    text = "".join(random.choice("ACGT") for _ in range(3000))
+    record = Dseqrecord(text)
+    features = record.orfs_to_features(minsize=90)
+    assert features
+    assert [
+        (f.location.strand, f.location.start, f.location.end) for f in features
+    ] == [(strand, start, end) for strand, _, start, end in find_orfs(text, 90)]
+    assert {f.location.strand for f in features} == {1, -1}
+    for feature in features:
+        orf = feature.extract(record)
+        assert str(orf.seq).startswith("ATG")
+        protein = translate(str(orf.seq), table=11, to_stop=True)
+        assert feature.qualifiers["translation"] == protein
+        assert feature.qualifiers["checksum"] == [
+            orf.seguid() + " (DNA)",
+            ProteinSeq(protein).seguid() + " (protein)",
+        ]
+        assert feature.qualifiers["transl_table"] == 11
+
+    # Other letters are checked by the seguid package
+    feature, *_ = orf_features("ATGNAAATGTAA", minsize=0)
+    assert feature.qualifiers["translation"] == "MXM"
+    assert feature.qualifiers["checksum"] == [
+        Dseqrecord("ATGNAAATGTAA").seguid() + " (DNA)",
+        ProteinSeq("MXM").seguid() + " (protein)",
+    ]
+    assert next(orf_features(record, minsize=90)).qualifiers == features[0].qualifiers
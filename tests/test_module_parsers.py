@@ -5,12 +5,15 @@ test parse
 
 import io
 import os
+import shutil
 
 from Bio.SeqIO import parse as BPparse
 from pydna.parsers import (
     embl_gb_fasta,
     extract_from_text,
+    iparse,
     parse,
+    parse_files,
     parse_primers,
     parse_snapgene,
 )
@@ -440,6 +443,94 @@ def test_parse_is_path():
     assert len(parse(file_name, is_path=True)) == 1
 
 
+def test_iparse():
+    # Same sequences as parse, for text, files, handles, directories and globs
+    text = "".join(
+        open(os.path.join(test_files, name), encoding="utf-8").read()
+        for name in ("pAG25.gb", "RefDataBjorn.fas", "pth1.txt")
+    )
+    expected = [x.format("gb") for x in parse(text)]
+    assert len(expected) == 774
+    assert [x.format("gb") for x in iparse(text)] == expected
+    assert [x.format("gb") for x in iparse(io.StringIO(text))] == expected
+    assert [x.format("gb") for x in iparse([text], ds=False)] == [
+        x.format("gb") for x in parse(text, ds=False)
+    ]
+
+    records = iparse(os.path.join(test_files, "pth1.txt"))
+    assert next(records).source.index_in_file == 0
+    x = next(records)
+    assert x.source.index_in_file == 1
+    assert x.source.file_name == os.path.join(test_files, "pth1.txt")
+    assert next(records, None) is None
+
+    directory = os.path.join(test_files, "broken_genbank_files")
+    paths = [os.path.join(directory, name) for name in sorted(os.listdir(directory))]
+    from_directory = list(iparse(directory))
+    assert [x.seguid() for x in from_directory] == [x.seguid() for x in parse(paths)]
+    from_glob = list(iparse(os.path.join(directory, "*.ape")))
+    assert [x.seguid() for x in from_glob] == [
+        x.seguid() for x in from_directory if x.source.file_name.endswith(".ape")
+    ]
+    assert list(iparse(os.path.join(directory, "*.missing"))) == []
+
+
+def test_iparse_directory_with_binary_files(tmp_path):
+    # ABIF traces and other binary files in a directory are skipped
+    for name in ("pAG25.gb", "02-G1_B01_013.ab1", "profile.pstat"):
+        shutil.copy(os.path.join(test_files, name), tmp_path)
+    expected = [x.seguid() for x in parse(os.path.join(test_files, "pAG25.gb"))]
+    assert [x.seguid() for x in iparse(tmp_path)] == expected
+    assert [x.seguid() for x in iparse(os.path.join(tmp_path, "*"))] == expected
+    assert [
+        (os.path.basename(path), [x.seguid() for x in records])
+        for path, records in parse_files(tmp_path)
+    ] == [("pAG25.gb", expected)]
+    # A binary file given by its path is still read, and fails
+    with pytest.raises(UnicodeDecodeError):
+        list(iparse(os.path.join(tmp_path, "02-G1_B01_013.ab1")))
+
+
+def test_parse_files():
+    paths = [
+        os.path.join(test_files, name)
+        for name in ("pAG25.gb", "profile.pstat", "RefDataBjorn.fas", "pth1.txt")
+    ]
+    expected = [
+        (path, [x.format("gb") for x in parse(path)])
+        for path in paths
+        if not path.endswith(".pstat")
+    ]
+    for workers in (None, 2):
+        for ordered in (True, False):
+            errors = []
+            calls = []
+            result = [
+                (path, [x.format("gb") for x in records])
+                for path, records in parse_files(
+                    paths,
+                    workers=workers,
+                    ordered=ordered,
+                    errors=errors,
+                    progress=lambda done, total, calls=calls: calls.append(
+                        (done, total)
+                    ),
+                )
+            ]
+            if ordered:
+                assert result == expected
+            else:
+                assert sorted(result) == sorted(expected)
+            assert [path for path, error in errors] == [paths[1]]
+            assert isinstance(errors[0][1], UnicodeDecodeError)
+            assert calls == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    with pytest.raises(UnicodeDecodeError):
+        list(parse_files(paths))
+    with pytest.raises(FileNotFoundError):
+        list(parse_files(">a\nACGT"))
+
+
 def test_permissive_parser_ape_topology():
     assert read(f"{test_files}/broken_genbank_files/P2RP3.ape").circular is True
     assert read(f"{test_files}/broken_genbank_files/P2RP3_linear.ape").circular is False
@@ -452,3 +452,138 @@ def test_diff_primer_triplets():
     assert (
         diff_primer_triplets((t1, t3), [f, r, r2], automaton=automaton3, short=0) == []
     )
+
+
+def test_automaton_cache(tmp_path):
+    from pydna.primer_screen import AutomatonCache
+
+    reference = make_automaton(pl)
+    cache = AutomatonCache(tmp_path, max_entries=2)
+    atm1 = cache.get(pl)
+    assert [x for x in atm1.items()] == [x for x in reference.items()]
+    assert len(list(tmp_path.glob("*.automaton"))) == 1
+    assert forward_primers(kan, pl, automaton=cache) == forward_primers(
+        kan, pl, automaton=reference
+    )
+    assert primer_pairs(kan, pl, automaton=cache) == primer_pairs(
+        kan, pl, automaton=reference
+    )
+
+    # Loaded from disk by a new cache
+    atm2 = AutomatonCache(tmp_path).get(pl)
+    assert [x for x in atm2.items()] == [x for x in atm1.items()]
+
+    # The key depends on the primer sequences, their order and the limit
+    assert cache.key(pl) == AutomatonCache(tmp_path).key(list(pl))
+    assert cache.key(pl) != cache.key(pl, limit=15)
+    assert cache.key(pl) != cache.key(pl[::-1])
+    assert cache.key(pl) != cache.key(pl[:-1] + [None])
+
+    # Least recently used automata are removed
+    cache.get(pl, limit=15)
+    os.utime(tmp_path / f"{cache.key(pl, limit=15)}.automaton", (0, 0))
+    cache.get(pl[:300])
+    assert sorted(p.name for p in tmp_path.glob("*.automaton")) == sorted(
+        f"{cache.key(x)}.automaton" for x in (pl, pl[:300])
+    )
+    cache = AutomatonCache(tmp_path, max_bytes=0)
+    cache.get(pl[:100])
+    assert [p.name for p in tmp_path.glob("*.automaton")] == [
+        f"{cache.key(pl[:100])}.automaton"
+    ]
+
+    # Corrupted files are made again
+    path = tmp_path / f"{cache.key(pl[:100])}.automaton"
+    path.write_bytes(b"not an automaton")
+    atm3 = AutomatonCache(tmp_path).get(pl[:100])
+    assert [x for x in atm3.items()] == [x for x in make_automaton(pl[:100]).items()]
+
+    cache.clear()
+    assert list(tmp_path.glob("*")) == []
+
+
+def test_primer_pairs_sweep():
+    import random
+
+    import numpy as np
+    from Bio.Seq import reverse_complement
+    from pydna.primer_screen import amplicon_dtype
+
+    random.seed(1)
+    template = "".join(random.choice("acgt") for _ in range(3000))
+    primer_list = [None]
+    for _ in range(150):
+        start = random.randrange(len(template) - 30)
+        primer = template[start : start + random.randint(18, 30)]
+        if random.random() < 0.5:
+            primer = reverse_complement(primer)
+        primer_list.append(Primer(random.choice(["", "aattgg"]) + primer))
+
+    for circular in (False, True):
+        seq = Dseqrecord(template, circular=circular)
+        if circular:
+            # A pair of primers amplifying across the origin
+            primer_list.append(Primer(template[-40:-20]))
+            primer_list.append(Primer(reverse_complement(template[20:40])))
+        fps = {
+            i: p[0] for i, p in forward_primers(seq, primer_list).items() if len(p) == 1
+        }
+        rps = {
+            i: p[0] for i, p in reverse_primers(seq, primer_list).items() if len(p) == 1
+        }
+        for short, long in ((0, 10000), (500, 2000), (100, 300)):
+            expected = []
+            for fp, f in fps.items():
+                for rp, r in rps.items():
+                    size = len(primer_list[fp]) + r - f + len(primer_list[rp])
+                    if short <= size <= long and f <= r:
+                        expected.append(amplicon_tuple(fp, rp, f, r, size))
+            if circular:
+                for fp, f in fps.items():
+                    for rp, r in rps.items():
+                        size = len(primer_list[fp]) + r + len(seq) - f
+                        size += len(primer_list[rp])
+                        if f > r and short <= size <= long:
+                            expected.append(
+                                amplicon_tuple(fp, rp, f % len(seq), r % len(seq), size)
+                            )
+            result = primer_pairs(seq, primer_list, short=short, long=long)
+            assert result == expected
+            assert len(result) > 0
+            array = primer_pairs(
+                seq, primer_list, short=short, long=long, as_array=True
+            )
+            assert array.dtype == amplicon_dtype
+            assert [amplicon_tuple(*row) for row in array.tolist()] == expected
+
+    assert len(primer_pairs(seq, [None, Primer(template[:20])], as_array=True)) == 0
+    assert np.array_equal(
+        primer_pairs(seq, [None, Primer(template[:20])], as_array=True),
+        np.empty(0, dtype=amplicon_dtype),
+    )
+
+
+def test_screen_sequences():
+    from pydna.primer_screen import screen_sequences, binding_dtype
+
+    sequences = [wt, nat, kan, pIL68, pIL75]
+    atm = make_automaton(pl)
+    expected = []
+    for index, seq in enumerate(sequences):
+        for strand, func in ((1, forward_primers), (-1, reverse_primers)):
+            for primer, positions in func(seq, pl, automaton=atm).items():
+                expected.extend((index, primer, strand, pos) for pos in positions)
+    assert len(expected) > 0
+
+    result = screen_sequences(sequences, pl, automaton=atm)
+    assert result.dtype == binding_dtype
+    assert result.tolist() == expected
+
+    # Generators and small batches, with and without worker processes
+    for workers in (None, 2):
+        result = screen_sequences(
+            (s for s in sequences), pl, workers=workers, batch_size=2
+        )
+        assert result.tolist() == expected
+
+    assert len(screen_sequences([], pl)) == 0
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import json
+import os
+
+import pytest
+from Bio.Restriction import BamHI
+from Bio.SeqFeature import (
+    AfterPosition,
+    BeforePosition,
+    CompoundLocation,
+    SeqFeature,
+    SimpleLocation,
+)
+
+from pydna.dseqrecord import Dseqrecord
+from pydna.opencloning_models import CloningStrategy
+from pydna.parsers import iparse
+from pydna.readers import read
+from pydna.record_store import RecordStore, write_store
+
+test_files = os.path.join(os.path.dirname(__file__))
+
+
+def test_record_store(tmp_path):
+    records = list(
+        iparse([os.path.join(test_files, name) for name in ("pUC19.gb", "X60065.gb")])
+    )
+    fragment = Dseqrecord("aaggatccaa").cut(BamHI)[0]
+    fragment.name = "fragment"
+    fragment.features.append(
+        SeqFeature(
+            CompoundLocation(
+                [
+                    SimpleLocation(BeforePosition(0), 2, None),
+                    SimpleLocation(3, AfterPosition(5), -1),
+                ],
+                operator="order",
+            ),
+            type="misc",
+            qualifiers={"label": "x", "note": ["a", "b"], "object": object()},
+        )
+    )
+    fragment.letter_annotations["quality"] = list(range(len(fragment)))
+    records.append(fragment)
+
+    path = str(tmp_path / "records.pydna")
+    assert write_store(path, (record for record in records)) == 3
+
+    with RecordStore(path) as store:
+        assert len(store) == 3
+        assert store.names == [r.name for r in records]
+        assert store.seguids == [r.seq.seguid() for r in records]
+        for original, loaded in zip(records[:2], store):
+            assert loaded.format("gb") == original.format("gb")
+            assert loaded.seq._data == original.seq._data
+            assert loaded.circular == original.circular
+            assert loaded.source is None
+
+        # Qualifiers that can not be stored as JSON are left out
+        loaded = store["fragment"]
+        assert loaded.features[0].location == fragment.features[0].location
+        assert loaded.features[0].location.operator == "order"
+        assert loaded.features[0].qualifiers == {"label": "x", "note": ["a", "b"]}
+        assert loaded.letter_annotations == fragment.letter_annotations
+        assert store[-1].seq == fragment.seq
+
+        assert store.get(records[1].seq.seguid()).name == records[1].name
+        assert store.get("missing") is None
+        assert "fragment" in store and "missing" not in store
+        with pytest.raises(KeyError):
+            store["missing"]
+        with pytest.raises(IndexError):
+            store[3]
+
+        # Literature references are kept
+        assert len(store[0].annotations["references"]) == len(
+            records[0].annotations["references"]
+        )
+
+        source = CloningStrategy.model_validate_json(store.source_json(0))
+        assert source.sources[0].type == "UploadedFileSource"
+        assert json.loads(store.source_json("fragment"))["sources"]
+        assert store.source_json(1) is not None
+
+    with open(path, "wb") as f:
+        f.write(b"LOCUS")
+    with pytest.raises(ValueError):
+        RecordStore(path)
+
+
+def test_empty_record_store(tmp_path):
+    path = str(tmp_path / "records.pydna")
+    assert write_store(path, []) == 0
+    with RecordStore(path) as store:
+        assert len(store) == 0
+        assert list(store) == []
+
+    write_store(path, [read(os.path.join(test_files, "pAG25.gb"))])
+    with RecordStore(path) as store:
+        assert store[0].seq == read(os.path.join(test_files, "pAG25.gb")).seq
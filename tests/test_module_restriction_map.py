@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+import os
+
+import pytest
+from Bio.Restriction import (
+    AluBI,
+    BamHI,
+    BslFI,
+    Bst4CI,
+    CommOnly,
+    EcoRI,
+    NotI,
+    PstI,
+    RestrictionBatch,
+    SgeI,
+)
+
+from pydna.dseq import Dseq
+from pydna.dseqrecord import Dseqrecord
+from pydna.readers import read
+from pydna.restriction_map import RestrictionMap, digest_many, restriction_map
+
+test_files = os.path.join(os.path.dirname(__file__))
+
+
+def test_restriction_map():
+    seq = read(os.path.join(test_files, "pUC19.gb")).seq
+    rmap = RestrictionMap(seq)
+    assert rmap.enzymes == tuple(CommOnly)
+
+    assert rmap.search() == CommOnly.search(seq, linear=False)
+    assert rmap.search(linear=True) == CommOnly.search(seq)
+    assert set(rmap.cutters()) == {
+        e for e, cuts in CommOnly.search(seq).items() if cuts
+    }
+    assert set(rmap.no_cutters()) == set(seq.no_cutters())
+    assert set(rmap.unique_cutters()) == set(seq.unique_cutters())
+    assert set(rmap.once_cutters()) == set(seq.once_cutters())
+    assert set(rmap.twice_cutters()) == set(seq.twice_cutters())
+    assert set(rmap.n_cutters(3)) == set(seq.n_cutters(3))
+    assert rmap.number_of_cuts(EcoRI, BamHI) == 2
+    assert rmap.number_of_cuts() == sum(len(c) for c in CommOnly.search(seq).values())
+
+    assert rmap.get_cutsites(EcoRI, [PstI]) == seq.get_cutsites(EcoRI, PstI)
+    assert rmap.cut(EcoRI, PstI) == seq.cut(EcoRI, PstI)
+    assert rmap.get_cutsites() == seq.get_cutsites(CommOnly)
+    with pytest.raises(ValueError):
+        RestrictionMap(seq, [EcoRI]).get_cutsites(PstI)
+
+    # The map has its own sequence
+    assert rmap.seq == seq and rmap.seq is not seq
+    assert repr(rmap) == f"RestrictionMap({seq!r}, {len(CommOnly)} enzymes)"
+
+
+def test_restriction_map_cache():
+    seq = Dseq("GGATCCaaGAATTCaaGCGGCCGC", circular=True)
+    rmap = restriction_map(seq, [EcoRI, BamHI])
+    assert restriction_map(Dseq(str(seq), circular=True), [EcoRI, BamHI]) is rmap
+    assert restriction_map(Dseq(str(seq)), [EcoRI, BamHI]) is not rmap
+    # Rotations have the same seguid, but not the same cut positions
+    rotated = seq.shifted(3)
+    assert rotated.seguid() == seq.seguid()
+    assert restriction_map(rotated, [EcoRI, BamHI]) is not rmap
+    assert restriction_map(rotated, [EcoRI, BamHI]).get_cutsites() == [
+        ((6, -4), EcoRI),
+        ((22, -4), BamHI),
+    ]
+
+    record = Dseqrecord(seq)
+    assert record.number_of_cuts(EcoRI, BamHI, NotI) == 3
+    assert record.number_of_cuts(EcoRI, EcoRI) == 2
+    assert len(record.cut(EcoRI, BamHI)) == 2
+    assert len(record.linearize(NotI)) == len(seq) + 4
+
+
+def test_digest_many():
+    records = [
+        Dseqrecord("aaGAATTCaaGGATCCaa"),
+        Dseqrecord("ccccc"),
+        Dseqrecord("ttGAATTCtt", circular=True),
+    ]
+    expected = [tuple(record.cut(EcoRI, BamHI)) for record in records]
+    assert digest_many(records, [EcoRI, BamHI]) == expected
+    assert digest_many(iter(records), RestrictionBatch([EcoRI, BamHI])) == expected
+    result = digest_many(records, [EcoRI, BamHI], workers=2)
+    assert [[str(f.seq) for f in frags] for frags in result] == [
+        [str(f.seq) for f in frags] for frags in expected
+    ]
+    assert [[len(f) for f in frags] for frags in result] == [[7, 12, 7], [], [14]]
+    assert digest_many([], EcoRI, workers=2) == []
+
+
+def _all_pairs(seq, cutsites):
+    """Fragments of a partial digest made with apply_cut, for comparison."""
+    k = len(cutsites)
+    if seq.circular:
+        pairs = [
+            (cutsites[i], cutsites[(i + d) % k], d - 1)
+            for i in range(k)
+            for d in range(1, k + 1)
+        ]
+    else:
+        ends = [None, *cutsites, None]
+        pairs = [
+            (ends[i], ends[j], j - i - 1)
+            for i in range(k + 1)
+            for j in range(i + 1, k + 2)
+            if (i, j) != (0, k + 1)
+        ]
+    return [
+        (left, right, missed, seq.apply_cut(left, right))
+        for left, right, missed in pairs
+    ]
+
+
+def test_partial_digest():
+    puc = read(os.path.join(test_files, "pUC19.gb")).seq
+    enzymes = RestrictionBatch(["AatII", "BsaI", "EcoRI", "KpnI", "PstI", "PvuII"])
+    for seq in (puc, puc[10:], Dseq.from_full_sequence_and_overhangs(str(puc), 3, -2)):
+        rmap = RestrictionMap(seq, enzymes)
+        fragments = list(rmap.partial_digest())
+        assert all(f._seq is None for f in fragments)
+        expected = _all_pairs(seq, rmap.get_cutsites())
+        assert [(f.left_cut, f.right_cut, f.missed) for f in fragments] == [
+            e[:3] for e in expected
+        ]
+        assert [f.size for f in fragments] == [len(e[3]) for e in expected]
+        assert [f.seq for f in fragments] == [e[3] for e in expected]
+        assert [f.seq for f in rmap.partial_digest(max_missed=0)] == list(
+            seq.cut(enzymes)
+        )
+        selected = [
+            (f.left_cut, f.right_cut)
+            for f in rmap.partial_digest(min_size=500, max_size=1500, max_missed=2)
+        ]
+        assert selected == [
+            (f.left_cut, f.right_cut)
+            for f in fragments
+            if 500 <= f.size <= 1500 and f.missed <= 2
+        ]
+        assert [len(f) for f in seq.partial_digest(enzymes)] == [
+            f.size for f in fragments
+        ]
+
+    assert list(Dseq("aaaaaaaa").partial_digest(EcoRI)) == []
+    # A cut site found twice is only cut once
+    seq = Dseq("aaGAATTCaa")
+    rmap = RestrictionMap(seq, [EcoRI])
+    rmap._cutsites = rmap.get_cutsites() * 2
+    assert [f.size for f in rmap.partial_digest()] == [7, 7]
+
+    # Cut sites whose single stranded ends touch, with no double stranded base
+    # between them, do not make a fragment
+    seq = Dseq("ACGTTGCAAC" * 15, circular=True)
+    rmap = RestrictionMap(seq, [AluBI, BslFI, SgeI, Bst4CI])
+    rmap._cutsites = [
+        ((5, -4), BslFI),
+        ((5, 0), AluBI),
+        ((112, -4), SgeI),
+        ((117, 1), Bst4CI),
+    ]
+    fragments = list(rmap.partial_digest())
+    pairs = [(f.left_cut[1], f.right_cut[1]) for f in fragments]
+    assert (AluBI, BslFI) not in pairs and (BslFI, AluBI) not in pairs
+    assert (SgeI, Bst4CI) not in pairs and (Bst4CI, SgeI) in pairs
+    assert len(fragments) == 4 * 4 - 3
+    assert [f.size for f in fragments] == [len(f.seq) for f in fragments]
+
+    # On a linear sequence, cut makes a single stranded fragment between SgeI
+    # and AluBI, that is not a fragment of the partial digest
+    seq = Dseq("CGTCAATGTAATATGAAGAAGCCGTGTTTGCGAGCCTAGCTTTTGGTCCA")
+    enzymes = [SgeI, AluBI, BslFI]
+    rmap = RestrictionMap(seq, enzymes)
+    assert rmap.get_cutsites() == [
+        ((35, -4), SgeI),
+        ((39, 0), AluBI),
+        ((43, -4), SgeI),
+    ]
+    cut = seq.cut(enzymes)
+    assert [str(f) for f in cut] == [
+        "CGTCAATGTAATATGAAGAAGCCGTGTTTGCGAGCCTAG",
+        "CTAG",
+        "CTTTTGGT",
+        "TGGTCCA",
+    ]
+    fragments = list(rmap.partial_digest(max_missed=0))
+    assert [(f.left_cut, f.right_cut) for f in fragments] == [
+        (None, ((35, -4), SgeI)),
+        (((39, 0), AluBI), ((43, -4), SgeI)),
+        (((43, -4), SgeI), None),
+    ]
+    assert [f.seq for f in fragments] == [cut[0], cut[2], cut[3]]
+    assert [f.size for f in fragments] == [len(f.seq) for f in fragments]
+    assert (((35, -4), SgeI), ((43, -4), SgeI)) in [
+        (f.left_cut, f.right_cut) for f in rmap.partial_digest(max_missed=1)
+    ]
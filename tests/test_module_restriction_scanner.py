@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+import random
+
+import pytest
+from Bio.Restriction import AllEnzymes, BamHI, CommOnly, EcoRI, RestrictionBatch
+
+from pydna import restriction_scanner
+from pydna.crispr import cas9
+from pydna.dseq import Dseq
+from pydna.restriction_scanner import RestrictionScanner, get_scanner
+
+
+def _random_dseq(n, alphabet="ACGT"):
+    sequence = "".join(random.choice(alphabet) for _ in range(n))
+    return Dseq(sequence, circular=random.random() < 0.5)
+
+
+@pytest.mark.parametrize("max_sites_for_regex", [0, 10000])
+def test_same_as_biopython(monkeypatch, max_sites_for_regex):
+    # Both the regular expressions and the anchors
+    monkeypatch.setattr(
+        restriction_scanner, "_max_sites_for_regex", max_sites_for_regex
+    )
+    random.seed(0)
+    scanner = RestrictionScanner(AllEnzymes)
+    for _ in range(25):
+        n = random.choice([0, 1, 5, 12, 50, 400])
+        alphabet = random.choice(["ACGT", "acgtACGT", "ACGTN", "ACGTURYn"])
+        seq = _random_dseq(n, alphabet)
+        found = scanner.search(seq)
+        assert list(found) == list(scanner.enzymes)
+        for enzyme in AllEnzymes:
+            assert found[enzyme] == enzyme.search(seq, linear=not seq.circular)
+        assert scanner.search(seq, linear=True)[EcoRI] == EcoRI.search(seq)
+
+    with pytest.raises(TypeError):
+        scanner.search(Dseq("GAATTC!"))
+
+
+def test_get_cutsites():
+    random.seed(1)
+    enzymes = random.sample(sorted(e for e in CommOnly if e.ovhg is not None), 100)
+    for _ in range(20):
+        seq = _random_dseq(random.choice([10, 100, 300]), "GAATTCGGATCCGGTCTC")
+        if not seq.circular:
+            seq = Dseq.from_full_sequence_and_overhangs(str(seq), -2, 3)
+        # All enzymes at once give the same cuts as one at a time
+        cutsites = seq.get_cutsites(enzymes)
+        assert cutsites == sorted(c for e in enzymes for c in seq.get_cutsites(e))
+        for cutsite in cutsites:
+            assert cutsite in seq.get_cutsites(cutsite[1])
+
+    seq = Dseq.from_full_sequence_and_overhangs("GAATTCaaGAATTCaaGAATTC", -3, 0)
+    assert seq.get_cutsites(EcoRI) == [((9, -4), EcoRI), ((17, -4), EcoRI)]
+    assert seq.get_cutsites(RestrictionBatch([EcoRI, BamHI])) == seq.get_cutsites(
+        [EcoRI]
+    )
+
+
+def test_cutters():
+    seq = Dseq("GAATTCaaGGATCCaaGAATTC")
+    batch = RestrictionBatch([EcoRI, BamHI])
+    assert list(seq.cutters(batch)) == list(RestrictionBatch([EcoRI, BamHI]))
+    assert list(seq.unique_cutters(batch)) == [BamHI]
+    assert list(seq.twice_cutters(batch)) == [EcoRI]
+    assert seq.cutters() == RestrictionBatch(
+        [e for e, cuts in CommOnly.search(seq).items() if cuts]
+    )
+
+
+def test_get_scanner():
+    assert get_scanner([EcoRI, [BamHI, EcoRI]]) is get_scanner((EcoRI, BamHI))
+    assert get_scanner([EcoRI, BamHI]).enzymes == (EcoRI, BamHI)
+
+    # Objects that are not Biopython enzymes are searched with their own method
+    guide = "GTTACTTTACCCGACGTCCC"
+    seq = Dseq("A" * 10 + guide + "CGG" + "A" * 10)
+    enzyme = cas9(guide)
+    found = RestrictionScanner([EcoRI, enzyme]).search(seq)
+    assert found == {EcoRI: [], enzyme: enzyme.search(seq, linear=True)}
+    assert RestrictionScanner([enzyme]).search(seq) == {enzyme: [28]}
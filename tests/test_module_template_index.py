@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+import copy
+import random
+
+from pydna.dseq import Dseq
+from pydna.dseqrecord import Dseqrecord
+from pydna.primer import Primer
+from pydna.assembly2 import FragmentCache, primer_template_overlap
+from pydna.sequence_regex import compute_regex_site, dseqrecord_finditer
+from pydna.template_index import TemplateIndex
+
+
+def test_template_index():
+    index = TemplateIndex(Dseq("acgUacgt", circular=True))
+    assert index.text == "ACGTACGTACGTACGT"
+    assert index.has_u
+    assert index.find_all("ACGT") == [0, 4, 8, 12]
+    assert index.find_all("TAC") == [3, 7, 11]
+    assert index.find_all("") == []
+    assert TemplateIndex(Dseq("")).find_all("A") == []
+
+    # The index is not used anymore when the sequence changes
+    seq = Dseq("aagaattc")
+    index = seq.build_index()
+    assert seq.build_index() is index
+    assert copy.deepcopy(seq).template_index is index
+    assert seq.looped().template_index is None
+    seq.circular = True
+    assert seq.template_index is None
+    assert seq.build_index() is not index
+
+    record = Dseqrecord("aagaattc")
+    index = record.build_index()
+    assert FragmentCache(record).kmer_indices is index.kmer_indices
+    record.seq = Dseq("aagaattc")
+    assert record.seq.template_index is None
+
+
+def test_indexed_searches():
+    random.seed(0)
+    for trial in range(1000):
+        alphabet = "ACGTU" if trial % 5 == 0 else "acgtACGT"
+        text = "".join(random.choice(alphabet) for _ in range(random.randint(1, 40)))
+        circular = trial % 2 == 0
+        plain = Dseqrecord(text, circular=circular)
+        indexed = Dseqrecord(text, circular=circular)
+        indexed.build_index()
+        for _ in range(5):
+            start = random.randint(0, len(text))
+            if random.random() < 0.7:
+                sub = text[start : start + random.randint(0, 8)]
+            else:
+                sub = "".join(random.choice("acgtACGT") for _ in range(3))
+            end = random.randint(-3, len(text) + 3)
+            position = random.randint(0, len(text))
+            assert indexed.seq.find(sub, position, end) == plain.seq.find(
+                sub, position, end
+            )
+            assert indexed.seq.find(sub) == plain.seq.find(sub)
+            other = Dseqrecord(sub or "a")
+            assert indexed.find(other) == plain.find(other)
+
+            site = text[start : start + 8].upper()
+            if len(site) < 6 or random.random() < 0.5:
+                site = "".join(random.choice("ACGTNR") for _ in range(8))
+            pattern = compute_regex_site(site)
+            assert [m.span() for m in dseqrecord_finditer(pattern, indexed)] == [
+                m.span() for m in dseqrecord_finditer(pattern, plain)
+            ]
+
+
+def test_indexed_primer_template_overlap():
+    random.seed(1)
+    text = "".join(random.choice("ACGT") for _ in range(2000))
+    for circular in (True, False):
+        plain = Dseqrecord(text, circular=circular)
+        indexed = Dseqrecord(text, circular=circular)
+        indexed.build_index()
+        for start in (0, 500, 1990):
+            primer = Primer((text + text)[start : start + 25])
+            for mismatches in (0, 1):
+                assert primer_template_overlap(
+                    indexed, primer, 15, mismatches
+                ) == primer_template_overlap(plain, primer, 15, mismatches)
+        assert indexed.seq.template_index.kmer_indices
@@ -235,6 +235,40 @@ def test_smallest_rotation():
     assert sr("tttaaa") == "aaattt"
 
 
+def test_copy_feature():
+    from pydna.utils import copy_feature, shift_feature
+    from Bio.SeqFeature import SeqFeature, SimpleLocation
+
+    feature = SeqFeature(
+        SimpleLocation(2, 5, 1),
+        type="CDS",
+        id="f1",
+        qualifiers={"label": ["a", "b"], "nested": [["x"]], "note": "text"},
+    )
+    new = copy_feature(feature)
+    assert new is not feature
+    assert new.location == feature.location
+    assert new.location is not feature.location
+    assert (new.type, new.id) == ("CDS", "f1")
+    assert new.qualifiers == feature.qualifiers
+    new.qualifiers["label"].append("c")
+    new.qualifiers["nested"][0].append("y")
+    new.qualifiers["extra"] = ["z"]
+    assert feature.qualifiers == {
+        "label": ["a", "b"],
+        "nested": [["x"]],
+        "note": "text",
+    }
+
+    new = copy_feature(feature, SimpleLocation(0, 3, -1))
+    assert new.location == SimpleLocation(0, 3, -1)
+    assert feature.location == SimpleLocation(2, 5, 1)
+
+    shifted = shift_feature(feature, 2, 6)
+    assert shifted.location == SimpleLocation(4, 6, 1) + SimpleLocation(0, 1, 1)
+    assert shifted.qualifiers == feature.qualifiers
+
+
 def test_shift_location():
     from pydna.utils import shift_location
     from Bio.SeqFeature import SimpleLocation
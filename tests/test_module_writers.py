@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import copy
+import io
+import os
+
+from Bio import SeqIO
+from Bio.Restriction import BamHI
+from Bio.SeqFeature import (
+    AfterPosition,
+    BeforePosition,
+    CompoundLocation,
+    SeqFeature,
+    SimpleLocation,
+)
+
+from pydna.dseqrecord import Dseqrecord
+from pydna.parsers import parse
+from pydna.readers import read
+from pydna.writers import write_many, write_record
+
+test_files = os.path.join(os.path.dirname(__file__))
+
+
+def _biopython_text(record, format):
+    """The text written by the Biopython writers, as Dseqrecord.format did."""
+    record = copy.copy(record)
+    record.annotations = dict(record.annotations)
+    if format in ("gb", "genbank") and record.circular:
+        record.annotations["topology"] = "circular"
+    else:
+        record.annotations["topology"] = "linear"
+    handle = io.StringIO()
+    SeqIO.write(record, handle, format)
+    return handle.getvalue()
+
+
+def test_write_record():
+    record = Dseqrecord("acgt" * 40, circular=True, id="x", description="x some text")
+    record.add_feature(0, 30, label="short", note=["a " * 50, 'with "quote"'])
+    record.add_feature(5, 6, type_="bad type", strand=-1)
+    record.add_feature(10, 10)
+    record.features.append(
+        SeqFeature(
+            CompoundLocation([SimpleLocation(1, 3, 1), SimpleLocation(8, 20, 1)]),
+            type="CDS",
+            qualifiers={"codon_start": 1, "pseudo": None, "x" * 21: ["y"]},
+        )
+    )
+    record.features.append(
+        SeqFeature(
+            SimpleLocation(BeforePosition(3), AfterPosition(40), -1), type="gene"
+        )
+    )
+    records = [record, read(os.path.join(test_files, "pUC19.gb"))]
+    records.extend(parse(os.path.join(test_files, "RefDataBjorn.fas"))[:3])
+
+    for record in records:
+        for format in ("gb", "genbank", "fasta"):
+            handle = io.StringIO()
+            write_record(record, handle, format)
+            assert handle.getvalue() == _biopython_text(record, format)
+            assert handle.getvalue() == record.format(format) + "\n"
+
+    # The record is not changed
+    record = Dseqrecord("aaggatccaa").cut(BamHI)[0]
+    annotations = dict(record.annotations)
+    handle = io.StringIO()
+    write_record(record, handle, "fasta-dscode")
+    assert handle.getvalue() == ">id description\naagqfzj\n"
+    assert record.annotations == annotations
+    handle = io.StringIO()
+    write_record(record, handle, "embl")
+    assert handle.getvalue() == record.format("embl") + "\n"
+
+
+def test_write_many(tmp_path):
+    records = parse(os.path.join(test_files, "pth1.txt"))
+    path = str(tmp_path / "records.gb")
+    assert write_many(iter(records), path) == 2
+    with open(path, encoding="utf8") as f:
+        text = f.read()
+    assert text == "".join(record.format("gb") + "\n" for record in records)
+    assert [r.seguid() for r in parse(path)] == [r.seguid() for r in records]
+
+    handle = io.StringIO()
+    assert write_many(records, handle, "fasta") == 2
+    assert handle.getvalue() == "".join(
+        record.format("fasta") + "\n" for record in records
+    )